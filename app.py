@@ -3,12 +3,28 @@ Streamlit 프론트엔드
 KSAT Agent 사용자 인터페이스
 """
 import streamlit as st
-import requests
-import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import time
-import base64
-from pathlib import Path
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import assets
+from backend_client import BackendClient, BackendConnectionError, BackendError
+from bulk import BULK_DELETE, BULK_LABELS, BULK_RETAG, BulkJob, BulkRegistry
+from caches import OutputsListCache, ResultCache
+from compare import MAX_COMPARE, MIN_COMPARE, CompareCache
+from export import FORMAT_HTML, FORMAT_LABELS, ExportRegistry, available_formats, pdf_available
+from local_store import LocalStore, StoreSync
+from jobs import (
+    JOB_CANCELLED, JOB_COMPLETE, JOB_ERROR, JOB_QUEUED, JOB_RUNNING,
+    GenerationJob, JobRegistry, expand_batch_grid,
+)
+from progress_view import ProgressView
+from rendering import RenderCache, build_partial_content_html
+from result_model import GenerationResult, ResultValidationError
+from search_index import FIELD_LABELS
+from state_store import StateStore, open_state_store
+from timing import METRIC_TOTAL, TimingStats
 
 # 페이지 설정
 st.set_page_config(
@@ -17,158 +33,17 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# CSS 스타일 (viewer_streamlit.py와 동일하게 복원)
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Nanum+Myeongjo:wght@400;700;800&display=swap');
-    
-    .passage-font {
-        border: 0.5px solid black;
-        border-radius: 0px;
-        padding: 12px;
-        margin-bottom: 20px;
-        font-family: 'Nanum Myeongjo', serif !important;
-        font-size: 16.5px;
-        line-height: 1.7;
-        letter-spacing: -0.01em;
-        font-weight: 500;
-        background: #ffffff;
-        width: 12cm;
-        text-align: justify;
-        text-justify: inter-word;
-    }
-    
-    .passage-font p { 
-        margin: 0; 
-        text-indent: 1em; 
-        text-align: justify; 
-    }
-    
-    .passage-font .section-label { 
-        font-weight: 700; 
-        margin: 1em 0 0.5em 0; 
-        text-indent: 0; 
-    }
-    
-    .passage-font .section-label:first-of-type { 
-        margin-top: 0; 
-    }
-    
-    .q-material .passage-font { 
-        width: calc(12cm - 1em); 
-    }
-    
-    .question-font {
-        font-family: 'Nanum Myeongjo', serif !important;
-        line-height: 1.7em;
-        letter-spacing: -0.01em;
-        font-weight: 500;
-        margin-bottom: 1.5em;
-        width: 12cm;
-        text-align: justify;
-        text-justify: inter-word;
-    }
-    
-    .question-block { 
-        padding: 8px 6px; 
-    }
-    
-    .q-header { 
-        font-weight: 700; 
-        margin-bottom: 8px;
-        text-indent: -1em; 
-        padding-left: 1em;
-    }
-    
-    .q-material { 
-        margin: 8px 0; 
-        margin-left: 1em; 
-    }
-    
-    .q-choices { 
-        margin-top: 8px; 
-        margin-left: 1em; 
-    }
-    
-    .q-choices p { 
-        text-indent: -1em; 
-        padding-left: 1em; 
-        margin: 0.3em 0;
-    }
-    
-    .explanation-item {
-        text-indent: -1.5em;
-        padding-left: 1.5em;
-        margin: 0.3em 0;
-    }
-    
-    /* 지문+문항 통합 컨테이너 */
-    .content-wrapper {
-        width: 100%;
-        overflow-x: auto;
-    }
-    
-    .content-container {
-        display: flex;
-        gap: 20px;
-        width: calc(26cm + 20px);
-        min-width: calc(26cm + 20px);
-        margin: 0 auto;
-    }
-    
-    .passage-section {
-        width: 13cm;
-        min-width: 13cm;
-        max-width: 13cm;
-        flex-shrink: 0;
-        padding-right: 5px;
-        border-right: 2px solid #000000;
-    }
-    
-    .questions-section {
-        width: 13cm;
-        min-width: 13cm;
-        max-width: 13cm;
-        flex-shrink: 0;
-        padding-left: 5px;
-    }
-    
-    /* 해설 섹션 */
-    .explanation-section {
-        width: 100%;
-        max-width: 20cm;
-        margin: 0 auto;
-        padding: 20px;
-    }
-    
-    .explanation-item-block {
-        margin-bottom: 30px;
-    }
-    
-    .explanation-section .question-font {
-        width: 100%;
-        max-width: none;
-    }
-    
-    /* 스피너 애니메이션 */
-    @keyframes spin {
-        0% { transform: rotate(0deg); }
-        100% { transform: rotate(360deg); }
-    }
-    
-    .spinner {
-        display: inline-block;
-        width: 14px;
-        height: 14px;
-        border: 2px solid #f3f3f3;
-        border-top: 2px solid #1976d2;
-        border-radius: 50%;
-        animation: spin 0.8s linear infinite;
-        margin-right: 8px;
-        vertical-align: middle;
-    }
-</style>
-""", unsafe_allow_html=True)
+# CSS 스타일 (프로세스당 한 번 생성, 재실행 시에는 브라우저 메시지 캐시에 있는 같은 요소의 해시만 전송)
+st.markdown(assets.style_html(), unsafe_allow_html=True)
+
+
+@st.cache_resource
+def start_preload():
+    """첫 목록 표시에 필요한 pandas를 프로세스 시작 직후 백그라운드에서 import"""
+    return assets.preload_modules()
+
+
+start_preload()
 
 # 백엔드 API URL (Streamlit Secrets 사용, 없으면 로컬 기본값)
 try:
@@ -176,188 +51,394 @@ try:
 except Exception as e:
     BACKEND_URL = "http://localhost:8000"
 
+
+@st.cache_resource
+def get_backend_client() -> BackendClient:
+    """프로세스 전체에서 공유하는 백엔드 클라이언트 (keep-alive 커넥션 풀)"""
+    try:
+        timeouts = dict(st.secrets.get("BACKEND_TIMEOUTS", {}))
+    except Exception:
+        timeouts = {}
+    return BackendClient(BACKEND_URL or "http://localhost:8000", timeouts=timeouts)
+
+
+# (선택) 로컬 결과 저장소 경로 - 설정하면 백엔드 장애 시에도 저장된 결과 조회 가능
+try:
+    LOCAL_STORE_PATH = st.secrets.get("LOCAL_STORE_PATH")
+except Exception:
+    LOCAL_STORE_PATH = None
+
+
+@st.cache_resource
+def get_local_store() -> Optional[StoreSync]:
+    """모든 세션이 공유하는 로컬 저장소와 백그라운드 동기화 (설정하지 않으면 None)"""
+    if not LOCAL_STORE_PATH:
+        return None
+    sync = StoreSync(get_backend_client(), LocalStore(LOCAL_STORE_PATH), interval=60.0)
+    sync.start()
+    return sync
+
+
+# (선택) 공유 상태 저장소 경로 - 같은 호스트의 여러 프로세스가 같은 파일을 쓰면 작업 상태, 결과 문서, 세션 화면 상태를 공유
+try:
+    STATE_STORE_PATH = st.secrets.get("STATE_STORE_PATH")
+except Exception:
+    STATE_STORE_PATH = None
+
+
+@st.cache_resource
+def get_state_store() -> StateStore:
+    """모든 세션이 공유하는 상태 저장소 (설정하지 않으면 프로세스 내부 저장소)"""
+    return open_state_store(STATE_STORE_PATH)
+
+
+# 생성 옵션
+SUBFIELD_OPTIONS = {
+    "인문예술": ["동양철학", "서양철학", "논리학", "예술"],
+    "법": ["정치/제도/행정", "법규"],
+    "경제": ["경제현상", "제도/규제"],
+    "과학기술": ["과학/기술", "정보통신", "기계장치", "생명과학", "자연현상"]
+}
+FIELD_OPTIONS = list(SUBFIELD_OPTIONS)
+POINTS_OPTIONS = [
+    "자동",
+    "변수 간의 관계 이해하기",
+    "단계에 따른 구성요소의 역할과 상태 변화 추적하기",
+    "특성과 원리 이해하기",
+    "조건의 중첩과 예외 구조 파악하기",
+    "논리적 규칙 파악하기",
+    "공통점/차이점 파악하기"
+]
+QUESTION_TYPES = ['보기형', '추론형', '지시형', '동의형', '빈칸형', '내용일치형', '전개방식형', '어휘형']
+
+# 일괄 생성 제한
+MAX_BATCH_SIZE = 50
+MAX_BATCH_CONCURRENCY = 4
+
+# 작업 상태 표시 이름
+JOB_STATUS_LABELS = {
+    JOB_QUEUED: "대기",
+    JOB_RUNNING: "진행중",
+    JOB_COMPLETE: "완료",
+    JOB_ERROR: "오류",
+    JOB_CANCELLED: "취소",
+}
+
+# 진행 현황 갱신 간격 (초) - 이 사이의 SSE 이벤트는 한 번의 갱신으로 합쳐짐
+PROGRESS_FRAME_INTERVAL = 1.0
+
+# 전문 검색 결과 개수
+SEARCH_LIMIT = 20
+
+# 유사 결과 경고 (지문은 MinHash 추정 Jaccard, 주제는 문자 bigram Jaccard 기준)
+SIMILAR_PASSAGE_THRESHOLD = 0.6
+SIMILAR_SUBJECT_THRESHOLD = 0.5
+SIMILAR_LIMIT = 5
+
+# 저장된 결과 페이지 크기
+OUTPUTS_PAGE_SIZE = 50
+
+# 결과 뷰어 탭
+VIEWER_TABS = ["📄 지문 & 문항", "💡 해설"]
+
+# 결과 비교 보기
+COMPARE_SECTIONS = ["📄 지문", "📝 문항"]
+
+# 세션 화면 상태 (재접속 시 URL의 세션 ID로 복원) - 상태 저장소 namespace, 보관 기간(초), 저장할 항목
+STATE_SESSIONS = "sessions"
+SESSION_STATE_TTL = 24 * 60 * 60
+SESSION_VIEW_KEYS = ('selected_output_file', 'active_job_id', 'active_batch_id', 'compare_files')
+
+
+def fetch_outputs_page(query: tuple, etag: str = None):
+    """목록 캐시용 조회 함수 - query는 (offset, limit, 필터 항목 tuple)"""
+    offset, limit, filters = query
+    return get_backend_client().list_outputs_page(offset, limit, dict(filters), etag)
+
+
+@st.cache_resource
+def get_outputs_cache() -> OutputsListCache:
+    """모든 세션이 공유하는 저장된 결과 목록 캐시 (페이지/필터별)"""
+    return OutputsListCache(fetch_outputs_page, ttl=30.0, max_stale=300.0)
+
+
+@st.cache_resource
+def get_result_cache() -> ResultCache:
+    """모든 세션이 공유하는 결과 문서 LRU 캐시 (공유 상태 저장소가 있으면 레플리카 간 2차 캐시로 사용)"""
+    state = get_state_store()
+    return ResultCache(max_bytes=64 * 1024 * 1024, shared=state if state.shared else None)
+
+
+@st.cache_resource
+def get_render_cache() -> RenderCache:
+    """모든 세션이 공유하는 결과 HTML 캐시"""
+    return RenderCache(max_entries=32)
+
+
+@st.cache_resource
+def get_compare_cache() -> CompareCache:
+    """모든 세션이 공유하는 결과 비교 캐시 (결과 조합별 차이 HTML)"""
+    return CompareCache(max_entries=16)
+
+
+@st.cache_resource
+def get_fetch_executor() -> ThreadPoolExecutor:
+    """결과 문서 병렬 조회용 스레드 풀 (비교할 문서를 동시에 가져옴)"""
+    return ThreadPoolExecutor(max_workers=MAX_COMPARE, thread_name_prefix="fetch")
+
+
+@st.cache_resource
+def get_timing_stats() -> TimingStats:
+    """모든 세션이 공유하는 생성 소요 시간 통계"""
+    return TimingStats(max_runs=1000)
+
+
+@st.cache_resource
+def get_job_registry() -> JobRegistry:
+    """모든 세션이 공유하는 생성 작업 레지스트리 (백그라운드 워커)"""
+    outputs = get_outputs_cache()
+    results = get_result_cache()
+    store_sync = get_local_store()
+    
+    def on_complete(job: GenerationJob):
+        # 새 결과가 저장되었으므로 목록 캐시 무효화, 결과 문서는 바로 캐시
+        outputs.invalidate()
+        if job.filename:
+            results.put(job.filename, job.result)
+        if store_sync is not None:
+            store_sync.trigger()
+    
+    # 프로세스 내부 저장소면 작업 상태를 따로 기록할 필요 없음
+    state = get_state_store()
+    return JobRegistry(
+        get_backend_client(), max_workers=4, on_complete=on_complete, timing=get_timing_stats(),
+        state=state if state.shared else None,
+    )
+
+
+@st.cache_resource
+def get_export_registry() -> ExportRegistry:
+    """모든 세션이 공유하는 내보내기 작업 레지스트리 (백그라운드 워커)"""
+    client = get_backend_client()
+    results = get_result_cache()
+    store_sync = get_local_store()
+    
+    def load(filename: str) -> GenerationResult:
+        result = results.get(filename)
+        if result is None:
+            document = store_sync.store.get_document(filename) if store_sync is not None else None
+            if document is None:
+                document = client.get_output(filename)
+            result = GenerationResult.from_dict(document)
+            results.put(filename, result)
+        return result
+    
+    return ExportRegistry(load, get_render_cache().render, max_workers=2)
+
+
+@st.cache_resource
+def get_bulk_registry() -> BulkRegistry:
+    """모든 세션이 공유하는 일괄 작업 레지스트리 (삭제/분류 변경을 제한된 스레드 풀에서 병렬 실행)"""
+    client = get_backend_client()
+    outputs = get_outputs_cache()
+    results = get_result_cache()
+    comparisons = get_compare_cache()
+    store_sync = get_local_store()
+    
+    def delete(filename: str, params: Dict[str, Any]):
+        client.delete_output(filename)
+    
+    def retag(filename: str, params: Dict[str, Any]):
+        client.update_output(filename, {"field": params["field"]})
+    
+    def on_finish(job: BulkJob):
+        # 목록 캐시는 작업이 끝날 때 한 번만 무효화
+        outputs.invalidate()
+        succeeded = job.succeeded
+        if job.action == BULK_DELETE:
+            for filename in succeeded:
+                results.evict(filename)
+                comparisons.evict(filename)
+            if store_sync is not None:
+                store_sync.store.delete(succeeded)
+        elif store_sync is not None and succeeded:
+            store_sync.trigger()  # 바뀐 메타데이터를 로컬 저장소에 반영
+    
+    return BulkRegistry({BULK_DELETE: delete, BULK_RETAG: retag}, on_finish=on_finish, max_workers=8)
+
+
+def load_output(filename: str) -> GenerationResult:
+    """결과 조회 (캐시 → 로컬 저장소 → 백엔드 순, 가져온 문서는 한 번 검증하여 캐시에 저장)
+
+    형식이 잘못된 문서는 ResultValidationError (캐시에 넣지 않음)
+    """
+    result = result_cache.get(filename)
+    if result is None:
+        document = store_sync.store.get_document(filename) if store_sync is not None else None
+        if document is None:
+            document = backend.get_output(filename)
+        result = GenerationResult.from_dict(document)
+        result_cache.put(filename, result)
+    return result
+
+
+def load_outputs(filenames) -> list:
+    """결과 문서 여러 개를 병렬로 조회 (순서 유지)"""
+    return list(fetch_executor.map(load_output, filenames))
+
+
+@st.cache_data(max_entries=32)
+def search_outputs(query: str, index_version: int) -> list:
+    """로컬 저장소 전문 검색 (색인이 바뀌기 전까지 같은 검색어는 캐시 사용)"""
+    return store_sync.store.search(query, limit=SEARCH_LIMIT)
+
+
+@st.cache_data(max_entries=64, ttl=60)
+def find_similar_subjects(subject: str, index_version: int) -> list:
+    """주제가 비슷한 저장된 결과 (로컬 저장소가 없으면 백엔드 주제 필터로 같은 주제를 포함한 결과만 확인)"""
+    if store_sync is not None:
+        return store_sync.store.similar_subjects(subject, SIMILAR_SUBJECT_THRESHOLD, SIMILAR_LIMIT)
+    try:
+        page, _ = backend.list_outputs_page(0, SIMILAR_LIMIT, {"subject": subject})
+    except BackendError:
+        return []
+    return [{"주제": meta["주제"], "count": 1, "생성일자": meta["생성일자"]} for meta in page["files"]]
+
+
+@st.cache_data(max_entries=32)
+def find_similar_passages(filename: str, index_version: int, _result: GenerationResult) -> list:
+    """지문이 비슷한 저장된 결과 (결과 자신은 제외, 색인이 바뀌기 전까지 캐시 사용)"""
+    return store_sync.store.similar_passages(_result.raw, SIMILAR_PASSAGE_THRESHOLD, exclude=filename, limit=SIMILAR_LIMIT)
+
+
+@st.cache_data(max_entries=8)
+def build_outputs_frame(version, query: tuple, _page: dict):
+    """페이지별 표시용 DataFrame (목록이 바뀔 때만 재생성)"""
+    import pandas as pd
+    
+    # DataFrame 생성 (filename 제외)
+    df = pd.DataFrame(_page['files'])
+    display_df = df[['생성일자', '대분야', '주제', '문항 수']].copy()
+    
+    # 인덱스를 전체 목록 기준 번호(1부터)로 설정
+    display_df.index = range(_page['offset'] + 1, _page['offset'] + len(display_df) + 1)
+    return display_df
+
+
+def load_session_view() -> Dict[str, Any]:
+    """URL의 세션 ID로 저장된 화면 상태 조회 (없으면 새 세션 ID를 URL에 기록)"""
+    session_id = st.query_params.get("s")
+    view = None
+    if session_id:
+        try:
+            view = state_store.get(STATE_SESSIONS, session_id)
+        except Exception:
+            view = None
+    if view is None:
+        if not session_id:
+            session_id = uuid.uuid4().hex
+            st.query_params["s"] = session_id
+        view = {}
+    st.session_state.session_id = session_id
+    st.session_state.saved_view = view
+    return view
+
+
+def save_session_view():
+    """화면 상태가 바뀐 경우에만 저장 (다른 레플리카로 재접속해도 복원)"""
+    view = {key: st.session_state[key] for key in SESSION_VIEW_KEYS}
+    if view == st.session_state.saved_view:
+        return
+    try:
+        state_store.set(STATE_SESSIONS, st.session_state.session_id, view, ttl=SESSION_STATE_TTL)
+    except Exception:
+        return  # 저장소 장애 - 다음 실행에서 다시 시도
+    st.session_state.saved_view = view
+
+
+backend = get_backend_client()
+state_store = get_state_store()
+outputs_cache = get_outputs_cache()
+result_cache = get_result_cache()
+job_registry = get_job_registry()
+timing_stats = get_timing_stats()
+render_cache = get_render_cache()
+compare_cache = get_compare_cache()
+fetch_executor = get_fetch_executor()
+bulk_registry = get_bulk_registry()
+export_registry = get_export_registry()
+store_sync = get_local_store()
+
 # 세션 상태 초기화
+saved_view = st.session_state.saved_view if 'session_id' in st.session_state else load_session_view()
 if 'generated_result' not in st.session_state:
     st.session_state.generated_result = None
-if 'progress_tasks' not in st.session_state:
-    st.session_state.progress_tasks = []
+if 'active_job_id' not in st.session_state:
+    # 새로고침 등으로 재접속한 경우 URL의 작업 ID(또는 저장된 화면 상태)로 진행 중인 작업에 다시 연결
+    job_id = st.query_params.get("job") or saved_view.get('active_job_id')
+    st.session_state.active_job_id = job_id if job_registry.get(job_id) else None
+if 'active_batch_id' not in st.session_state:
+    batch_id = st.query_params.get("batch") or saved_view.get('active_batch_id')
+    st.session_state.active_batch_id = batch_id if job_registry.has_batch(batch_id) else None
 if 'is_generating' not in st.session_state:
     st.session_state.is_generating = False
 if 'selected_output_file' not in st.session_state:
+    # 재접속 시 보던 결과 다시 표시
     st.session_state.selected_output_file = None
+    if saved_view.get('selected_output_file'):
+        try:
+            st.session_state.generated_result = load_output(saved_view['selected_output_file'])
+            st.session_state.selected_output_file = saved_view['selected_output_file']
+        except (BackendError, ResultValidationError):
+            pass
+if 'export_job_id' not in st.session_state:
+    st.session_state.export_job_id = None
+if 'bulk_job_id' not in st.session_state:
+    st.session_state.bulk_job_id = None
+if 'compare_files' not in st.session_state:
+    st.session_state.compare_files = saved_view.get('compare_files')
+if 'outputs_page_index' not in st.session_state:
+    st.session_state.outputs_page_index = 0
+if 'outputs_filters' not in st.session_state:
+    st.session_state.outputs_filters = None
+if 'outputs_page' not in st.session_state:
+    st.session_state.outputs_page = None
 
 
-def init_progress_tasks(num_questions: int):
-    """진행 상황 태스크 초기화"""
-    tasks = [
-        {'label': '논리 구조 설계', 'status': 'pending'},
-        {'label': '지문 생성', 'status': 'pending'},
-    ]
+def render_questions_input(key_prefix: str) -> list:
+    """문항 구성 입력 위젯 (문항 개수 + 문항별 유형/스타일/정답)"""
+    num_questions = st.number_input("문항 개수", min_value=1, max_value=6, value=3, step=1, key=f"{key_prefix}_num_questions")
+    
+    questions_input = []
     for i in range(num_questions):
-        tasks.append({'label': f'{i+1}번 문항 생성', 'status': 'pending'})
-    st.session_state.progress_tasks = tasks
-
-def update_task_status(task_label: str, status: str):
-    """특정 태스크 상태 업데이트"""
-    for task in st.session_state.progress_tasks:
-        if task['label'] == task_label:
-            task['status'] = status
-            break
-
-
-def render_progress_panel():
-    """진행 상황 패널 렌더링 (Streamlit 네이티브 컴포넌트 사용)"""
-    # 헤더는 항상 표시
-    st.markdown("### 🔄 진행 현황")
-    st.markdown("> 문항 유형에 따라 생성 순서가 달라질 수 있습니다. 보기형 문항을 우선적으로 생성합니다.", unsafe_allow_html=True)
-
-    # progress_tasks가 있을 때만 내부 컨테이너에 진행 상황 표시
-    if st.session_state.get('progress_tasks'):
-        # 내부 컨테이너로 진행 상황 감싸기
-        with st.container():
-            # 전체 진행률 계산
-            total_tasks = len(st.session_state.progress_tasks)
-            completed_tasks = sum(1 for task in st.session_state.progress_tasks if task['status'] == 'complete')
-            in_progress_tasks = sum(1 for task in st.session_state.progress_tasks if task['status'] == 'in_progress')
-            progress_percentage = completed_tasks / total_tasks if total_tasks > 0 else 0
+        with st.expander(f"**{i+1}번 문항**", expanded=(i == 0)):
+            q_type = st.selectbox(
+                "문항 유형",
+                options=QUESTION_TYPES,
+                key=f"{key_prefix}_q_type_{i}"
+            )
             
-            # 전체 프로그레스 바
-            st.progress(progress_percentage, text=f"전체 진행률: {completed_tasks}/{total_tasks}")
+            q_style = st.radio(
+                "문항 스타일",
+                options=['긍정형', '부정형'],
+                key=f"{key_prefix}_q_style_{i}",
+                horizontal=True
+            )
             
-            # 각 태스크 상태 표시 (배지 스타일 + 스피너)
-            for idx, task in enumerate(st.session_state.progress_tasks):
-                status = task['status']
-                label = task['label']
-                
-                # 스피너 및 배지 스타일 정의
-                if status == 'pending':
-                    spinner_html = ''
-                    badge_html = '<span style="background-color: #e0e0e0; color: #666; padding: 2px 8px; border-radius: 10px; font-size: 0.85em; font-weight: 500;">대기</span>'
-                    text_style = 'font-size: 0.95em;'
-                elif status == 'in_progress':
-                    spinner_html = '<span class="spinner"></span>'
-                    badge_html = '<span style="background-color: #1976d2; color: white; padding: 2px 8px; border-radius: 10px; font-size: 0.85em; font-weight: 600;">진행중</span>'
-                    text_style = 'font-size: 0.95em; font-weight: 500;'
-                elif status == 'complete':
-                    spinner_html = ''
-                    badge_html = '<span style="background-color: #4caf50; color: white; padding: 2px 8px; border-radius: 10px; font-size: 0.85em; font-weight: 500;">완료</span>'
-                    text_style = 'font-size: 0.95em; color: #999;'
-                elif status == 'error':
-                    spinner_html = ''
-                    badge_html = '<span style="background-color: #f44336; color: white; padding: 2px 8px; border-radius: 10px; font-size: 0.85em; font-weight: 500;">❌ 오류</span>'
-                    text_style = 'font-size: 0.95em; color: #f44336;'
-                else:
-                    spinner_html = ''
-                    badge_html = ''
-                    text_style = 'font-size: 0.95em;'
-                
-                # 행 표시 (스피너 + 레이블 + 배지)
-                st.markdown(
-                    f'<div style="display: flex; justify-content: space-between; align-items: center; padding: 6px 0; '
-                    f'border-bottom: 1px solid #f0f0f0;">'
-                    f'<div style="display: flex; align-items: center;">'
-                    f'{spinner_html}'
-                    f'<span style="{text_style}">{label}</span>'
-                    f'</div>'
-                    f'{badge_html}'
-                    f'</div>',
-                    unsafe_allow_html=True
-                )
-    else:
-        # 생성 전에는 빈 메시지 표시
-        st.info("생성 버튼을 클릭하면 진행 상황이 표시됩니다.")
-
-
-def render_passage(passage_dict: dict):
-    """지문 렌더링 (viewer_streamlit.py와 동일)"""
-    import re
-    # passage_dict는 Passage 객체의 dict 형태
-    # 'passage', 'content', 'passage_text' 중 하나를 사용
-    text = passage_dict.get('passage', passage_dict.get('content', passage_dict.get('passage_text', '')))
-    
-    # (가), (나) 분리형 지문 처리
-    if re.search(r'^\s*\(가\)', text, re.MULTILINE):
-        parts = re.split(r'(\((?:가|나)\))', text)
-        html = ""
-        for part in parts:
-            part = part.strip()
-            if not part:
-                continue
-            if part in ['(가)', '(나)']:
-                html += f"<p class='section-label'>{part}</p>"
-            else:
-                paragraphs = [p.strip() for p in part.split("\n") if p.strip()]
-                html += "".join(f"<p>{p}</p>" for p in paragraphs)
-    else:
-        # 일반 지문
-        paragraphs = [p.strip() for p in text.split("\n") if p.strip()]
-        html = "".join(f"<p>{p}</p>" for p in paragraphs)
-    
-    st.markdown(f"<div class='passage-font'>{html}</div>", unsafe_allow_html=True)
-
-
-def render_questions(questions: list):
-    """문항 렌더링 (해설 제외)"""
-    questions_html = ""
-    for q in questions:
-        # 발문에서 '않은' 밑줄 처리
-        question_text = q.get('question', '')
-        question_text = question_text.replace('않은', '<u>않은</u>')
-        
-        # 문항 HTML 생성
-        questions_html += (
-            f"<div class='question-font question-block'>"
-            f"<div class='q-header'>{q.get('question_number')}. {question_text}</div>"
-            + (f"<div class='q-material'><div class='passage-font'>{q.get('material','')}</div></div>" if q.get('material') else "")
-            + (
-                "<div class='q-choices'>"
-                f"<p>① {q.get('choices_1','')}</p>"
-                f"<p>② {q.get('choices_2','')}</p>"
-                f"<p>③ {q.get('choices_3','')}</p>"
-                f"<p>④ {q.get('choices_4','')}</p>"
-                f"<p>⑤ {q.get('choices_5','')}</p>"
-                "</div>"
+            q_answer = st.selectbox(
+                "정답",
+                options=['①', '②', '③', '④', '⑤'],
+                key=f"{key_prefix}_q_answer_{i}"
             )
-            + "</div>"
-        )
-    
-    return questions_html
-
-
-def render_explanations(questions: list):
-    """해설 렌더링 - 모든 해설을 하나로 이어서 표시"""
-    # 모든 해설을 하나의 HTML 문자열로 구성
-    all_explanations_html = "<div class='explanation-section'>"
-    
-    for q in questions:
-        answer_symbol = q.get('answer', '①')
-        num_to_symbol = {1: '①', 2: '②', 3: '③', 4: '④', 5: '⑤'}
-        answer_num = {'①': 1, '②': 2, '③': 3, '④': 4, '⑤': 5}.get(answer_symbol, 1)
-        
-        # 각 문항 해설 구성
-        all_explanations_html += f"<div class='explanation-item-block'>"
-        all_explanations_html += f"<h4>{q.get('question_number')}번 문항</h4>"
-        all_explanations_html += f"<div class='question-font'>"
-        all_explanations_html += f"<strong>정답. {num_to_symbol[answer_num]}</strong><br/><br/>"
-        
-        # [정답 풀이]
-        correct_explanation = q.get(f'explanation_{answer_num}', '')
-        all_explanations_html += f"<strong>[정답 풀이]</strong><br/>"
-        all_explanations_html += f"{correct_explanation}<br/><br/>"
-        
-        # [오답 해설]
-        all_explanations_html += f"<strong>[오답 해설]</strong><br/>"
-        for i in range(1, 6):
-            if i != answer_num:
-                wrong_explanation = q.get(f'explanation_{i}', '')
-                all_explanations_html += f"<p class='explanation-item'>{num_to_symbol[i]} {wrong_explanation}</p>"
-        
-        all_explanations_html += "</div></div>"
-    
-    all_explanations_html += "</div>"
+            
+            questions_input.append({
+                "question_number": i + 1,
+                "question_type": q_type,
+                "question_style": q_style,
+                "answer": q_answer
+            })
     
-    # 한 번에 모든 해설 렌더링
-    st.markdown(all_explanations_html, unsafe_allow_html=True)
+    return questions_input
 
 
 @st.dialog("⚙️ 신규 생성 상세 설정", width="medium")
@@ -367,16 +448,9 @@ def show_generation_dialog():
     # 분야 선택
     st.markdown("#### 분야 선택")
     
-    subfield_options = {
-        "인문예술": ["동양철학", "서양철학", "논리학", "예술"],
-        "법": ["정치/제도/행정", "법규"],
-        "경제": ["경제현상", "제도/규제"],
-        "과학기술": ["과학/기술", "정보통신", "기계장치", "생명과학", "자연현상"]
-    }
-    
     field = st.selectbox(
         "분야",
-        options=["인문예술", "법", "경제", "과학기술"],
+        options=FIELD_OPTIONS,
         index=0,
         label_visibility="collapsed",
         key="dialog_field_select"
@@ -384,7 +458,7 @@ def show_generation_dialog():
     
     subfield = st.selectbox(
         "세부 분야",
-        options=subfield_options[field],
+        options=SUBFIELD_OPTIONS[field],
         index=0,
         label_visibility="collapsed",
         key="dialog_subfield_select"
@@ -423,25 +497,24 @@ def show_generation_dialog():
     )
     if subject_mode == "자동":
         subject = None
+    elif subject and subject.strip():
+        # 제출 전에 이미 저장된 비슷한 주제 안내
+        index_version = store_sync.store.index_version if store_sync is not None else 0
+        similar = find_similar_subjects(subject.strip(), index_version)
+        if similar:
+            st.warning(
+                "⚠️ 비슷한 주제로 저장된 결과가 있습니다.\n\n"
+                + "\n".join(f"- {item['주제']} ({item['count']}건, 최근 {item['생성일자']})" for item in similar)
+            )
     
     st.markdown("<br>", unsafe_allow_html=True)
     
     # 핵심 출제 포인트
     st.markdown("#### 핵심 출제 포인트")
     
-    points_options = [
-        "자동",
-        "변수 간의 관계 이해하기",
-        "단계에 따른 구성요소의 역할과 상태 변화 추적하기",
-        "특성과 원리 이해하기",
-        "조건의 중첩과 예외 구조 파악하기",
-        "논리적 규칙 파악하기",
-        "공통점/차이점 파악하기"
-    ]
-    
     points = st.selectbox(
         "핵심 출제 포인트",
-        options=points_options,
+        options=POINTS_OPTIONS,
         index=0,
         label_visibility="collapsed",
         key="dialog_points_select"
@@ -454,36 +527,7 @@ def show_generation_dialog():
     
     # 문항 구성
     st.markdown("#### 문항 구성")
-    num_questions = st.number_input("문항 개수", min_value=1, max_value=6, value=3, step=1, key="dialog_num_questions")
-    
-    questions_input = []
-    for i in range(num_questions):
-        with st.expander(f"**{i+1}번 문항**", expanded=(i == 0)):
-            q_type = st.selectbox(
-                "문항 유형",
-                options=['보기형', '추론형', '지시형', '동의형', '빈칸형', '내용일치형', '전개방식형', '어휘형'],
-                key=f"dialog_q_type_{i}"
-            )
-            
-            q_style = st.radio(
-                "문항 스타일",
-                options=['긍정형', '부정형'],
-                key=f"dialog_q_style_{i}",
-                horizontal=True
-            )
-            
-            q_answer = st.selectbox(
-                "정답",
-                options=['①', '②', '③', '④', '⑤'],
-                key=f"dialog_q_answer_{i}"
-            )
-            
-            questions_input.append({
-                "question_number": i + 1,
-                "question_type": q_type,
-                "question_style": q_style,
-                "answer": q_answer
-            })
+    questions_input = render_questions_input("dialog")
     
     # 생성 시작 버튼
     if st.button("🚀 생성 시작", width="stretch", type="primary", key="dialog_submit"):
@@ -497,100 +541,309 @@ def show_generation_dialog():
             "questions_input": questions_input
         }
         
-        # 진행 상황 초기화
-        num_questions = len(questions_input)
-        st.session_state.progress_tasks = [
-            {"label": "논리 구조 설계", "status": "pending"},
-            {"label": "지문 생성", "status": "pending"},
+        # 백그라운드 워커에 생성 작업 등록 (같은 설정으로 진행 중인 작업이 있으면 그 작업에 연결)
+        job_id = job_registry.submit(user_input_dict)
+        st.session_state.active_job_id = job_id
+        st.query_params["job"] = job_id
+        
+        # 다이얼로그 닫기
+        st.rerun()
+
+
+@st.dialog("📦 일괄 생성 설정", width="large")
+def show_batch_dialog():
+    """일괄 생성 설정 다이얼로그 (세부 분야 × 출제 포인트 조합)"""
+    
+    # 세부 분야 (복수 선택)
+    st.markdown("#### 세부 분야")
+    subfields = st.multiselect(
+        "세부 분야",
+        options=[(field, subfield) for field, subfields in SUBFIELD_OPTIONS.items() for subfield in subfields],
+        format_func=lambda option: f"{option[0]} / {option[1]}",
+        placeholder="생성할 세부 분야를 선택하세요",
+        label_visibility="collapsed",
+        key="batch_subfields"
+    )
+    
+    # 핵심 출제 포인트 (복수 선택, 비우면 자동)
+    st.markdown("#### 핵심 출제 포인트")
+    points_list = st.multiselect(
+        "핵심 출제 포인트",
+        options=POINTS_OPTIONS[1:],
+        placeholder="자동",
+        label_visibility="collapsed",
+        key="batch_points"
+    )
+    
+    # 유형 선택
+    st.markdown("#### 유형 선택")
+    type_input = st.radio(
+        "유형",
+        options=["단일형", "(가),(나) 분리형"],
+        index=0,
+        horizontal=True,
+        label_visibility="collapsed",
+        key="batch_type_input"
+    )
+    
+    # 문항 구성 (모든 세트에 동일하게 적용)
+    st.markdown("#### 문항 구성")
+    questions_input = render_questions_input("batch")
+    
+    # 동시 실행 수
+    st.markdown("#### 동시 실행 수")
+    concurrency = st.slider(
+        "동시 실행 수",
+        min_value=1,
+        max_value=MAX_BATCH_CONCURRENCY,
+        value=min(3, MAX_BATCH_CONCURRENCY),
+        label_visibility="collapsed",
+        key="batch_concurrency"
+    )
+    
+    user_inputs = expand_batch_grid(subfields, points_list, type_input, questions_input)
+    st.caption(f"총 {len(user_inputs)}세트 생성 (최대 {MAX_BATCH_SIZE}세트)")
+    
+    if st.button(
+        "🚀 일괄 생성 시작",
+        width="stretch",
+        type="primary",
+        key="batch_submit",
+        disabled=not user_inputs or len(user_inputs) > MAX_BATCH_SIZE
+    ):
+        batch_id = job_registry.submit_batch(user_inputs, concurrency=concurrency)
+        st.session_state.active_batch_id = batch_id
+        st.query_params["batch"] = batch_id
+        st.rerun()
+
+
+@st.fragment(run_every=PROGRESS_FRAME_INTERVAL)
+def render_active_job():
+    """진행 중인 생성 작업 표시 (프레임 간격마다 작업 레지스트리의 최신 상태 한 번만 반영)"""
+    job = job_registry.snapshot(st.session_state.active_job_id)
+    if job is None:
+        # 보관 기간이 지났거나 다른 서버 프로세스의 작업
+        clear_active_job()
+        st.rerun()
+    
+    with st.container(border=True):
+        # 작업별 진행 현황 뷰는 세션에 보관 (작업 상태가 바뀐 프레임에서만 바뀐 행을 다시 계산하고 패널 HTML을 다시 조립,
+        # 그 밖의 프레임은 캐시된 패널 요소 하나만 다시 보냄)
+        if st.session_state.get('progress_view_key') != job.job_id:
+            st.session_state.progress_view = ProgressView(len(job.progress))
+            st.session_state.progress_view_key = job.job_id
+        view = st.session_state.progress_view
+        view.update(job.progress, job.revision)
+        view.render()
+        
+        if job.status == JOB_COMPLETE:
+            st.session_state.generated_result = job.result
+            st.session_state.selected_output_file = job.filename
+            clear_active_job()
+            st.rerun()
+        elif job.status == JOB_ERROR:
+            st.error(f"❌ {job.error}")
+            if st.button("닫기", width="stretch", key="dismiss_job_error"):
+                clear_active_job()
+                st.rerun()
+        elif job.status == JOB_CANCELLED:
+            # 같은 작업에 연결된 다른 세션에서 취소한 경우
+            st.warning("생성이 취소되었습니다.")
+            if st.button("닫기", width="stretch", key="dismiss_job_cancelled"):
+                clear_active_job()
+                st.rerun()
+        elif st.button("⏹️ 생성 취소", width="stretch", key="cancel_job"):
+            # 스트림을 닫고 백엔드에도 중단 요청
+            job_registry.cancel(job.job_id)
+            clear_active_job()
+            st.rerun()
+
+
+@st.fragment(run_every=PROGRESS_FRAME_INTERVAL)
+def render_partial_result():
+    """생성 중인 작업의 부분 결과 표시 (카드 주제, 지문, 완성된 문항을 도착하는 대로)"""
+    job = job_registry.snapshot(st.session_state.active_job_id)
+    if job is None or job.status == JOB_COMPLETE:
+        return  # 완료 전환은 render_active_job에서 전체 재실행으로 처리
+    partial = job.partial
+    if not partial:
+        st.info("생성 중입니다. 소재 카드와 지문이 완성되는 대로 여기에 표시됩니다.")
+        return
+    
+    # 부분 결과가 바뀐 프레임에서만 HTML 재생성
+    key = (job.job_id, partial.revision)
+    if st.session_state.get('partial_html_key') != key:
+        num_questions = len(job.user_input.get('questions_input', []))
+        st.session_state.partial_html = build_partial_content_html(partial, num_questions)
+        st.session_state.partial_html_key = key
+    st.markdown(f"### {partial.subject or '생성 중인 지문'}")
+    st.markdown(st.session_state.partial_html, unsafe_allow_html=True)
+
+
+def clear_active_job():
+    """세션의 활성 작업 연결 해제"""
+    st.session_state.active_job_id = None
+    st.query_params.pop("job", None)
+
+
+def format_duration(seconds: float) -> str:
+    """초 단위 시간을 'N분 M초' 형태로 표시"""
+    seconds = int(seconds)
+    return f"{seconds // 60}분 {seconds % 60}초" if seconds >= 60 else f"{seconds}초"
+
+
+@st.fragment(run_every=2.0)
+def render_active_batch():
+    """진행 중인 일괄 생성 표시 (2초마다 작업 레지스트리에서 갱신)"""
+    summary = job_registry.batch_summary(st.session_state.active_batch_id)
+    if summary is None:
+        clear_active_batch()
+        st.rerun()
+    
+    with st.container(border=True):
+        st.markdown("### 📦 일괄 생성 현황")
+        counts = summary.counts
+        st.progress(
+            summary.done / summary.total if summary.total else 1.0,
+            text=f"완료 {counts[JOB_COMPLETE]} · 오류 {counts[JOB_ERROR]} · 취소 {counts[JOB_CANCELLED]} / 전체 {summary.total}"
+        )
+        eta_text = "계산 중" if summary.eta is None else format_duration(summary.eta)
+        st.caption(
+            f"진행중 {counts[JOB_RUNNING]} · 대기 {counts[JOB_QUEUED]} · "
+            f"처리량 {summary.throughput:.1f}세트/분 · 경과 {format_duration(summary.elapsed)} · 남은 시간 {eta_text}"
+        )
+        
+        rows = [
+            {
+                "세부 분야": job.user_input.get('subfield_input'),
+                "출제 포인트": job.user_input.get('points_input') or "자동",
+                "상태": JOB_STATUS_LABELS[job.status],
+                "진행": f"{job.completed_tasks}/{len(job.progress)}",
+            }
+            for job in summary.jobs
         ]
-        for i in range(num_questions):
-            st.session_state.progress_tasks.append({
-                "label": f"{i+1}번 문항 생성",
-                "status": "pending"
-            })
+        table_event = st.dataframe(
+            rows,
+            width="stretch",
+            height=250,
+            on_select="rerun",
+            selection_mode="multi-row",
+            key="batch_table"
+        )
+        selected_jobs = [summary.jobs[i] for i in table_event.selection.rows if i < len(summary.jobs)]
         
-        # 다이얼로그 내부에서 진행 상황 표시
-        with st.container(border=True):
-            # st.markdown("#### 🔄 진행 현황")
-            progress_container = st.empty()
+        col_view, col_cancel, col_close = st.columns(3, gap="small")
         
-        try:
-            # SSE 스트림 수신
-            with requests.post(
-                f"{BACKEND_URL}/api/generate/stream",
-                json={"user_input": user_input_dict},
-                stream=True,
-                timeout=600
-            ) as response:
-                for line in response.iter_lines():
-                    if line:
-                        line = line.decode('utf-8')
-                        if line.startswith('data: '):
-                            data = json.loads(line[6:])
-                            
-                            if data['type'] == 'progress':
-                                step = data['step']
-                                status = data['status']
-                                
-                                # 태스크 상태 업데이트
-                                if step == 'card':
-                                    label = '논리 구조 설계'
-                                elif step == 'passage':
-                                    label = '지문 생성'
-                                elif step == 'question':
-                                    q_num = data['question_number']
-                                    label = f'{q_num}번 문항 생성'
-                                
-                                if status == 'start':
-                                    for task in st.session_state.progress_tasks:
-                                        if task['status'] == 'in_progress':
-                                            task['status'] = 'complete'
-                                    for task in st.session_state.progress_tasks:
-                                        if task['label'] == label:
-                                            task['status'] = 'in_progress'
-                                            break
-                                elif status == 'complete':
-                                    for task in st.session_state.progress_tasks:
-                                        if task['label'] == label:
-                                            task['status'] = 'complete'
-                                            break
-                                
-                                # 진행 상황 표시
-                                with progress_container.container():
-                                    render_progress_panel()
-                            
-                            elif data['type'] == 'complete':
-                                st.session_state.generated_result = data['result']
-                                for task in st.session_state.progress_tasks:
-                                    task['status'] = 'complete'
-                                with progress_container.container():
-                                    render_progress_panel()
-                            
-                            elif data['type'] == 'error':
-                                # 진행 중이던 태스크를 error 상태로 변경
-                                for task in st.session_state.progress_tasks:
-                                    if task['status'] == 'in_progress':
-                                        task['status'] = 'error'
-                                
-                                with progress_container.container():
-                                    render_progress_panel()
-                                
-                                # 에러 메시지 표시
-                                st.error(f"❌ {data['message']}")
+        with col_view:
+            viewable = len(selected_jobs) == 1 and selected_jobs[0].status == JOB_COMPLETE
+            if st.button("결과 보기", width="stretch", disabled=not viewable, key="batch_view"):
+                st.session_state.generated_result = selected_jobs[0].result
+                st.session_state.selected_output_file = selected_jobs[0].filename
+                st.rerun(scope="app")
         
-        except Exception as e:
-            st.error(f"백엔드 서버와 연결할 수 없습니다: {str(e)}")
+        with col_cancel:
+            if selected_jobs:
+                if st.button("선택 취소", width="stretch", key="batch_cancel_selected"):
+                    for job in selected_jobs:
+                        job_registry.cancel(job.job_id)
+                    st.rerun(scope="fragment")
+            elif st.button("전체 취소", width="stretch", disabled=summary.is_done, key="batch_cancel_all"):
+                job_registry.cancel_batch(summary.batch_id)
+                st.rerun(scope="fragment")
         
-        # 완료 후 다이얼로그 닫기
+        with col_close:
+            if st.button("닫기", width="stretch", disabled=not summary.is_done, key="batch_close"):
+                clear_active_batch()
+                st.rerun()
+
+
+def clear_active_batch():
+    """세션의 활성 일괄 생성 연결 해제"""
+    st.session_state.active_batch_id = None
+    st.query_params.pop("batch", None)
+
+
+@st.dialog("📤 내보내기", width="small")
+def show_export_dialog(entries: list):
+    """내보내기 형식 선택 후 백그라운드 작업 등록 (entries: (파일 이름, 결과 또는 None) 목록)"""
+    st.caption(f"선택한 결과 {len(entries)}개")
+    formats = st.multiselect(
+        "형식",
+        options=available_formats(),
+        default=[FORMAT_HTML],
+        format_func=FORMAT_LABELS.get,
+    )
+    if not pdf_available():
+        st.caption("PDF 내보내기는 서버에 weasyprint가 설치된 경우에만 사용할 수 있습니다. HTML 파일을 브라우저에서 인쇄해도 됩니다.")
+    bundle = False
+    if len(entries) > 1:
+        bundle = st.checkbox("한 파일로 합치기 (합본)", help="세트마다 새 페이지로 시작하는 하나의 문서로 내보냅니다.")
+    
+    if st.button("내보내기 시작", width="stretch", type="primary", disabled=not formats):
+        if st.session_state.export_job_id:
+            export_registry.discard(st.session_state.export_job_id)
+        st.session_state.export_job_id = export_registry.submit(entries, formats, bundle=bundle)
         st.rerun()
 
 
-@st.dialog("파일 삭제 확인", width="small")
-def show_delete_confirmation_dialog():
-    """삭제 확인 다이얼로그"""
-    filename = st.session_state.get('file_to_delete', '')
+@st.fragment(run_every=1.0)
+def render_export_progress():
+    """내보내기 진행 상황 (1초마다 이 영역만 갱신, 끝나면 전체 재실행하여 다운로드 표시)"""
+    job = export_registry.get(st.session_state.export_job_id)
+    if job is None or job.is_done:
+        st.rerun()
     
-    st.warning("삭제 후에는 복구가 불가능합니다. 정말 삭제하시겠습니까?")
+    with st.container(border=True):
+        st.markdown("#### 📤 내보내기")
+        st.progress(job.done / job.total if job.total else 0, text=f"내보내는 중: {job.done}/{job.total}")
+        if st.button("취소", width="stretch", key="export_cancel"):
+            export_registry.cancel(job.job_id)
+
+
+def render_export_result(job):
+    """완료된 내보내기 결과 (다운로드 / 오류 표시)"""
+    with st.container(border=True):
+        st.markdown("#### 📤 내보내기")
+        if job.status == JOB_COMPLETE:
+            if job.errors:
+                st.warning(f"{len(job.errors)}개 결과를 내보내지 못했습니다. (errors.txt 참고)")
+            # 파일 내용은 작업마다 한 번만 읽어 세션에 보관 (재실행마다 파일 전체를 다시 읽지 않음)
+            if st.session_state.get('export_data_key') != job.job_id:
+                st.session_state.export_data = export_registry.read(job.job_id)
+                st.session_state.export_data_key = job.job_id
+            data = st.session_state.export_data
+            if data is not None:
+                st.download_button(
+                    f"⬇️ {job.download_name}",
+                    data,
+                    file_name=job.download_name,
+                    mime=job.mime,
+                    width="stretch",
+                    type="primary",
+                    on_click="ignore",
+                )
+        elif job.status == JOB_ERROR:
+            st.error(f"내보내기 실패: {job.error}")
+        else:
+            st.info("내보내기가 취소되었습니다.")
+        
+        if st.button("닫기", width="stretch", key="export_close"):
+            export_registry.discard(job.job_id)
+            clear_export_job()
+            st.rerun()
+
+
+def clear_export_job():
+    """세션의 내보내기 작업 연결 해제 (보관 중인 파일 내용도 해제)"""
+    st.session_state.export_job_id = None
+    st.session_state.pop('export_data', None)
+    st.session_state.pop('export_data_key', None)
+
+
+@st.dialog("파일 삭제 확인", width="small")
+def show_delete_confirmation_dialog(filenames: list):
+    """삭제 확인 다이얼로그 (선택한 파일을 일괄 작업으로 삭제)"""
+    st.warning(f"선택한 결과 {len(filenames)}개를 삭제합니다. 삭제 후에는 복구가 불가능합니다. 정말 삭제하시겠습니까?")
     
     col1, col2 = st.columns(2)
     
@@ -601,38 +854,363 @@ def show_delete_confirmation_dialog():
         delete_clicked = st.button("삭제", width="stretch", type="primary")
     
     if cancel_clicked:
-        st.session_state.file_to_delete = None
         st.rerun()
     
     if delete_clicked:
+        submit_bulk_job(BULK_DELETE, filenames)
+        st.rerun()
+
+
+@st.dialog("🏷️ 분류 변경", width="small")
+def show_retag_dialog(filenames: list):
+    """선택한 결과의 대분야 변경 (일괄 작업)"""
+    st.caption(f"선택한 결과 {len(filenames)}개")
+    field = st.selectbox("대분야", options=FIELD_OPTIONS, key="dialog_retag_field")
+    
+    if st.button("변경", width="stretch", type="primary"):
+        submit_bulk_job(BULK_RETAG, filenames, {"field": field})
+        st.rerun()
+
+
+def submit_bulk_job(action: str, filenames: list, params: Optional[Dict[str, Any]] = None):
+    """일괄 작업 등록 (이전 작업 결과는 정리)"""
+    if st.session_state.bulk_job_id:
+        bulk_registry.discard(st.session_state.bulk_job_id)
+    st.session_state.bulk_job_id = bulk_registry.submit(action, filenames, params)
+
+
+@st.fragment(run_every=1.0)
+def render_bulk_progress():
+    """일괄 작업 진행 상황 (1초마다 이 영역만 갱신, 끝나면 전체 재실행하여 목록과 결과 표시)"""
+    job = bulk_registry.get(st.session_state.bulk_job_id)
+    if job is None or job.is_done:
+        st.rerun()
+    
+    with st.container(border=True):
+        st.markdown(f"#### 🗂️ 일괄 {BULK_LABELS[job.action]}")
+        st.progress(job.done / job.total if job.total else 0, text=f"처리 중: {job.done}/{job.total}")
+        if st.button("취소", width="stretch", key="bulk_cancel"):
+            bulk_registry.cancel(job.job_id)
+
+
+def render_bulk_result(job: BulkJob):
+    """완료된 일괄 작업 결과 (항목별 실패 표시)"""
+    if job.action == BULK_DELETE:
+        # 보고 있던 결과나 비교 중인 결과가 삭제되었으면 화면에서 내림
+        deleted = set(job.succeeded)
+        if st.session_state.selected_output_file in deleted:
+            st.session_state.generated_result = None
+            st.session_state.selected_output_file = None
+        if deleted.intersection(st.session_state.compare_files or ()):
+            st.session_state.compare_files = None
+    
+    with st.container(border=True):
+        st.markdown(f"#### 🗂️ 일괄 {BULK_LABELS[job.action]}")
+        failed = job.failed
+        if job.succeeded:
+            st.success(f"{len(job.succeeded)}개 {BULK_LABELS[job.action]} 완료")
+        if failed:
+            st.warning(f"{len(failed)}개 항목을 처리하지 못했습니다.")
+            with st.expander("실패한 항목", expanded=False):
+                st.markdown("\n".join(f"- `{filename}`: {error}" for filename, error in failed.items()))
+        
+        if st.button("닫기", width="stretch", key="bulk_close"):
+            bulk_registry.discard(job.job_id)
+            st.session_state.bulk_job_id = None
+            st.rerun()
+
+
+@st.fragment
+def render_outputs_panel():
+    """저장된 결과 패널 - 필터, 표 선택, 페이지 이동은 이 영역만 다시 실행
+
+    결과 불러오기/삭제, 생성 시작처럼 뷰어나 진행 현황에 영향을 주는 동작만 전체 재실행
+    """
+    with st.container(border=True, height=650):
+        st.markdown("#### 📁 저장된 결과")
+        
+        # 필터 (백엔드에서 적용)
+        with st.expander("🔎 필터", expanded=False):
+            filter_field = st.selectbox("대분야", options=["전체"] + FIELD_OPTIONS, key="outputs_filter_field")
+            filter_dates = st.date_input("생성일자", value=[], key="outputs_filter_dates")
+            filter_subject = st.text_input("주제", placeholder="주제 검색", key="outputs_filter_subject")
+        
+        filters = (
+            ("field", "" if filter_field == "전체" else filter_field),
+            ("subject", filter_subject.strip()),
+            ("date_from", filter_dates[0].isoformat() if len(filter_dates) > 0 else ""),
+            ("date_to", filter_dates[1].isoformat() if len(filter_dates) > 1 else ""),
+        )
+        # 필터가 바뀌면 첫 페이지로 이동
+        if st.session_state.outputs_filters != filters:
+            st.session_state.outputs_filters = filters
+            st.session_state.outputs_page_index = 0
+        
+        # 백엔드 API로부터 현재 페이지 목록 가져오기 (현재 페이지만 세션에 보관)
+        query = (st.session_state.outputs_page_index * OUTPUTS_PAGE_SIZE, OUTPUTS_PAGE_SIZE, filters)
+        st.session_state.outputs_page = None
+        offline = False
         try:
-            # 백엔드 API로 파일 삭제
-            delete_response = requests.delete(
-                f"{BACKEND_URL}/api/outputs/{filename}",
-                timeout=5
+            st.session_state.outputs_page = outputs_cache.get(query)
+        except BackendConnectionError:
+            if store_sync is not None:
+                # 백엔드 장애 시 로컬 저장소에서 조회
+                st.session_state.outputs_page = store_sync.store.query_page(query[0], query[1], dict(filters))
+                offline = True
+                last_sync = time.strftime("%m-%d %H:%M", time.localtime(store_sync.last_sync_at)) if store_sync.last_sync_at else "없음"
+                st.caption(f"📴 오프라인: 로컬 저장소의 결과를 표시합니다. (마지막 동기화: {last_sync})")
+            else:
+                st.warning("백엔드 서버와 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.")
+        except BackendError as e:
+            st.error(f"파일 목록 조회 실패: {str(e)}")
+        
+        page = st.session_state.outputs_page
+        if page and page['files']:
+            files_metadata = page['files']
+            # 오프라인(로컬 저장소) 페이지는 백엔드 목록 버전과 별도로 캐시
+            frame_version = outputs_cache.version if not offline else ("local", tuple(f['filename'] for f in files_metadata))
+            display_df = build_outputs_frame(frame_version, query, page)
+            
+            # 데이터 테이블 표시 (행 클릭으로 선택)
+            table_event = st.dataframe(
+                display_df,
+                width="stretch",
+                hide_index=False,
+                height=330,
+                on_select="rerun",
+                selection_mode="multi-row",
+                key="outputs_table"
             )
-            if delete_response.status_code == 200:
-                st.success("삭제 완료!")
-                # 현재 불러온 결과가 삭제된 파일이면 초기화
-                if st.session_state.get('generated_result'):
-                    st.session_state.generated_result = None
-                st.session_state.file_to_delete = None
-                time.sleep(0.5)  # 성공 메시지 표시 시간
-                st.rerun()
+            selected_rows = [i for i in table_event.selection.rows if i < len(files_metadata)]
+            selected_files = [files_metadata[i]['filename'] for i in selected_rows]
+            # 불러오기는 하나만 선택했을 때, 비교는 2~4개, 내보내기/분류 변경/삭제는 여러 개 가능
+            selected_file = selected_files[0] if len(selected_files) == 1 else None
+            
+            # 페이지 이동
+            total_pages = max(1, -(-page['total'] // OUTPUTS_PAGE_SIZE))
+            col_prev, col_page, col_next = st.columns([1, 2, 1], gap="small")
+            
+            with col_prev:
+                if st.button("◀", width="stretch", disabled=st.session_state.outputs_page_index == 0, key="outputs_prev"):
+                    st.session_state.outputs_page_index -= 1
+                    st.rerun(scope="fragment")
+            
+            with col_page:
+                st.caption(f"{st.session_state.outputs_page_index + 1} / {total_pages} 페이지 (총 {page['total']}개)")
+            
+            with col_next:
+                if st.button("▶", width="stretch", disabled=st.session_state.outputs_page_index + 1 >= total_pages, key="outputs_next"):
+                    st.session_state.outputs_page_index += 1
+                    st.rerun(scope="fragment")
+            
+            col_load, col_compare, col_export = st.columns(3, gap="small")
+            
+            with col_load:
+                if st.button("불러오기", width="stretch", disabled=selected_file is None):
+                    try:
+                        # 캐시 또는 백엔드 API로부터 파일 내용 가져오기
+                        loaded_data = load_output(selected_file)
+                    except (BackendError, ResultValidationError) as e:
+                        st.error(f"파일 불러오기 실패: {str(e)}")
+                    else:
+                        st.session_state.generated_result = loaded_data
+                        st.session_state.selected_output_file = selected_file
+                        st.session_state.compare_files = None
+                        st.success(f"✅ 불러오기 완료!")
+                        st.rerun()
+            
+            with col_compare:
+                if st.button(
+                    "비교",
+                    width="stretch",
+                    disabled=not MIN_COMPARE <= len(selected_files) <= MAX_COMPARE,
+                    key="outputs_compare",
+                    help=f"{MIN_COMPARE}~{MAX_COMPARE}개를 선택해 나란히 비교",
+                ):
+                    st.session_state.compare_files = selected_files
+                    st.session_state.pop("compare_base", None)
+                    st.rerun()
+            
+            with col_export:
+                if st.button("내보내기", width="stretch", disabled=not selected_files, key="outputs_export"):
+                    show_export_dialog([(filename, None) for filename in selected_files])
+            
+            # 일괄 작업 (진행 중인 일괄 작업이 있으면 비활성화)
+            bulk_job = bulk_registry.get(st.session_state.bulk_job_id)
+            bulk_running = bulk_job is not None and not bulk_job.is_done
+            col_retag, col_delete = st.columns(2, gap="small")
+            
+            with col_retag:
+                if st.button("분류 변경", width="stretch", disabled=not selected_files or bulk_running, key="outputs_retag"):
+                    show_retag_dialog(selected_files)
+            
+            with col_delete:
+                if st.button(
+                    "삭제", width="stretch", type="secondary", disabled=not selected_files or bulk_running, key="outputs_delete"
+                ):
+                    show_delete_confirmation_dialog(selected_files)
+        elif page is not None:
+            if page['total'] and st.session_state.outputs_page_index > 0:
+                # 삭제 등으로 현재 페이지가 비었으면 이전 페이지로
+                st.session_state.outputs_page_index -= 1
+                st.rerun(scope="fragment")
+            st.info("저장된 결과 파일이 없습니다.")
+        
+        # 신규 생성 / 일괄 생성 버튼 (패널 맨 아래, 생성 중에는 비활성화)
+        col_new, col_batch = st.columns([2, 1], gap="small")
+        
+        with col_new:
+            if st.button(
+                "➕ 신규 생성",
+                width="stretch",
+                type="primary",
+                key="open_dialog",
+                disabled=st.session_state.active_job_id is not None
+            ):
+                show_generation_dialog()  # 다이얼로그 직접 호출
+        
+        with col_batch:
+            if st.button(
+                "📦 일괄 생성",
+                width="stretch",
+                key="open_batch_dialog",
+                disabled=st.session_state.active_batch_id is not None
+            ):
+                show_batch_dialog()
+
+
+@st.fragment
+def render_search_panel():
+    """전문 검색 (검색어 입력은 이 영역만 다시 실행, 불러오기는 전체 재실행)"""
+    with st.expander("🔍 전문 검색", expanded=False):
+        if store_sync is None:
+            st.caption("전문 검색은 로컬 결과 저장소(LOCAL_STORE_PATH)를 설정한 경우에 사용할 수 있습니다.")
+        else:
+            search_query = st.text_input(
+                "검색어",
+                placeholder="지문, 발문, 선지, 해설에서 검색 (두 글자 이상)",
+                key="search_query"
+            ).strip()
+            if search_query:
+                hits = search_outputs(search_query, store_sync.store.index_version)
+                st.caption(f"검색 결과 {len(hits)}건" + (f" (상위 {SEARCH_LIMIT}개)" if len(hits) == SEARCH_LIMIT else ""))
+                for hit in hits:
+                    col_hit, col_hit_load = st.columns([4, 1], gap="small", vertical_alignment="center")
+                    with col_hit:
+                        st.markdown(
+                            f"**{hit['주제']}** · {hit['생성일자']} · {hit['대분야']} · {FIELD_LABELS[hit['field']]}<br>"
+                            f"<span style='font-size: 0.9em; color: #555;'>{hit['snippet']}</span>",
+                            unsafe_allow_html=True
+                        )
+                    with col_hit_load:
+                        if st.button("불러오기", width="stretch", key=f"search_load_{hit['filename']}"):
+                            try:
+                                loaded_data = load_output(hit['filename'])
+                            except (BackendError, ResultValidationError) as e:
+                                st.error(f"파일 불러오기 실패: {str(e)}")
+                            else:
+                                st.session_state.generated_result = loaded_data
+                                st.session_state.selected_output_file = hit['filename']
+                                st.session_state.compare_files = None
+                                st.rerun()
+
+
+@st.fragment
+def render_viewer():
+    """결과 뷰어 (generated_result, selected_output_file이 바뀌는 곳에서 전체 재실행, 뷰어 안의 동작은 이 영역만)"""
+    if not st.session_state.generated_result:
+        st.info("좌측 패널에서 결과물을 선택하거나, 신규 생성 버튼을 클릭하세요. 지문과 문항이 표시되는 부분입니다.")
+        return
+    
+    # 결과별 HTML은 한 번만 생성 (관련 없는 위젯으로 인한 재실행에서는 캐시 사용)
+    rendered = render_cache.render(st.session_state.generated_result)
+    
+    # 주제 헤더 표시 + 내보내기
+    col_subject, col_export_one = st.columns([5, 1], gap="small", vertical_alignment="center")
+    with col_subject:
+        st.markdown(f"### {rendered.subject}")
+    with col_export_one:
+        if st.button("📤 내보내기", width="stretch", key="viewer_export"):
+            show_export_dialog([(st.session_state.selected_output_file, st.session_state.generated_result)])
+    
+    # 저장된 결과 중 지문이 거의 같은 결과 경고 (생성 직후 포함)
+    if store_sync is not None and st.session_state.selected_output_file:
+        similar = find_similar_passages(
+            st.session_state.selected_output_file, store_sync.store.index_version, st.session_state.generated_result
+        )
+        if similar:
+            st.warning(
+                "⚠️ 지문이 비슷한 저장된 결과가 있습니다.\n\n"
+                + "\n".join(
+                    f"- {item['주제']} ({item['생성일자']}, 유사도 {item['similarity']:.0%})" for item in similar
+                )
+            )
+    
+    # 탭 선택 (선택된 탭의 내용만 생성/전송, st.tabs는 모든 탭 내용을 매번 보냄)
+    tab = st.radio("보기", VIEWER_TABS, horizontal=True, key="viewer_tab", label_visibility="collapsed")
+    
+    if tab == VIEWER_TABS[1]:
+        # 해설 표시 (문항별로 접을 수 있게 나누어 표시)
+        for i, (title, chunk_html) in enumerate(rendered.explanation_chunks):
+            with st.expander(title, expanded=i == 0):
+                st.markdown(chunk_html, unsafe_allow_html=True)
+    else:
+        # 지문+문항 통합 HTML
+        st.markdown(rendered.content_html, unsafe_allow_html=True)
+
+
+@st.fragment
+def render_compare_view():
+    """결과 비교 (기준 결과, 지문/문항 전환은 이 영역만 다시 실행, 비교는 결과 조합별로 한 번만 계산)"""
+    filenames = st.session_state.compare_files
+    
+    col_title, col_close = st.columns([5, 1], gap="small", vertical_alignment="center")
+    with col_title:
+        st.markdown(f"### 🔀 결과 비교 ({len(filenames)}개)")
+    with col_close:
+        if st.button("비교 닫기", width="stretch", key="compare_close"):
+            st.session_state.compare_files = None
+            st.rerun()
+    
+    # 기준 결과를 맨 앞으로 (기준을 바꾸면 다른 조합으로 캐시)
+    base = st.session_state.get("compare_base")
+    ordered = [base] + [f for f in filenames if f != base] if base in filenames else list(filenames)
+    try:
+        comparison = compare_cache.get(ordered, load_outputs)
+    except (BackendError, ResultValidationError) as e:
+        st.error(f"비교할 결과 불러오기 실패: {str(e)}")
+        return
+    subjects = dict(zip(comparison.filenames, comparison.subjects))
+    
+    col_base, col_section = st.columns([3, 2], gap="small", vertical_alignment="bottom")
+    with col_base:
+        st.selectbox("기준 결과", filenames, format_func=lambda f: subjects.get(f, f), key="compare_base")
+    with col_section:
+        section = st.radio("보기", COMPARE_SECTIONS, horizontal=True, key="compare_section", label_visibility="collapsed")
+    
+    if section == COMPARE_SECTIONS[1]:
+        number = st.radio(
+            "문항", comparison.question_numbers, format_func=lambda n: f"{n}번", horizontal=True, key="compare_question"
+        )
+        if number is None:
+            return
+        column_html = comparison.question_html(number)
+    else:
+        column_html = comparison.passage_html
+    
+    # 결과별 열 (첫 열이 기준, 나머지는 기준 대비 추가/삭제 표시)
+    for i, (col, subject, content_html) in enumerate(zip(st.columns(len(column_html)), comparison.subjects, column_html)):
+        with col:
+            st.markdown(f"**{subject}**")
+            if i == 0:
+                st.caption("기준")
             else:
-                st.error(f"파일 삭제 실패: {delete_response.status_code}")
-        except Exception as e:
-            st.error(f"파일 삭제 실패: {str(e)}")
+                st.caption(f"지문 일치율 {comparison.passage_ratios[i]:.0%}")
+            st.markdown(f"<div class='compare-column'>{content_html}</div>", unsafe_allow_html=True)
 
 
-# 로고 이미지 로드 및 base64 인코딩
-logo_path = Path(__file__).parent / "logo_kangnam_202111.png"
-if logo_path.exists():
-    with open(logo_path, "rb") as f:
-        img_bytes = f.read()
-    img_base64 = base64.b64encode(img_bytes).decode()
-else:
-    img_base64 = ""
+# 로고 이미지 (정적 파일 URL 또는 data URI, 프로세스당 한 번 생성)
+logo_src = assets.logo_src()
 
 # 메인 레이아웃
 # 2열 레이아웃 (좌측: 로그/입력, 우측: 결과)
@@ -642,10 +1220,10 @@ col1, col2 = st.columns([1, 2], gap="medium")
 with col1:
     # 로고 + 타이틀
     with st.container(border=False, height=160):
-        if img_base64:
+        if logo_src:
             st.markdown(f"""
             <div style="display: flex; justify-content: flex-start; align-items: center; margin-bottom: 10px;">
-                <img src="data:image/png;base64,{img_base64}" 
+                <img src="{logo_src}" 
                      style="width: 110px; height: auto; pointer-events: none; user-select: none; margin-right: 15px;" 
                      alt="강남대성수능연구소 로고">
                 <div style="margin: 0; padding: 0; font-size: 40px; font-weight: 800; font-family: 'Nanum Myeongjo', serif;">
@@ -657,144 +1235,67 @@ with col1:
             st.header("KSAT Agent")
         st.markdown('Model ver : KSAT-Pro-10-19 <br> Last updated : 2025.10.26 (beta) <br> Issue report : 권준희 (wnsgml9807@naver.com)', unsafe_allow_html=True)
     
-    # Output 파일 불러오기 패널 (맨 위로)
-    with st.container(border=True, height=600):
-        st.markdown("#### 📁 저장된 결과")
-        
-        # 백엔드 API로부터 파일 목록 가져오기
-        try:
-            response = requests.get(f"{BACKEND_URL}/api/outputs", timeout=5)
-            if response.status_code == 200:
-                files_metadata = response.json().get('files', [])
-                
-                if files_metadata:
-                    import pandas as pd
-                    
-                    # DataFrame 생성 (filename 제외)
-                    df = pd.DataFrame(files_metadata)
-                    display_df = df[['생성일자', '대분야', '주제', '문항 수']].copy()
-                    
-                    # 인덱스를 1부터 시작하도록 설정
-                    display_df.index = range(1, len(display_df) + 1)
-                    
-                    # 데이터 테이블 표시
-                    st.dataframe(
-                        display_df,
-                        width="stretch",
-                        hide_index=False,
-                        height=400
-                    )
-                    
-                    # 행 선택 (라디오 버튼 또는 숫자 입력)
-                    col_select, col_load, col_delete = st.columns([2, 1, 1], gap="small")
-                    
-                    with col_select:
-                        selected_idx = st.number_input(
-                            "파일 번호",
-                            min_value=1,
-                            max_value=len(files_metadata),
-                            value=1,
-                            step=1,
-                            label_visibility="collapsed"
-                        )
-                    
-                    with col_load:
-                        if st.button("불러오기", width="stretch"):
-                            selected_file = files_metadata[selected_idx - 1]['filename']
-                            try:
-                                # 백엔드 API로부터 파일 내용 가져오기
-                                file_response = requests.get(
-                                    f"{BACKEND_URL}/api/outputs/{selected_file}",
-                                    timeout=10
-                                )
-                                if file_response.status_code == 200:
-                                    loaded_data = file_response.json()
-                                    st.session_state.generated_result = loaded_data
-                                    st.success(f"✅ 불러오기 완료!")
-                                    st.rerun()
-                                else:
-                                    st.error(f"파일 불러오기 실패: {file_response.status_code}")
-                            except Exception as e:
-                                st.error(f"파일 불러오기 실패: {str(e)}")
-                    
-                    with col_delete:
-                        if st.button("삭제", width="stretch", type="secondary"):
-                            selected_file = files_metadata[selected_idx - 1]['filename']
-                            st.session_state.file_to_delete = selected_file
-                            show_delete_confirmation_dialog()
-                else:
-                    st.info("저장된 결과 파일이 없습니다.")
-            else:
-                st.error(f"파일 목록 조회 실패: {response.status_code}")
-        except requests.exceptions.RequestException as e:
-            st.warning("백엔드 서버와 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.")
-        
-        # 신규 생성 버튼 (패널 맨 아래)
-        if st.button("➕ 신규 생성", width="stretch", type="primary", key="open_dialog"):
-            show_generation_dialog()  # 다이얼로그 직접 호출
+    # 저장된 결과 패널 / 전문 검색 (각각 독립적으로 재실행되는 프래그먼트)
+    render_outputs_panel()
+    render_search_panel()
+    
+    # 진행 중인 생성 작업 (작업이 있을 때만 주기적으로 갱신)
+    if st.session_state.active_job_id:
+        render_active_job()
+    if st.session_state.active_batch_id:
+        render_active_batch()
+    if st.session_state.bulk_job_id:
+        bulk_job = bulk_registry.get(st.session_state.bulk_job_id)
+        if bulk_job is None:
+            st.session_state.bulk_job_id = None
+        elif bulk_job.is_done:
+            render_bulk_result(bulk_job)
+        else:
+            render_bulk_progress()
+    if st.session_state.export_job_id:
+        export_job = export_registry.get(st.session_state.export_job_id)
+        if export_job is None:
+            clear_export_job()
+        elif export_job.is_done:
+            render_export_result(export_job)
+        else:
+            render_export_progress()
+    
+    # 생성 소요 시간 통계 (단계별 p50/p95, 내보내기)
+    if len(timing_stats):
+        with st.expander("⏱️ 생성 소요 시간 통계", expanded=False):
+            st.dataframe(
+                timing_stats.summary(),
+                width="stretch",
+                hide_index=True,
+                column_config={
+                    "p50": st.column_config.NumberColumn(format="%.1f초"),
+                    "p95": st.column_config.NumberColumn(format="%.1f초"),
+                    "최대": st.column_config.NumberColumn(format="%.1f초"),
+                }
+            )
+            # 취소/오류로 끝난 실행만 있으면 전체 소요 시간 분포가 비어 있음
+            histogram = timing_stats.histogram(METRIC_TOTAL)
+            if histogram:
+                st.caption(f"전체 소요 시간 분포 (최근 {len(timing_stats)}회)")
+                st.bar_chart(histogram, x="구간", y="건수", height=200)
+            
+            col_csv, col_json = st.columns(2, gap="small")
+            with col_csv:
+                st.download_button("CSV 내보내기", timing_stats.to_csv(), file_name="generation_timing.csv", mime="text/csv", width="stretch")
+            with col_json:
+                st.download_button("JSON 내보내기", timing_stats.to_json(), file_name="generation_timing.json", mime="application/json", width="stretch")
 
 # 우측 컬럼: 결과 표시
 with col2:
     with st.container(border=True, height=1500):
-        if st.session_state.generated_result:
-            result = st.session_state.generated_result
-            
-            # 주제 헤더 표시
-            card = result.get('card', {})
-            subject = card.get('subject', '생성된 지문')
-            st.markdown(f"### {subject}")
-            
-            # 탭 생성
-            tab1, tab2 = st.tabs(["📄 지문 & 문항", "💡 해설"])
-            
-            with tab1:
-                # 지문 HTML 생성
-                import re
-                text = result['passage'].get('passage', result['passage'].get('content', result['passage'].get('passage_text', '')))
-                
-                # (가), (나) 분리형 지문 처리
-                if re.search(r'^\s*\(가\)', text, re.MULTILINE):
-                    parts = re.split(r'(\((?:가|나)\))', text)
-                    passage_html = ""
-                    for part in parts:
-                        part = part.strip()
-                        if not part:
-                            continue
-                        if part in ['(가)', '(나)']:
-                            passage_html += f"<p class='section-label'>{part}</p>"
-                        else:
-                            paragraphs = [p.strip() for p in part.split("\n") if p.strip()]
-                            passage_html += "".join(f"<p>{p}</p>" for p in paragraphs)
-                else:
-                    # 일반 지문
-                    paragraphs = [p.strip() for p in text.split("\n") if p.strip()]
-                    passage_html = "".join(f"<p>{p}</p>" for p in paragraphs)
-                
-                passage_html = f"<div class='passage-font'>{passage_html}</div>"
-                
-                # 문항 HTML 생성
-                questions_html = render_questions(result['questions'])
-                
-                # 지문+문항 통합 HTML
-                combined_html = f"""
-                <div class="content-wrapper">
-                    <div class="content-container">
-                        <div class="passage-section">
-                            {passage_html}
-                        </div>
-                        <div class="questions-section">
-                            {questions_html}
-                        </div>
-                    </div>
-                </div>
-                """
-                
-                st.markdown(combined_html, unsafe_allow_html=True)
-            
-            with tab2:
-                # 해설 표시
-                render_explanations(result['questions'])
-        
+        if st.session_state.active_job_id:
+            # 생성 중에는 도착한 부분 결과부터 표시
+            render_partial_result()
+        elif st.session_state.compare_files:
+            render_compare_view()
         else:
-            st.info("좌측 패널에서 결과물을 선택하거나, 신규 생성 버튼을 클릭하세요. 지문과 문항이 표시되는 부분입니다.")
+            render_viewer()
+
+save_session_view()
 
@@ -0,0 +1,247 @@
+"""
+정적 자원
+CSS, 웹 폰트, 로고를 프로세스당 한 번만 만들어 재실행마다 같은 문자열을 재사용
+
+server.enableStaticServing이 켜져 있으면 static/ 폴더의 파일을 app/static/ 경로로 제공한다.
+폰트 파일은 배포 전에 dev/fetch_fonts.py로 받으며, 없으면 Google Fonts를 사용한다.
+CSS 블록은 재실행마다 보내지만 .streamlit/config.toml의 global.minCachedMessageSize 이상이므로 브라우저 메시지 캐시에서 재사용된다.
+"""
+import base64
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+import streamlit as st
+
+STATIC_DIR = Path(__file__).parent / "static"
+STATIC_URL = "app/static"
+LOGO_FILE = "logo_kangnam_202111.png"
+
+# (파일명, font-weight) - static/fonts/ 기준
+FONT_FILES = [
+    ("NanumMyeongjo-Regular.ttf", 400),
+    ("NanumMyeongjo-Bold.ttf", 700),
+    ("NanumMyeongjo-ExtraBold.ttf", 800),
+]
+GOOGLE_FONTS_IMPORT = "@import url('https://fonts.googleapis.com/css2?family=Nanum+Myeongjo:wght@400;700;800&display=swap');"
+
+# 첫 화면 이후에 필요한 무거운 모듈 (백그라운드에서 미리 import)
+PRELOAD_MODULES = ("pandas",)
+
+APP_CSS = """
+    .passage-font {
+        border: 0.5px solid black;
+        border-radius: 0px;
+        padding: 12px;
+        margin-bottom: 20px;
+        font-family: 'Nanum Myeongjo', serif !important;
+        font-size: 16.5px;
+        line-height: 1.7;
+        letter-spacing: -0.01em;
+        font-weight: 500;
+        background: #ffffff;
+        width: 12cm;
+        text-align: justify;
+        text-justify: inter-word;
+    }
+    
+    .passage-font p { 
+        margin: 0; 
+        text-indent: 1em; 
+        text-align: justify; 
+    }
+    
+    .passage-font .section-label { 
+        font-weight: 700; 
+        margin: 1em 0 0.5em 0; 
+        text-indent: 0; 
+    }
+    
+    .passage-font .section-label:first-of-type { 
+        margin-top: 0; 
+    }
+    
+    .q-material .passage-font { 
+        width: calc(12cm - 1em); 
+    }
+    
+    .question-font {
+        font-family: 'Nanum Myeongjo', serif !important;
+        line-height: 1.7em;
+        letter-spacing: -0.01em;
+        font-weight: 500;
+        margin-bottom: 1.5em;
+        width: 12cm;
+        text-align: justify;
+        text-justify: inter-word;
+    }
+    
+    .question-block { 
+        padding: 8px 6px; 
+    }
+    
+    .q-header { 
+        font-weight: 700; 
+        margin-bottom: 8px;
+        text-indent: -1em; 
+        padding-left: 1em;
+    }
+    
+    .q-material { 
+        margin: 8px 0; 
+        margin-left: 1em; 
+    }
+    
+    .q-choices { 
+        margin-top: 8px; 
+        margin-left: 1em; 
+    }
+    
+    .q-choices p { 
+        text-indent: -1em; 
+        padding-left: 1em; 
+        margin: 0.3em 0;
+    }
+    
+    .explanation-item {
+        text-indent: -1.5em;
+        padding-left: 1.5em;
+        margin: 0.3em 0;
+    }
+    
+    /* 지문+문항 통합 컨테이너 */
+    .content-wrapper {
+        width: 100%;
+        overflow-x: auto;
+    }
+    
+    .content-container {
+        display: flex;
+        gap: 20px;
+        width: calc(26cm + 20px);
+        min-width: calc(26cm + 20px);
+        margin: 0 auto;
+    }
+    
+    .passage-section {
+        width: 13cm;
+        min-width: 13cm;
+        max-width: 13cm;
+        flex-shrink: 0;
+        padding-right: 5px;
+        border-right: 2px solid #000000;
+    }
+    
+    .questions-section {
+        width: 13cm;
+        min-width: 13cm;
+        max-width: 13cm;
+        flex-shrink: 0;
+        padding-left: 5px;
+    }
+    
+    /* 생성 중 아직 도착하지 않은 지문/문항 */
+    .pending-block {
+        color: #999;
+        font-style: italic;
+    }
+    
+    /* 해설 섹션 */
+    .explanation-section {
+        width: 100%;
+        max-width: 20cm;
+        margin: 0 auto;
+        padding: 20px;
+    }
+    
+    .explanation-item-block {
+        margin-bottom: 30px;
+    }
+    
+    .explanation-section .question-font {
+        width: 100%;
+        max-width: none;
+    }
+    
+    /* 결과 비교 (열 너비에 맞춤, 기준 대비 추가/삭제) */
+    .compare-column .passage-font,
+    .compare-column .question-font {
+        width: 100%;
+        max-width: none;
+    }
+    
+    .diff-ins {
+        background-color: #d4f7d4;
+        text-decoration: none;
+    }
+    
+    .diff-del {
+        background-color: #fbd5d5;
+        color: #888;
+    }
+    
+    /* 스피너 애니메이션 */
+    @keyframes spin {
+        0% { transform: rotate(0deg); }
+        100% { transform: rotate(360deg); }
+    }
+    
+    .spinner {
+        display: inline-block;
+        width: 14px;
+        height: 14px;
+        border: 2px solid #f3f3f3;
+        border-top: 2px solid #1976d2;
+        border-radius: 50%;
+        animation: spin 0.8s linear infinite;
+        margin-right: 8px;
+        vertical-align: middle;
+    }
+"""
+
+
+def static_serving_enabled() -> bool:
+    return bool(st.get_option("server.enableStaticServing"))
+
+
+def font_css() -> str:
+    """Nanum Myeongjo @font-face (자체 호스팅 파일이 모두 있을 때) 또는 Google Fonts @import"""
+    font_dir = STATIC_DIR / "fonts"
+    if not static_serving_enabled() or not all((font_dir / name).exists() for name, _ in FONT_FILES):
+        return GOOGLE_FONTS_IMPORT
+    return "".join(
+        "@font-face { font-family: 'Nanum Myeongjo'; font-style: normal; "
+        f"font-weight: {weight}; font-display: swap; src: url('{STATIC_URL}/fonts/{name}') format('truetype'); }}"
+        for name, weight in FONT_FILES
+    )
+
+
+@lru_cache(maxsize=1)
+def style_html() -> str:
+    """앱 전체 <style> 블록"""
+    return f"<style>\n    {font_css()}\n{APP_CSS}</style>"
+
+
+@lru_cache(maxsize=1)
+def logo_src() -> str:
+    """로고 이미지 src (정적 파일 URL, 정적 제공이 꺼져 있으면 data URI, 파일이 없으면 빈 문자열)"""
+    path = STATIC_DIR / LOGO_FILE
+    if not path.exists():
+        return ""
+    if static_serving_enabled():
+        return f"{STATIC_URL}/{LOGO_FILE}"
+    return "data:image/png;base64," + base64.b64encode(path.read_bytes()).decode()
+
+
+def preload_modules(names=PRELOAD_MODULES) -> threading.Thread:
+    """무거운 모듈을 백그라운드 스레드에서 import (백엔드 응답 대기와 겹치도록)"""
+    def _run():
+        for name in names:
+            try:
+                __import__(name)
+            except ImportError:
+                pass
+
+    thread = threading.Thread(target=_run, name="preload-modules", daemon=True)
+    thread.start()
+    return thread
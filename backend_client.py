@@ -0,0 +1,325 @@
+"""
+백엔드 API 클라이언트
+프로세스당 하나의 keep-alive 세션으로 KSAT 백엔드와 통신
+"""
+import json
+import threading
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+from urllib.parse import quote
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from sse import SSEDecoder
+
+# 엔드포인트별 기본 타임아웃 (연결, 읽기) 초
+Timeout = Union[float, Tuple[float, float]]
+DEFAULT_TIMEOUTS: Dict[str, Timeout] = {
+    "list_outputs": (3.05, 5),
+    "get_output": (3.05, 10),
+    "delete_output": (3.05, 5),
+    "update_output": (3.05, 5),
+    "generate_stream": (3.05, 600),
+    "cancel_generation": (3.05, 5),
+    # 서버가 heartbeat(SSE 주석 줄)를 보내는 스트림은 이 시간 동안 아무것도 오지 않으면 끊긴 연결로 보고 재연결
+    "stream_heartbeat": 45,
+}
+
+# 재시도 대상: 멱등 메서드 + 일시적 서버 오류
+RETRY_METHODS = frozenset({"GET", "HEAD", "DELETE"})
+RETRY_STATUS = (502, 503, 504)
+
+# 생성 스트림 재연결: 연속 실패 허용 횟수, 서버가 retry를 주지 않았을 때의 대기 시간(초, 실패마다 2배, 최대 10초)
+STREAM_MAX_RECONNECTS = 5
+STREAM_RECONNECT_DELAY = 1.0
+# 생성 스트림 종료 이벤트 (이후에는 재연결하지 않음)
+STREAM_FINAL_EVENTS = frozenset({"complete", "error"})
+# 스트림 읽기 단위 (받은 만큼만 반환하므로 이벤트가 이 크기만큼 쌓일 때까지 기다리지 않음)
+STREAM_CHUNK_SIZE = 16 * 1024
+
+
+class BackendError(Exception):
+    """백엔드 응답 오류 (상태 코드 포함)"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class BackendConnectionError(BackendError):
+    """백엔드 연결 실패 (타임아웃, 연결 거부 등)"""
+
+
+class BackendClient:
+    """커넥션 풀과 재시도를 갖춘 백엔드 API 클라이언트"""
+
+    def __init__(
+        self,
+        base_url: str,
+        timeouts: Optional[Dict[str, Timeout]] = None,
+        pool_maxsize: int = 20,
+        max_retries: int = 3,
+        backoff_factor: float = 0.3,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        for endpoint, timeout in (timeouts or {}).items():
+            # secrets.toml 배열은 list로 들어오므로 requests가 받는 tuple로 변환
+            self.timeouts[endpoint] = tuple(timeout) if isinstance(timeout, list) else timeout
+
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS,
+            allowed_methods=RETRY_METHODS,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        """세션 및 커넥션 풀 정리"""
+        self.session.close()
+
+    def _request(
+        self, method: str, path: str, endpoint: str, ok_status: Tuple[int, ...] = (200,), **kwargs
+    ) -> requests.Response:
+        """공통 요청 처리 - 타임아웃 적용 및 오류를 BackendError로 변환"""
+        kwargs.setdefault("timeout", self.timeouts[endpoint])
+        try:
+            response = self.session.request(method, f"{self.base_url}{path}", **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            raise BackendConnectionError(str(e)) from e
+        except requests.exceptions.RequestException as e:
+            raise BackendError(str(e)) from e
+
+        if response.status_code not in ok_status:
+            response.close()
+            raise BackendError(str(response.status_code), status_code=response.status_code)
+        return response
+
+    def list_outputs(self) -> list:
+        """저장된 결과 파일 메타데이터 목록 조회"""
+        response = self._request("GET", "/api/outputs", "list_outputs")
+        return response.json().get("files", [])
+
+    def list_outputs_page(
+        self,
+        offset: int = 0,
+        limit: int = 50,
+        filters: Optional[Dict[str, str]] = None,
+        etag: Optional[str] = None,
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """페이지 단위 목록 조회 (필터는 서버에서 적용)
+
+        반환: ({"files", "total", "offset", "limit"}, etag), 변경이 없으면(304) (None, etag)
+        """
+        params = {"offset": offset, "limit": limit}
+        params.update({k: v for k, v in (filters or {}).items() if v})
+        headers = {"If-None-Match": etag} if etag else {}
+        response = self._request(
+            "GET", "/api/outputs", "list_outputs", ok_status=(200, 304), params=params, headers=headers
+        )
+        if response.status_code == 304:
+            return None, etag
+        body = response.json()
+        if "total" not in body:
+            # 페이지네이션을 지원하지 않는 백엔드: 전체 목록을 받아 로컬에서 필터/슬라이스
+            return paginate_locally(body.get("files", []), offset, limit, filters), response.headers.get("ETag")
+        return {
+            "files": body.get("files", []),
+            "total": body["total"],
+            "offset": body.get("offset", offset),
+            "limit": body.get("limit", limit),
+        }, response.headers.get("ETag")
+
+    def get_output(self, filename: str) -> Dict[str, Any]:
+        """저장된 결과 파일 내용 조회"""
+        response = self._request("GET", f"/api/outputs/{quote(filename)}", "get_output")
+        return response.json()
+
+    def delete_output(self, filename: str) -> None:
+        """저장된 결과 파일 삭제"""
+        self._request("DELETE", f"/api/outputs/{quote(filename)}", "delete_output")
+
+    def update_output(self, filename: str, changes: Dict[str, Any]) -> Dict[str, Any]:
+        """저장된 결과 메타데이터 변경 (예: {"field": 대분야}) - 변경된 메타데이터 반환"""
+        response = self._request("PATCH", f"/api/outputs/{quote(filename)}", "update_output", json=changes)
+        return response.json()
+
+    def stream_generate(
+        self,
+        user_input: Dict[str, Any],
+        last_event_id: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        job_id: Optional[str] = None,
+    ) -> requests.Response:
+        """문항 생성 SSE 스트림 요청 (재시도 없음, with 문으로 사용)
+
+        - last_event_id가 있으면 이어 받기 요청
+        - idempotency_key가 같은 생성이 백엔드에서 진행 중이면 새로 시작하지 않고 그 스트림에 연결 (백엔드 지원 시)
+        - job_id는 생성에 연결된 작업 식별용 (중단 요청이 다른 작업이 함께 받는 생성을 멈추지 않도록)
+        """
+        headers = {"Accept": "text/event-stream", "Cache-Control": "no-cache"}
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+        if job_id:
+            headers["X-Job-ID"] = job_id
+        if last_event_id:
+            headers["Last-Event-ID"] = last_event_id
+        return self._request(
+            "POST",
+            "/api/generate/stream",
+            "generate_stream",
+            json={"user_input": user_input},
+            headers=headers,
+            stream=True,
+        )
+
+    def iter_events(self, response: requests.Response, decoder: Optional[SSEDecoder] = None) -> Iterator[Dict[str, Any]]:
+        """SSE 응답을 받는 대로 디코딩하여 이벤트 data(JSON)를 순서대로 반환
+
+        - `event:` 이름이 있고 data에 type이 없으면 이벤트 이름을 type으로 사용, JSON이 아닌 data는 무시
+        - heartbeat(주석 줄)가 오기 시작하면 읽기 제한 시간을 stream_heartbeat로 줄임
+        """
+        decoder = decoder if decoder is not None else SSEDecoder()
+        heartbeat_set = False
+        try:
+            for chunk in self._iter_chunks(response):
+                events = decoder.feed(chunk)
+                if decoder.comments and not heartbeat_set:
+                    _set_read_timeout(response, self.timeouts["stream_heartbeat"])
+                    heartbeat_set = True
+                for event in events:
+                    try:
+                        payload = json.loads(event.data)
+                    except ValueError:
+                        continue
+                    if not isinstance(payload, dict):
+                        continue
+                    if event.event != "message":
+                        payload.setdefault("type", event.event)
+                    yield payload
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError, OSError) as e:
+            raise BackendConnectionError(str(e)) from e
+
+    def generate_events(
+        self,
+        user_input: Dict[str, Any],
+        idempotency_key: Optional[str] = None,
+        job_id: Optional[str] = None,
+        on_response: Optional[Callable[[requests.Response], None]] = None,
+        stop_event: Optional[threading.Event] = None,
+        max_reconnects: int = STREAM_MAX_RECONNECTS,
+    ) -> Iterator[Dict[str, Any]]:
+        """문항 생성 이벤트 - 연결이 끊기면 Last-Event-ID로 재연결하여 이어 받음
+
+        - 서버가 이벤트 id를 보낸 경우에만 재연결 (id가 없으면 이어 받을 수 없고, 다시 요청하면 새 생성이 시작됨)
+        - complete/error 전에 스트림이 정상 종료된 경우도 끊긴 것으로 보고 재연결
+        - on_response(response)는 연결마다 호출 (취소 시 닫을 응답 보관용), stop_event가 설정되면 재연결하지 않음
+        - 재연결 대기 중에도 stop_event가 설정되면 바로 종료 (취소가 대기 시간만큼 늦어지지 않음)
+        """
+        decoder = SSEDecoder()
+        failures = 0
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            decoder.reset_connection()
+            error: Optional[BackendConnectionError] = None
+            try:
+                last_event_id = decoder.last_event_id or None
+                with self.stream_generate(user_input, last_event_id, idempotency_key, job_id) as response:
+                    if on_response is not None:
+                        on_response(response)
+                    for payload in self.iter_events(response, decoder):
+                        failures = 0
+                        yield payload
+                        if payload.get("type") in STREAM_FINAL_EVENTS:
+                            return
+            except BackendConnectionError as e:
+                error = e
+
+            if stop_event.is_set():
+                return
+            if not decoder.last_event_id or failures >= max_reconnects:
+                if error is not None:
+                    raise error
+                return  # 이어 받을 수 없는 정상 종료 - 결과 없이 끝난 스트림은 호출 측에서 처리
+            failures += 1
+            if decoder.retry is not None:
+                delay = decoder.retry / 1000
+            else:
+                delay = min(STREAM_RECONNECT_DELAY * 2 ** (failures - 1), 10.0)
+            if stop_event.wait(delay):
+                return
+
+    def cancel_generation(self, idempotency_key: str, job_id: Optional[str] = None) -> None:
+        """진행 중인 생성 중단 요청 (중단 API가 없는 백엔드는 404/405 - 호출 측에서 무시)
+
+        - job_id가 있으면 그 작업만 생성에서 분리하고, 같은 생성에 연결된 다른 작업이 남아 있으면 생성은 계속됨
+        """
+        body = {"idempotency_key": idempotency_key}
+        if job_id:
+            body["job_id"] = job_id
+        self._request("POST", "/api/generate/cancel", "cancel_generation", json=body)
+
+    @staticmethod
+    def _iter_chunks(response: requests.Response) -> Iterator[bytes]:
+        """받은 바이트를 도착하는 대로 반환 (청크 크기만큼 찰 때까지 기다리지 않음)"""
+        read1 = getattr(response.raw, "read1", None)
+        if read1 is None:
+            # urllib3 1.x: read1이 없으므로 작은 단위로 읽음
+            yield from response.iter_content(chunk_size=1)
+            return
+        while True:
+            chunk = read1(STREAM_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _set_read_timeout(response: requests.Response, seconds: float):
+    """스트리밍 응답의 소켓 읽기 제한 시간 변경 (소켓에 접근할 수 없으면 무시)"""
+    sock = getattr(getattr(response.raw, "connection", None), "sock", None)
+    if sock is None:
+        # Connection: close 응답은 연결 객체가 소켓을 놓으므로 http.client 응답의 SocketIO에서 찾음
+        fp = getattr(getattr(response.raw, "_fp", None), "fp", None)
+        sock = getattr(getattr(fp, "raw", None), "_sock", None)
+    if sock is not None:
+        sock.settimeout(seconds)
+
+
+def match_filters(meta: Dict[str, Any], filters: Optional[Dict[str, str]]) -> bool:
+    """목록 필터 조건 확인 (field: 대분야, subject: 주제 부분일치, date_from/date_to: 생성일자 YYYY-MM-DD)"""
+    if not filters:
+        return True
+    if filters.get("field") and meta.get("대분야") != filters["field"]:
+        return False
+    if filters.get("subject") and filters["subject"] not in str(meta.get("주제", "")):
+        return False
+    created = str(meta.get("생성일자", ""))[:10]
+    if filters.get("date_from") and created < filters["date_from"]:
+        return False
+    if filters.get("date_to") and created > filters["date_to"]:
+        return False
+    return True
+
+
+def paginate_locally(
+    files: list, offset: int, limit: int, filters: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """전체 목록에 필터와 offset/limit을 적용하여 페이지 응답 형태로 변환"""
+    matched = [meta for meta in files if match_filters(meta, filters)]
+    return {
+        "files": matched[offset:offset + limit],
+        "total": len(matched),
+        "offset": offset,
+        "limit": limit,
+    }
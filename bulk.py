@@ -0,0 +1,148 @@
+"""
+저장된 결과 일괄 작업
+여러 결과의 삭제, 분류 변경을 제한된 스레드 풀에서 항목별로 병렬 실행하고 항목별 결과를 보관
+"""
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from jobs import JOB_CANCELLED, JOB_COMPLETE, JOB_DONE_STATUSES, JOB_ERROR, JOB_QUEUED, JOB_RUNNING
+
+# 일괄 작업 종류
+BULK_DELETE = "delete"
+BULK_RETAG = "retag"
+BULK_LABELS = {BULK_DELETE: "삭제", BULK_RETAG: "분류 변경"}
+
+# 취소되어 실행하지 않은 항목의 결과
+SKIPPED = "취소됨"
+
+# 항목 하나를 처리하는 함수: (파일 이름, 작업 인자) - 실패 시 예외
+Operation = Callable[[str, Dict[str, Any]], None]
+
+
+class BulkJob:
+    """일괄 작업 하나의 상태 (항목별 결과: 파일 이름 → 오류 메시지, 성공이면 None)"""
+
+    def __init__(self, job_id: str, action: str, filenames: List[str], params: Dict[str, Any]):
+        self.job_id = job_id
+        self.action = action
+        self.filenames = filenames
+        self.params = params
+        self.status = JOB_QUEUED
+        self.total = len(filenames)
+        self.done = 0
+        self.results: Dict[str, Optional[str]] = {}
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.cancel_event = threading.Event()
+
+    @property
+    def is_done(self) -> bool:
+        return self.status in JOB_DONE_STATUSES
+
+    @property
+    def succeeded(self) -> List[str]:
+        """성공한 항목 (요청 순서)"""
+        return [filename for filename in self.filenames if filename in self.results and self.results[filename] is None]
+
+    @property
+    def failed(self) -> Dict[str, str]:
+        """실패하거나 취소된 항목별 오류 메시지"""
+        return {filename: error for filename, error in self.results.items() if error is not None}
+
+
+class BulkRegistry:
+    """일괄 작업을 백그라운드 스레드 풀에서 실행
+
+    - 항목마다 풀에 제출하므로 동시 요청 수는 max_workers로 제한 (여러 세션의 작업도 같은 풀을 공유)
+    - 마지막 항목이 끝나면 on_finish(job)를 한 번 호출 (목록 캐시 무효화 등은 작업당 한 번)
+      작업을 완료 상태로 바꾸기 전에 호출하므로, 완료를 본 화면은 항상 무효화된 캐시를 다시 읽음
+    """
+
+    def __init__(
+        self,
+        operations: Dict[str, Operation],
+        on_finish: Optional[Callable[[BulkJob], None]] = None,
+        max_workers: int = 8,
+        retention: float = 1800.0,
+    ):
+        self.operations = operations
+        self.on_finish = on_finish
+        self.retention = retention
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, BulkJob] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bulk")
+
+    def submit(self, action: str, filenames: List[str], params: Optional[Dict[str, Any]] = None) -> str:
+        """일괄 작업 등록 후 작업 ID 반환 (같은 파일이 여러 번 있으면 한 번만 처리)"""
+        if action not in self.operations:
+            raise ValueError(f"알 수 없는 일괄 작업: {action}")
+        job = BulkJob(uuid.uuid4().hex, action, list(dict.fromkeys(filenames)), dict(params or {}))
+        with self._lock:
+            self._prune()
+            self._jobs[job.job_id] = job
+            if not job.filenames:
+                self._finish(job)
+        for filename in job.filenames:
+            self._executor.submit(self._run_item, job, filename)
+        return job.job_id
+
+    def get(self, job_id: Optional[str]) -> Optional[BulkJob]:
+        if not job_id:
+            return None
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str):
+        """아직 시작하지 않은 항목은 실행하지 않음 (진행 중인 요청은 끝까지 처리)"""
+        job = self.get(job_id)
+        if job is not None and not job.is_done:
+            job.cancel_event.set()
+
+    def discard(self, job_id: str):
+        self.cancel(job_id)
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def _run_item(self, job: BulkJob, filename: str):
+        error = SKIPPED
+        if not job.cancel_event.is_set():
+            with self._lock:
+                if job.status == JOB_QUEUED:
+                    job.status = JOB_RUNNING
+            try:
+                self.operations[job.action](filename, job.params)
+                error = None
+            except Exception as e:
+                error = str(e) or type(e).__name__
+        with self._lock:
+            job.results[filename] = error
+            job.done += 1
+            if job.done < job.total:
+                return
+        # 마지막 항목을 처리한 스레드만 여기에 도달 - 캐시 무효화가 끝난 뒤 완료 상태로 전환
+        if self.on_finish is not None:
+            try:
+                self.on_finish(job)
+            except Exception:
+                pass  # 후처리 실패는 항목 결과에 영향 없음
+        with self._lock:
+            self._finish(job)
+
+    def _finish(self, job: BulkJob):
+        """종료 상태로 전환 (lock 보유 상태에서 호출) - 하나라도 성공하면 완료, 모두 실패하면 오류"""
+        if job.cancel_event.is_set():
+            job.status = JOB_CANCELLED
+        elif job.total and not job.succeeded:
+            job.status = JOB_ERROR
+        else:
+            job.status = JOB_COMPLETE
+        job.finished_at = time.time()
+
+    def _prune(self):
+        """보관 기간이 지난 완료 작업 정리 (lock 보유 상태에서 호출)"""
+        cutoff = time.time() - self.retention
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.is_done and job.finished_at < cutoff]:
+            del self._jobs[job_id]
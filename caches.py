@@ -0,0 +1,200 @@
+"""
+프로세스 공유 캐시
+모든 세션이 함께 사용하는 저장된 결과 목록 / 결과 문서 캐시
+(결과 문서 캐시는 공유 상태 저장소를 2차 캐시로 두어 다른 레플리카와 공유 가능)
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from result_model import GenerationResult, ResultValidationError
+from state_store import StateStore
+
+# 공유 상태 저장소의 결과 문서 namespace와 보관 기간(초)
+STATE_RESULTS = "results"
+SHARED_RESULT_TTL = 24 * 60 * 60
+
+# fetch(query, etag) -> (value, etag), 변경 없음(304)이면 value 자리에 None
+ListFetcher = Callable[[Hashable, Optional[str]], Tuple[Optional[Any], Optional[str]]]
+
+
+class _ListEntry:
+    """조회 조건 하나에 대한 캐시 항목"""
+    __slots__ = ("value", "etag", "fetched_at", "revalidating")
+
+    def __init__(self, value: Any, etag: Optional[str]):
+        self.value = value
+        self.etag = etag
+        self.fetched_at = time.monotonic()
+        self.revalidating = False
+
+
+class OutputsListCache:
+    """TTL + ETag 재검증 캐시 (stale-while-revalidate), 조회 조건(페이지, 필터)별 항목
+
+    - TTL 이내: 캐시된 목록을 그대로 반환
+    - TTL 경과 ~ max_stale 이내: 오래된 목록을 즉시 반환하고 백그라운드에서 재검증
+    - 그 이후 또는 무효화 직후: 동기적으로 다시 조회
+    """
+
+    def __init__(self, fetch: ListFetcher, ttl: float = 30.0, max_stale: float = 300.0, max_queries: int = 64):
+        self._fetch = fetch
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.max_queries = max_queries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _ListEntry]" = OrderedDict()
+        self._generation = 0  # invalidate()마다 증가 - 진행 중이던 재검증 결과 폐기용
+        self.version = 0  # 목록 내용이 바뀔 때마다 증가 (파생 데이터 캐시 키)
+
+    def get(self, query: Hashable = ()) -> Any:
+        """조회 조건에 대한 목록 반환 (필요 시 재검증). 동기 조회 실패 시 BackendError 전파"""
+        with self._lock:
+            entry = self._entries.get(query)
+            if entry is not None:
+                self._entries.move_to_end(query)
+                age = time.monotonic() - entry.fetched_at
+                if age < self.ttl:
+                    return entry.value
+                if age < self.ttl + self.max_stale:
+                    if not entry.revalidating:
+                        entry.revalidating = True
+                        threading.Thread(
+                            target=self._revalidate, args=(query, entry.etag, self._generation), daemon=True
+                        ).start()
+                    return entry.value
+            etag = entry.etag if entry is not None else None
+            generation = self._generation
+
+        value, new_etag = self._fetch(query, etag)
+        if value is None:
+            value = entry.value
+        with self._lock:
+            self._store(query, value, new_etag, generation)
+        return value
+
+    def invalidate(self):
+        """즉시 무효화 - 다음 get()은 백엔드에서 다시 조회"""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self.version += 1
+
+    def _revalidate(self, query: Hashable, etag: Optional[str], generation: int):
+        """백그라운드 재검증 (실패 시 기존 목록 유지)"""
+        try:
+            value, new_etag = self._fetch(query, etag)
+        except Exception:
+            with self._lock:
+                entry = self._entries.get(query)
+                if entry is not None:
+                    entry.revalidating = False
+            return
+        with self._lock:
+            entry = self._entries.get(query)
+            if entry is None:
+                return
+            entry.revalidating = False
+            self._store(query, value if value is not None else entry.value, new_etag, generation)
+
+    def _store(self, query: Hashable, value: Any, etag: Optional[str], generation: int):
+        """조회 결과 반영 (lock 보유 상태에서 호출)"""
+        if generation != self._generation:
+            return
+        entry = self._entries.get(query)
+        if entry is None or entry.value is not value:
+            self.version += 1
+        self._entries[query] = _ListEntry(value, etag)
+        self._entries.move_to_end(query)
+        while len(self._entries) > self.max_queries:
+            self._entries.popitem(last=False)
+
+
+class ResultCache:
+    """파일명 기준 결과 LRU 캐시 (검증된 GenerationResult를 보관, 원본 문서의 직렬화 바이트 크기로 용량 제한)
+
+    shared가 주어지면 프로세스 캐시에 없는 문서를 공유 저장소에서 찾고, 저장/제거를 공유 저장소에도 반영
+    (다른 레플리카가 생성/조회한 문서를 백엔드 재조회 없이 사용)
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, shared: Optional[StateStore] = None):
+        self.max_bytes = max_bytes
+        self.shared = shared
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[GenerationResult, int]]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.shared_hits = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, filename: str) -> bool:
+        return filename in self._entries
+
+    def get(self, filename: str) -> Optional[GenerationResult]:
+        """캐시된 결과 반환 (최근 사용으로 갱신), 없으면 None"""
+        with self._lock:
+            entry = self._entries.get(filename)
+            if entry is not None:
+                self._entries.move_to_end(filename)
+                self.hits += 1
+                return entry[0]
+        document = self._shared_get(filename)
+        with self._lock:
+            if document is None:
+                self.misses += 1
+                return None
+            self.shared_hits += 1
+        self.put(filename, document, share=False)
+        return document
+
+    def put(self, filename: str, document: GenerationResult, share: bool = True):
+        """결과 저장 후 용량 초과분을 오래된 순으로 제거 (share면 원본 문서를 공유 저장소에도 기록)"""
+        size = len(json.dumps(document.raw, ensure_ascii=False).encode("utf-8"))
+        if share and self.shared is not None:
+            try:
+                self.shared.set(STATE_RESULTS, filename, document.to_dict(), ttl=SHARED_RESULT_TTL)
+            except Exception:
+                pass  # 공유 저장소 장애 시 프로세스 캐시만 사용
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(filename, None)
+            if old is not None:
+                self.total_bytes -= old[1]
+            self._entries[filename] = (document, size)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+
+    def evict(self, filename: str):
+        """문서 제거 (파일 삭제 시)"""
+        with self._lock:
+            entry = self._entries.pop(filename, None)
+            if entry is not None:
+                self.total_bytes -= entry[1]
+        if self.shared is not None:
+            try:
+                self.shared.delete(STATE_RESULTS, filename)
+            except Exception:
+                pass
+
+    def _shared_get(self, filename: str) -> Optional[GenerationResult]:
+        """공유 저장소의 문서를 검증하여 반환 (없거나 형식이 잘못되면 None)"""
+        if self.shared is None:
+            return None
+        try:
+            document = self.shared.get(STATE_RESULTS, filename)
+        except Exception:
+            return None
+        if document is None:
+            return None
+        try:
+            return GenerationResult.from_dict(document)
+        except ResultValidationError:
+            return None
@@ -0,0 +1,179 @@
+"""
+결과 비교
+저장된 결과 2~4개를 나란히 놓고 기준 결과(첫 번째)와의 지문/문항 차이 HTML 생성 및 결과 조합별 메모이제이션
+"""
+import difflib
+import html
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from result_model import NUM_TO_SYMBOL, GenerationResult, Question
+
+# 한 번에 비교할 수 있는 결과 개수
+MIN_COMPARE = 2
+MAX_COMPARE = 4
+
+# 차이 비교 단위 (어절, 뒤따르는 공백 포함)
+_TOKEN = re.compile(r'\S+\s*|\s+')
+
+# 어절 단위로 비교할 줄 쌍의 최대 크기 (어절 수의 곱, 넘으면 줄 전체를 삭제/추가로 표시)
+_MAX_WORD_CELLS = 250_000
+
+
+def _escape(text: str) -> str:
+    return html.escape(text, quote=False).replace("\n", "<br/>")
+
+
+def _diff_words(base: str, other: str) -> Tuple[str, int]:
+    """줄 하나를 어절 단위로 비교한 HTML과 일치한 글자 수"""
+    a, b = _TOKEN.findall(base), _TOKEN.findall(other)
+    if len(a) * len(b) > _MAX_WORD_CELLS:
+        return f"<del class='diff-del'>{_escape(base)}</del><ins class='diff-ins'>{_escape(other)}</ins>", 0
+    matcher = difflib.SequenceMatcher(None, a, b, autojunk=False)
+    parts = []
+    matched = 0
+    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        if op == 'equal':
+            text = "".join(b[j1:j2])
+            parts.append(_escape(text))
+            matched += len(text)
+            continue
+        if i2 > i1:
+            parts.append(f"<del class='diff-del'>{_escape(''.join(a[i1:i2]))}</del>")
+        if j2 > j1:
+            parts.append(f"<ins class='diff-ins'>{_escape(''.join(b[j1:j2]))}</ins>")
+    return "".join(parts), matched
+
+
+def diff_html(base: str, other: str) -> Tuple[str, float]:
+    """other를 base와 비교한 HTML (추가는 <ins>, 삭제는 <del>)과 글자 기준 일치율
+
+    줄 단위로 먼저 맞춘 뒤 바뀐 줄끼리만 어절 단위로 비교 (긴 지문도 비교 비용이 바뀐 줄 크기에 비례)
+    """
+    a_lines, b_lines = base.split("\n"), other.split("\n")
+    matcher = difflib.SequenceMatcher(None, a_lines, b_lines, autojunk=False)
+    lines = []
+    matched = 0
+    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        if op == 'equal':
+            for line in b_lines[j1:j2]:
+                lines.append(_escape(line))
+                matched += len(line)
+            continue
+        # 바뀐 줄은 순서대로 짝지어 비교하고, 짝이 없는 줄은 줄 전체를 삭제/추가로 표시
+        pairs = min(i2 - i1, j2 - j1) if op == 'replace' else 0
+        for k in range(pairs):
+            line_html, line_matched = _diff_words(a_lines[i1 + k], b_lines[j1 + k])
+            lines.append(line_html)
+            matched += line_matched
+        lines.extend(f"<del class='diff-del'>{_escape(line)}</del>" for line in a_lines[i1 + pairs:i2])
+        lines.extend(f"<ins class='diff-ins'>{_escape(line)}</ins>" for line in b_lines[j1 + pairs:j2])
+    total = len(base) + len(other)
+    return "<br/>".join(lines), 2 * matched / total if total else 1.0
+
+
+def _field_html(base: Optional[str], text: str) -> str:
+    """필드 하나 (기준 값이 있으면 차이 표시)"""
+    if base is None:
+        return _escape(text)
+    return diff_html(base, text)[0]
+
+
+def build_compared_question_html(base: Optional[Question], q: Optional[Question], number: int) -> str:
+    """비교 열 하나의 문항 HTML (발문, <보기>, 선지, 정답, 선지별 해설 - 기준 열은 base=None)"""
+    if q is None:
+        return f"<div class='question-font question-block pending-block'>{number}번 문항 없음</div>"
+
+    parts = [
+        "<div class='question-font question-block'>",
+        f"<div class='q-header'>{number}. {_field_html(base and base.text, q.text)}</div>",
+    ]
+    if q.material or (base is not None and base.material):
+        parts.append(f"<div class='q-material'><div class='passage-font'>{_field_html(base and base.material, q.material)}</div></div>")
+    parts.append("<div class='q-choices'>")
+    parts.extend(
+        f"<p>{NUM_TO_SYMBOL[i]} {_field_html(base and base.choices[i - 1], choice)}</p>"
+        for i, choice in enumerate(q.choices, 1)
+    )
+    parts.append("</div>")
+    answer = q.answer_symbol
+    if base is not None and q.answer != base.answer:
+        answer = f"<ins class='diff-ins'>{answer}</ins>"
+    parts.append(f"<p><strong>정답. {answer}</strong></p>")
+    parts.extend(
+        f"<p class='explanation-item'>{NUM_TO_SYMBOL[i]} {_field_html(base and base.explanations[i - 1], explanation)}</p>"
+        for i, explanation in enumerate(q.explanations, 1)
+    )
+    parts.append("</div>")
+    return "".join(parts)
+
+
+class Comparison:
+    """결과 조합 하나의 비교 (첫 번째 결과가 기준)
+
+    지문 차이는 생성 시 계산하고, 문항별 차이는 처음 조회할 때 계산하여 보관
+    """
+    __slots__ = ("filenames", "subjects", "passage_html", "passage_ratios", "question_numbers", "_questions", "_question_html")
+
+    def __init__(self, filenames: Sequence[str], results: Sequence[GenerationResult]):
+        self.filenames = tuple(filenames)
+        self.subjects = [result.subject for result in results]
+        base = results[0].passage
+        self.passage_html = [f"<div class='passage-font'>{_escape(base)}</div>"]
+        self.passage_ratios = [1.0]
+        for result in results[1:]:
+            passage, ratio = diff_html(base, result.passage)
+            self.passage_html.append(f"<div class='passage-font'>{passage}</div>")
+            self.passage_ratios.append(ratio)
+        self._questions: List[Dict[int, Question]] = [{q.number: q for q in result.questions} for result in results]
+        self.question_numbers = sorted(set().union(*self._questions))
+        self._question_html: Dict[int, List[str]] = {}
+
+    def question_html(self, number: int) -> List[str]:
+        """문항 번호 하나의 열별 HTML"""
+        columns = self._question_html.get(number)
+        if columns is None:
+            base = self._questions[0].get(number)
+            columns = [build_compared_question_html(None, base, number)]
+            columns.extend(
+                build_compared_question_html(base, questions.get(number), number) for questions in self._questions[1:]
+            )
+            self._question_html[number] = columns
+        return columns
+
+
+class CompareCache:
+    """결과 조합(파일명 순서 포함)별 비교 메모이제이션 (프로세스 공유)
+
+    저장된 결과는 파일명별로 바뀌지 않으므로 파일명 조합을 키로 사용하고, 캐시에 있으면 문서도 다시 가져오지 않음
+    """
+
+    def __init__(self, max_entries: int = 16):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[Tuple[str, ...], Comparison]" = OrderedDict()
+
+    def get(self, filenames: Sequence[str], load_all: Callable[[Sequence[str]], List[GenerationResult]]) -> Comparison:
+        """비교 조회 (없으면 load_all로 문서를 가져와 생성)"""
+        key = tuple(filenames)
+        with self._lock:
+            comparison = self._items.get(key)
+            if comparison is not None:
+                self._items.move_to_end(key)
+                return comparison
+
+        comparison = Comparison(key, load_all(key))
+        with self._lock:
+            self._items[key] = comparison
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+        return comparison
+
+    def evict(self, filename: str):
+        """파일이 포함된 비교 제거 (삭제 시)"""
+        with self._lock:
+            for key in [key for key in self._items if filename in key]:
+                del self._items[key]
@@ -0,0 +1,239 @@
+"""
+상호작용별 서버 비용 측정
+실제 Streamlit 서버를 띄우고 브라우저처럼 웹소켓으로 재실행 요청(BackMsg)을 보내
+상호작용마다 재실행 완료까지의 서버 시간과 웹소켓으로 받은 바이트 수를 측정
+(위젯이 프래그먼트 안에 있으면 브라우저와 같이 그 프래그먼트만 재실행 요청)
+
+    python dev/bench_interactions.py --repeat 5
+    python dev/bench_interactions.py --json > after.json
+"""
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "dev"))
+
+import mock_backend  # noqa: E402
+from streamlit.proto.BackMsg_pb2 import BackMsg  # noqa: E402
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg  # noqa: E402
+from tornado.websocket import websocket_connect  # noqa: E402
+
+# 측정하는 상호작용 (보고 순서)
+INTERACTIONS = ["load", "select_row", "next_page", "filter_subject", "viewer_export", "explanations"]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class Widget:
+    """렌더링된 위젯 하나 (웹소켓 메시지에서 추출)"""
+    __slots__ = ("id", "label", "fragment_id")
+
+    def __init__(self, id: str, label: str, fragment_id: str):
+        self.id = id
+        self.label = label
+        self.fragment_id = fragment_id
+
+
+class BrowserClient:
+    """재실행 요청을 보내고 결과 메시지를 받는 최소한의 브라우저 흉내
+
+    - 위젯 값(표 선택, 입력값)은 브라우저처럼 이후 요청에도 계속 보내고, 버튼 trigger는 한 번만 보냄
+    - 화면의 위젯은 delta 경로별로 최신 메시지를 보관 (프래그먼트 재실행은 해당 경로만 갱신)
+    - 브라우저처럼 받은 큰 메시지의 해시를 보내 서버가 같은 메시지를 참조(ref_hash)로만 보내게 함
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self.conn = None
+        self.widgets = {}  # delta 경로 -> Widget
+        self.values = {}   # 위젯 ID -> (값 종류, 값)
+        self.exceptions = []  # 앱에서 발생한 예외 메시지
+        self.cached_hashes = set()  # 브라우저 메시지 캐시에 있는 메시지 해시
+
+    async def connect(self):
+        self.conn = await websocket_connect(self.url, max_message_size=256 * 1024 * 1024)
+
+    def find(self, key: str = None, label: str = None) -> Widget:
+        """key(위젯 ID 끝부분) 또는 레이블로 위젯 찾기 (가장 최근에 그려진 것)"""
+        for widget in reversed(list(self.widgets.values())):
+            if key is not None and widget.id.endswith(f"-{key}"):
+                return widget
+            if label is not None and widget.label == label:
+                return widget
+        raise KeyError(key or label)
+
+    def set_value(self, widget: Widget, kind: str, value):
+        self.values[widget.id] = (kind, value)
+
+    async def rerun(self, trigger: Widget = None, fragment: Widget = None) -> dict:
+        """재실행 요청 후 실행이 끝날 때까지 받은 메시지 집계 (서버 시간, 바이트 수, 메시지 수)"""
+        msg = BackMsg()
+        state = msg.rerun_script
+        state.query_string = ""
+        state.cached_message_hashes.extend(self.cached_hashes)
+        for widget_id, (kind, value) in self.values.items():
+            widget_state = state.widget_states.widgets.add()
+            widget_state.id = widget_id
+            setattr(widget_state, kind, value)
+        if trigger is not None:
+            widget_state = state.widget_states.widgets.add()
+            widget_state.id = trigger.id
+            widget_state.trigger_value = True
+        target = trigger or fragment
+        if target is not None and target.fragment_id:
+            state.fragment_id = target.fragment_id
+
+        start = time.perf_counter()
+        await self.conn.write_message(msg.SerializeToString(), binary=True)
+        received = messages = 0
+        while True:
+            data = await self.conn.read_message()
+            if data is None:
+                raise ConnectionError("웹소켓 연결 종료")
+            received += len(data)
+            messages += 1
+            forward = ForwardMsg()
+            forward.ParseFromString(data)
+            if forward.metadata.cacheable:
+                self.cached_hashes.add(forward.hash)
+            if forward.WhichOneof("type") == "delta":
+                self._track(forward)
+            elif forward.WhichOneof("type") == "script_finished":
+                # st.rerun()으로 중단된 실행이면 이어지는 재실행까지 포함
+                if forward.script_finished == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    continue
+                return {"seconds": time.perf_counter() - start, "bytes": received, "messages": messages}
+
+    def _track(self, forward: ForwardMsg):
+        delta = forward.delta
+        if delta.WhichOneof("type") != "new_element":
+            return
+        element = delta.new_element
+        kind = element.WhichOneof("type")
+        if kind == "exception":
+            self.exceptions.append(element.exception.message)
+        inner = getattr(element, kind)
+        widget_id = getattr(inner, "id", "") if kind != "markdown" else ""
+        path = tuple(forward.metadata.delta_path)
+        self.widgets.pop(path, None)
+        if widget_id:
+            self.widgets[path] = Widget(widget_id, getattr(inner, "label", ""), delta.fragment_id)
+
+
+async def measure(url: str, repeat: int) -> dict:
+    """상호작용별 측정 (매 반복마다 새 세션)"""
+    results = {name: [] for name in ["first_paint"] + INTERACTIONS}
+    for _ in range(repeat):
+        client = BrowserClient(url)
+        await client.connect()
+        results["first_paint"].append(await client.rerun())
+
+        # 결과 불러오기 (행 선택 후 불러오기 버튼)
+        table = client.find(key="outputs_table")
+        client.set_value(table, "string_value", json.dumps({"selection": {"rows": [1], "columns": []}}))
+        await client.rerun(fragment=table)
+        results["load"].append(await client.rerun(trigger=client.find(label="불러오기")))
+
+        # 결과를 보는 중의 목록 조작 (뷰어는 그대로)
+        table = client.find(key="outputs_table")
+        client.set_value(table, "string_value", json.dumps({"selection": {"rows": [0], "columns": []}}))
+        results["select_row"].append(await client.rerun(fragment=table))
+
+        client.values.pop(table.id, None)  # 페이지를 넘기면 표 선택은 해제됨
+        results["next_page"].append(await client.rerun(trigger=client.find(key="outputs_next")))
+
+        subject = client.find(key="outputs_filter_subject")
+        client.set_value(subject, "string_value", "이데아")
+        results["filter_subject"].append(await client.rerun(fragment=subject))
+        client.set_value(subject, "string_value", "")
+        await client.rerun(fragment=subject)
+
+        results["viewer_export"].append(await client.rerun(trigger=client.find(key="viewer_export")))
+
+        # 해설 탭 열기 (선택지 인덱스)
+        tab = client.find(key="viewer_tab")
+        client.set_value(tab, "int_value", 1)
+        results["explanations"].append(await client.rerun(fragment=tab))
+        client.set_value(tab, "int_value", 0)
+        await client.rerun(fragment=tab)
+        client.conn.close()
+        if client.exceptions:
+            raise RuntimeError(f"앱 실행 중 예외: {client.exceptions[0]}")
+    return {
+        name: {
+            "count": len(runs),
+            "server_ms": statistics.median(run["seconds"] for run in runs) * 1000,
+            "bytes": statistics.median(run["bytes"] for run in runs),
+            "messages": statistics.median(run["messages"] for run in runs),
+        }
+        for name, runs in results.items()
+    }
+
+
+def wait_healthy(port: int, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            time.sleep(0.2)
+    raise TimeoutError("Streamlit 서버가 시작되지 않았습니다.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="상호작용별 서버 비용 측정")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (중앙값 사용)")
+    parser.add_argument("--files", type=int, default=200, help="스텁 백엔드의 저장된 결과 개수")
+    parser.add_argument("--payload-kb", type=int, default=0, help="결과 문서 크기 (KB)")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    backend = mock_backend.make_server(port=0, files=args.files, payload_kb=args.payload_kb)
+    threading.Thread(target=backend.serve_forever, daemon=True).start()
+
+    port = free_port()
+    with tempfile.TemporaryDirectory() as tmp:
+        secrets = Path(tmp) / "secrets.toml"
+        secrets.write_text(f'BACKEND_URL = "http://127.0.0.1:{backend.server_address[1]}"\n', encoding="utf-8")
+        server = subprocess.Popen(
+            [
+                sys.executable, "-m", "streamlit", "run", "app.py",
+                "--server.headless", "true", "--server.port", str(port),
+                "--browser.gatherUsageStats", "false", f"--secrets.files={secrets}",
+            ],
+            cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            wait_healthy(port)
+            report = asyncio.run(measure(f"ws://127.0.0.1:{port}/_stcore/stream", args.repeat))
+        finally:
+            server.terminate()
+            server.wait()
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+    print(f"상호작용별 서버 비용 (중앙값, {args.repeat}회)")
+    print(f"  {'상호작용':<16} {'서버 ms':>9} {'수신 bytes':>12} {'메시지':>8}")
+    for name, stats in report.items():
+        print(f"  {name:<16} {stats['server_ms']:>9.1f} {stats['bytes']:>12,.0f} {stats['messages']:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""
+부하 측정
+스텁 백엔드(dev/mock_backend.py)를 띄우고 AppTest 세션 N개를 동시에 목록 → 불러오기 → 생성 흐름으로 진행하여
+단계별 재실행 지연(대기 + 스크립트 실행), 세션당 메모리, 백엔드 요청 수를 보고
+- 세션들은 한 프로세스에서 cache_resource 자원(백엔드 클라이언트, 캐시, 작업 레지스트리)을 공유하므로 앱 인스턴스 하나의 수용량을 측정
+- AppTest는 여러 스레드에서 동시에 실행할 수 없으므로 한 스레드가 다음 실행 시각이 된 세션부터 번갈아 실행
+  (스크립트 실행이 GIL에 묶이는 실제 서버와 비슷하게, 다른 세션 실행을 기다린 시간이 지연에 포함됨)
+
+    python dev/bench_load.py --sessions 20
+    python dev/bench_load.py --sessions 50 --ramp 0.2 --payload-kb 64 --event-delay 0.5 --json
+"""
+import argparse
+import heapq
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "dev"))
+
+import mock_backend  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+from streamlit.util import AttributeDictionary  # noqa: E402
+
+# 측정 단계 (보고 순서)
+STEPS = ["first_paint", "select", "load", "open_dialog", "submit", "poll", "rerun"]
+
+# 값을 가진 위젯 종류 (AppTest 요소 목록 이름)
+WIDGET_KINDS = [
+    "selectbox", "radio", "text_input", "number_input", "slider", "checkbox", "multiselect", "select_slider", "toggle",
+]
+
+
+def rss_bytes() -> int:
+    """현재 프로세스 RSS (Linux /proc, 그 외에는 최대 RSS)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def percentile(values: list, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+class Session:
+    """AppTest로 흉내 낸 사용자 세션 하나
+
+    flow()는 스크립트를 한 번 실행할 때마다 다음 실행 가능 시각을 yield (스케줄러가 시각 순으로 진행)
+    단계별로 스크립트 실행 시간(run_times)과 실행 가능 시각부터 실행이 끝날 때까지의 지연(latencies)을 기록
+    """
+
+    def __init__(self, index: int, backend_url: str, args):
+        self.index = index
+        self.args = args
+        self.run_times = {step: [] for step in STEPS}
+        self.latencies = {step: [] for step in STEPS}
+        self.errors = []
+        self.generate_seconds = None
+        self.ready_at = 0.0
+        self.at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=args.timeout)
+        self.at.secrets["BACKEND_URL"] = backend_url
+
+    def _run(self, step: str):
+        start = time.perf_counter()
+        self.at.run()
+        end = time.perf_counter()
+        self.run_times[step].append(end - start)
+        self.latencies[step].append(end - min(self.ready_at, start))
+        if self.at.exception:
+            self.errors.append(f"{step}: {self.at.exception[0].message}")
+
+    def _button(self, label: str):
+        return next(button for button in self.at.button if button.label == label)
+
+    def flow(self):
+        """목록 → 행 선택 → 불러오기 → 생성 → 완료까지 진행 현황 갱신 → 재실행"""
+        args = self.args
+        self._run("first_paint")
+        yield time.perf_counter() + args.think
+
+        # 표 행 선택과 불러오기 (AppTest는 표 선택을 다음 실행까지 유지하지 않으므로 같은 실행에 함께 전달)
+        row = self.index % max(1, min(args.files, 50))
+        self.at.session_state["outputs_table"] = AttributeDictionary(
+            {"selection": AttributeDictionary({"rows": [row], "columns": [], "cells": []})}
+        )
+        self._run("select")
+        yield time.perf_counter()
+        self.at.session_state["outputs_table"] = AttributeDictionary(
+            {"selection": AttributeDictionary({"rows": [row], "columns": [], "cells": []})}
+        )
+        self._button("불러오기").click()
+        self._run("load")
+        yield time.perf_counter() + args.think
+
+        if args.no_generate:
+            self._run("rerun")
+            return
+
+        # 세션마다 다른 주제로 생성 (--same-input이면 모두 같은 설정 - 진행 중인 작업 공유 확인)
+        if not args.same_input:
+            self.at.session_state["dialog_subject_mode"] = "수동"
+            self.at.session_state["dialog_subject_input"] = f"부하 측정 {self.index}"
+        self.at.button(key="open_dialog").click()
+        self._run("open_dialog")
+        yield time.perf_counter() + args.think
+        # AppTest는 닫힌 다이얼로그의 위젯을 요소 목록에 남겨 두므로 값을 세션 상태에 유지해야 다음 실행이 가능
+        dialog_state = {
+            widget.key: widget.value
+            for kind in WIDGET_KINDS for widget in getattr(self.at, kind)
+            if widget.key and widget.key.startswith("dialog_")
+        }
+        self.at.button(key="open_dialog").click()
+        self.at.button(key="dialog_submit").click()
+        started = time.perf_counter()
+        self._run("submit")
+        for key, value in dialog_state.items():
+            self.at.session_state[key] = value
+
+        # 브라우저의 진행 현황 프래그먼트 갱신 간격으로 재실행
+        deadline = started + args.generate_timeout
+        while self.at.session_state["active_job_id"] and time.perf_counter() < deadline:
+            yield time.perf_counter() + args.poll_interval
+            self._run("poll")
+        if self.at.session_state["active_job_id"]:
+            self.errors.append("generate: 시간 초과")
+        else:
+            self.generate_seconds = time.perf_counter() - started
+        yield time.perf_counter() + args.think
+        self._run("rerun")
+
+
+def drive(sessions: list, ramp: float):
+    """세션 흐름을 한 스레드에서 실행 가능 시각 순으로 번갈아 진행 (세션 i는 i × ramp초 뒤 시작)"""
+    start = time.perf_counter()
+    queue = [(start + i * ramp, i, session.flow()) for i, session in enumerate(sessions)]
+    heapq.heapify(queue)
+    while queue:
+        ready_at, i, flow = heapq.heappop(queue)
+        delay = ready_at - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        session = sessions[i]
+        session.ready_at = ready_at
+        try:
+            next_at = next(flow)
+        except StopIteration:
+            continue
+        except Exception as e:
+            session.errors.append(f"{type(e).__name__}: {e}")
+            continue
+        heapq.heappush(queue, (next_at, i, flow))
+
+
+def summarize(values: list) -> dict:
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "p50_ms": statistics.median(values) * 1000,
+        "p95_ms": percentile(values, 0.95) * 1000,
+        "max_ms": max(values) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KSAT 프론트엔드 부하 측정")
+    parser.add_argument("--sessions", type=int, default=10, help="세션 수")
+    parser.add_argument("--ramp", type=float, default=0.0, help="세션 시작 간격 (초, 0이면 모두 함께 시작)")
+    parser.add_argument("--files", type=int, default=200, help="스텁 백엔드의 저장된 결과 개수")
+    parser.add_argument("--payload-kb", type=int, default=0, help="결과 문서 크기 (KB)")
+    parser.add_argument("--event-delay", type=float, default=0.2, help="생성 스트림 이벤트 간격 (초)")
+    parser.add_argument("--event-jitter", type=float, default=0.0, help="이벤트 간격 변동 비율")
+    parser.add_argument("--poll-interval", type=float, default=0.5, help="생성 중 재실행 간격 (초)")
+    parser.add_argument("--think", type=float, default=0.0, help="단계 사이 대기 (초)")
+    parser.add_argument("--same-input", action="store_true", help="모든 세션이 같은 설정으로 생성")
+    parser.add_argument("--no-generate", action="store_true", help="목록/불러오기만 측정")
+    parser.add_argument("--generate-timeout", type=float, default=120.0, help="생성 완료 대기 한도 (초)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="스크립트 실행 한 번의 한도 (초)")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    server = mock_backend.make_server(
+        port=0, files=args.files, payload_kb=args.payload_kb,
+        event_delay=args.event_delay, event_jitter=args.event_jitter,
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    backend_url = "http://127.0.0.1:%d" % server.server_address[1]
+
+    # 첫 세션은 import와 공유 자원 생성이 포함되므로 따로 측정하고 기준 메모리에서 제외
+    warmup = Session(-1, backend_url, args)
+    start = time.perf_counter()
+    warmup.at.run()
+    cold_start = time.perf_counter() - start
+    with server.requests_lock:
+        server.requests.clear()
+    baseline = rss_bytes()
+
+    sessions = [Session(i, backend_url, args) for i in range(args.sessions)]
+    start = time.perf_counter()
+    drive(sessions, args.ramp)
+    elapsed = time.perf_counter() - start
+    # 세션 객체(세션 상태 포함)를 유지한 채로 측정
+    after = rss_bytes()
+
+    with server.requests_lock:
+        requests = dict(server.requests)
+    generate_seconds = [s.generate_seconds for s in sessions if s.generate_seconds is not None]
+    busy = sum(t for s in sessions for times in s.run_times.values() for t in times)
+    runs = sum(len(times) for s in sessions for times in s.run_times.values())
+    report = {
+        "sessions": args.sessions,
+        "elapsed_s": elapsed,
+        "cold_start_ms": cold_start * 1000,
+        "runs": runs,
+        "runs_per_s": runs / busy if busy else 0.0,  # 스크립트 실행만으로 처리할 수 있는 최대 재실행 수
+        "utilization": busy / elapsed if elapsed else 0.0,
+        "latency": {step: summarize([t for s in sessions for t in s.latencies[step]]) for step in STEPS},
+        "run": {step: summarize([t for s in sessions for t in s.run_times[step]]) for step in STEPS},
+        "generate": summarize(generate_seconds),
+        "memory": {
+            "baseline_mb": baseline / 1e6,
+            "after_mb": after / 1e6,
+            "per_session_kb": (after - baseline) / max(1, args.sessions) / 1e3,
+        },
+        "backend_requests": requests,
+        "backend_requests_per_session": sum(requests.values()) / max(1, args.sessions),
+        "errors": [f"session {s.index}: {error}" for s in sessions for error in s.errors],
+    }
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+
+    print(f"세션 {report['sessions']}개, 전체 {elapsed:.1f}초, 첫 세션 시작 {report['cold_start_ms']:.0f} ms")
+    print(f"스크립트 실행 {runs}회, 실행 스레드 사용률 {report['utilization']:.0%}, 최대 처리량 {report['runs_per_s']:.1f}회/초")
+    print("재실행 지연 = 대기 + 실행 (ms)")
+    print(f"  {'단계':<12} {'횟수':>6} {'p50':>8} {'p95':>8} {'최대':>8} {'실행 p50':>10}")
+    for step in STEPS:
+        stats, run = report["latency"][step], report["run"][step]
+        if stats["count"]:
+            print(
+                f"  {step:<12} {stats['count']:>6} {stats['p50_ms']:>8.1f} {stats['p95_ms']:>8.1f} "
+                f"{stats['max_ms']:>8.1f} {run['p50_ms']:>10.1f}"
+            )
+    if generate_seconds:
+        stats = report["generate"]
+        print(f"생성 완료까지 (초): p50 {stats['p50_ms'] / 1000:.2f}, p95 {stats['p95_ms'] / 1000:.2f}, 최대 {stats['max_ms'] / 1000:.2f}")
+    memory = report["memory"]
+    print(f"메모리: 기준 {memory['baseline_mb']:.0f} MB → {memory['after_mb']:.0f} MB, 세션당 {memory['per_session_kb']:.0f} KB")
+    print(f"백엔드 요청 (세션당 {report['backend_requests_per_session']:.1f}건)")
+    for route, count in sorted(requests.items()):
+        print(f"  {route:<36} {count:>6}")
+    if report["errors"]:
+        print(f"오류 {len(report['errors'])}건")
+        for error in report["errors"][:20]:
+            print(f"  {error}")
+
+
+if __name__ == "__main__":
+    main()
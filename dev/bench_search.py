@@ -0,0 +1,98 @@
+"""
+전문 검색 / 유사 지문 탐지 성능 측정
+임시 로컬 저장소에 가짜 결과를 채운 뒤 색인 시간, 검색어별 응답 시간, 유사 지문 조회 시간을 측정
+
+    python dev/bench_search.py --sets 20000
+"""
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from local_store import LocalStore  # noqa: E402
+
+SUBJECTS = ["플라톤의 이데아론", "계약의 해제", "통화 정책", "양자 얽힘", "칸트의 정언명령", "행정 행위", "반도체 공정"]
+SUBJECT_WORDS = [word for subject in SUBJECTS for word in subject.split()]
+QUERIES = ["이데아", "정언명령", "계약 해제", "통화", "반도체 공정", "얽힘", "없는검색어"]
+
+
+def random_sentence(rng: random.Random, words: int) -> str:
+    """무작위 음절로 만든 문장 (주제어를 가끔 섞음)"""
+    parts = []
+    for _ in range(words):
+        if rng.random() < 0.05:
+            parts.append(rng.choice(SUBJECT_WORDS))
+        else:
+            parts.append("".join(chr(0xAC00 + rng.randrange(11172)) for _ in range(rng.randint(1, 4))))
+    return " ".join(parts) + "."
+
+
+def make_document(rng: random.Random, index: int) -> dict:
+    subject = SUBJECTS[index % len(SUBJECTS)]
+    return {
+        "card": {"subject": subject},
+        "passage": {"passage": "\n".join(random_sentence(rng, 60) for _ in range(5))},
+        "questions": [
+            {
+                "question_number": q,
+                "question": random_sentence(rng, 10),
+                "answer": "③",
+                **{f"choices_{c}": random_sentence(rng, 12) for c in range(1, 6)},
+                **{f"explanation_{c}": random_sentence(rng, 20) for c in range(1, 6)},
+            }
+            for q in range(1, 4)
+        ],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="전문 검색 성능 측정")
+    parser.add_argument("--sets", type=int, default=20000, help="저장소에 넣을 결과 수")
+    parser.add_argument("--repeat", type=int, default=20, help="검색어별 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = LocalStore(str(Path(tmp) / "bench.sqlite3"))
+        metas = [
+            {"filename": f"output_{i:06d}.json", "생성일자": f"2025-01-01 {i % 24:02d}:00",
+             "대분야": "인문예술", "주제": SUBJECTS[i % len(SUBJECTS)], "문항 수": 3}
+            for i in range(args.sets)
+        ]
+        store.upsert_meta(metas)
+
+        start = time.perf_counter()
+        for i, meta in enumerate(metas):
+            store.put_document(meta["filename"], make_document(rng, i))
+        elapsed = time.perf_counter() - start
+        size = (Path(tmp) / "bench.sqlite3").stat().st_size
+        print(f"저장 + 색인: {args.sets}개, {elapsed:.1f}초 ({elapsed / args.sets * 1000:.2f} ms/개), DB {size / 1e6:.0f} MB")
+
+        print("검색 (중앙값 / 최대, ms)")
+        for query in QUERIES:
+            timings = []
+            for _ in range(args.repeat):
+                t = time.perf_counter()
+                hits = store.search(query, limit=20)
+                timings.append((time.perf_counter() - t) * 1000)
+            print(f"  {query:<10} {statistics.median(timings):7.1f} / {max(timings):7.1f}  ({len(hits)}건)")
+
+        # 새 결과 하나(저장소와 같은 생성기)의 유사 지문 조회
+        timings = []
+        for i in range(args.repeat):
+            document = make_document(rng, args.sets + i)
+            t = time.perf_counter()
+            store.similar_passages(document)
+            timings.append((time.perf_counter() - t) * 1000)
+        print(f"유사 지문 조회 (중앙값 / 최대, ms): {statistics.median(timings):.1f} / {max(timings):.1f}")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+시작 비용 측정
+새 프로세스에서 모듈 import 시간과 첫 화면(첫 스크립트 실행), 재실행 시간, 실행당 markdown 전송량을 측정
+(저장소 루트에서 실행하므로 .streamlit/config.toml 설정이 적용됨)
+
+    python dev/bench_startup.py --repeat 5
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 앱이 시작 시 import하는 모듈
+APP_MODULES = ["streamlit", "assets", "backend_client", "caches", "jobs", "progress_view", "rendering", "timing"]
+
+_IMPORT_PROBE = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+timings = {{}}
+start = time.perf_counter()
+for name in {modules!r}:
+    t = time.perf_counter()
+    __import__(name)
+    timings[name] = time.perf_counter() - t
+timings["total"] = time.perf_counter() - start
+timings["pandas_loaded"] = "pandas" in sys.modules
+print(json.dumps(timings))
+"""
+
+_PAINT_PROBE = """
+import json, sys, threading, time
+sys.path.insert(0, {root!r})
+sys.path.insert(0, {dev!r})
+import mock_backend
+server = mock_backend.make_server(port=0, files={files})
+threading.Thread(target=server.serve_forever, daemon=True).start()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=60)
+at.secrets["BACKEND_URL"] = "http://127.0.0.1:%d" % server.server_address[1]
+t = time.perf_counter()
+at.run()
+first = time.perf_counter() - t
+assert not at.exception, at.exception
+reruns = []
+for _ in range({reruns}):
+    t = time.perf_counter()
+    at.run()
+    reruns.append(time.perf_counter() - t)
+markdown_bytes = sum(len(element.value.encode("utf-8")) for element in at.markdown)
+print(json.dumps({{"first_paint": first, "rerun": reruns, "markdown_bytes": markdown_bytes}}))
+"""
+
+
+def run_probe(source: str) -> dict:
+    """새 인터프리터에서 측정 코드 실행 (마지막 출력 줄의 JSON 반환)"""
+    output = subprocess.run(
+        [sys.executable, "-c", source], cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure_imports(repeat: int) -> dict:
+    runs = [run_probe(_IMPORT_PROBE.format(root=str(ROOT), modules=APP_MODULES)) for _ in range(repeat)]
+    result = {name: statistics.median(run[name] for run in runs) for name in APP_MODULES + ["total"]}
+    result["pandas_loaded"] = runs[-1]["pandas_loaded"]
+    return result
+
+
+def measure_paint(repeat: int, files: int, reruns: int) -> dict:
+    source = _PAINT_PROBE.format(
+        root=str(ROOT), dev=str(ROOT / "dev"), app=str(ROOT / "app.py"), files=files, reruns=reruns,
+    )
+    runs = [run_probe(source) for _ in range(repeat)]
+    return {
+        "first_paint": statistics.median(run["first_paint"] for run in runs),
+        "rerun": statistics.median(value for run in runs for value in run["rerun"]),
+        "markdown_bytes": runs[-1]["markdown_bytes"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KSAT 프론트엔드 시작 비용 측정")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--files", type=int, default=200, help="스텁 백엔드의 저장된 결과 개수")
+    parser.add_argument("--reruns", type=int, default=5, help="첫 실행 이후 재실행 횟수")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    report = {
+        "imports": measure_imports(args.repeat),
+        "paint": measure_paint(args.repeat, args.files, args.reruns),
+    }
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+
+    print("모듈 import (중앙값, ms)")
+    for name in APP_MODULES + ["total"]:
+        print(f"  {name:<16} {report['imports'][name] * 1000:8.1f}")
+    print(f"  pandas 로드 여부: {report['imports']['pandas_loaded']}")
+    print("스크립트 실행 (중앙값, ms)")
+    print(f"  첫 화면         {report['paint']['first_paint'] * 1000:8.1f}")
+    print(f"  재실행          {report['paint']['rerun'] * 1000:8.1f}")
+    print(f"실행당 markdown 전송량: {report['paint']['markdown_bytes']:,} bytes")
+
+
+if __name__ == "__main__":
+    main()
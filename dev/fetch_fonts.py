@@ -0,0 +1,35 @@
+"""
+Nanum Myeongjo 폰트 내려받기
+google/fonts 저장소의 TTF 파일을 static/fonts/에 저장 (SIL Open Font License)
+
+    python dev/fetch_fonts.py
+"""
+import sys
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from assets import FONT_FILES, STATIC_DIR  # noqa: E402
+
+BASE_URL = "https://github.com/google/fonts/raw/main/ofl/nanummyeongjo"
+LICENSE_FILE = "OFL.txt"
+
+
+def fetch(name: str, target: Path):
+    response = requests.get(f"{BASE_URL}/{name}", timeout=(3.05, 60))
+    response.raise_for_status()
+    target.write_bytes(response.content)
+    print(f"{target} ({len(response.content) // 1024} KB)")
+
+
+def main():
+    font_dir = STATIC_DIR / "fonts"
+    font_dir.mkdir(parents=True, exist_ok=True)
+    for name in [name for name, _ in FONT_FILES] + [LICENSE_FILE]:
+        fetch(name, font_dir / name)
+
+
+if __name__ == "__main__":
+    main()
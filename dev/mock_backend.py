@@ -0,0 +1,429 @@
+"""
+로컬 개발용 KSAT 백엔드 스텁
+프론트엔드가 호출하는 API를 표준 라이브러리만으로 흉내 냄
+생성 스트림은 단계 완료 이벤트에 부분 결과(data)를 붙여 보내고, --replay로 녹화한 스트림을 재생할 수 있음
+이벤트마다 id를 붙이며 Last-Event-ID로 재연결하면 다음 이벤트부터 이어서 전송
+같은 Idempotency-Key로 진행 중인 생성이 있으면 그 실행에 연결하고, /api/generate/cancel로 중단
+엔드포인트별 요청 수를 server.requests에 집계 (dev/bench_load.py 부하 측정용)
+
+    python dev/mock_backend.py --port 8000 --files 3000
+    python dev/mock_backend.py --payload-kb 64 --event-delay 1 --event-jitter 0.5
+    python dev/mock_backend.py --replay streams/run.jsonl --replay-speed 4
+    python dev/mock_backend.py --heartbeat 5 --drop-after 3 --drops 2
+"""
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+FIELDS = ["인문예술", "법", "경제", "과학기술"]
+SUBJECTS = ["플라톤의 이데아론", "계약의 해제", "통화 정책", "양자 얽힘", "칸트의 정언명령", "행정 행위", "반도체 공정"]
+
+
+def load_recording(path: str) -> list:
+    """녹화한 스트림 ({"t": 시작 후 경과 초, "event": SSE 이벤트} JSON lines, dev/record_stream.py)"""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def make_result(index: int, num_questions: int = 3, payload_bytes: int = 0) -> dict:
+    """가짜 결과 문서 생성 (payload_bytes가 있으면 지문 문단을 늘려 직렬화 크기를 그 정도로 맞춤)"""
+    subject = SUBJECTS[index % len(SUBJECTS)]
+    result = {
+        "card": {"subject": subject},
+        "passage": {"passage": "\n".join(f"{subject}에 관한 {p}번째 문단입니다." for p in range(1, 6))},
+        "questions": [
+            {
+                "question_number": q,
+                "question_type": "보기형" if q == 1 else "내용일치형",
+                "question": "윗글의 내용과 일치하지 않는 것은?",
+                "material": "<보기> 자료" if q == 1 else "",
+                "answer": "③",
+                **{f"choices_{c}": f"{q}번 문항 {c}번 선지" for c in range(1, 6)},
+                **{f"explanation_{c}": f"{q}번 문항 {c}번 해설" for c in range(1, 6)},
+            }
+            for q in range(1, num_questions + 1)
+        ],
+    }
+    size = len(json.dumps(result, ensure_ascii=False).encode("utf-8"))
+    if payload_bytes > size:
+        paragraph = f"{subject}에 관한 내용을 자세히 설명하는 덧붙인 문단입니다. " * 4
+        count = (payload_bytes - size) // len(paragraph.encode("utf-8")) + 1
+        result["passage"]["passage"] += "".join("\n" + paragraph for _ in range(count))
+    return result
+
+
+class MockStore:
+    """메모리 내 결과 저장소"""
+
+    def __init__(self, num_files: int, payload_bytes: int = 0):
+        self.lock = threading.Lock()
+        self.version = 0
+        self.next_id = 0
+        self.files = {}
+        for i in range(num_files):
+            self.add(make_result(i, payload_bytes=payload_bytes), created=f"2025-{1 + i % 12:02d}-{1 + i % 28:02d} 12:00")
+
+    def add(self, result: dict, created: str = None) -> str:
+        with self.lock:
+            filename = f"output_{self.next_id:06d}.json"
+            self.next_id += 1
+            self.files[filename] = {
+                "meta": {
+                    "filename": filename,
+                    "생성일자": created or time.strftime("%Y-%m-%d %H:%M"),
+                    "대분야": FIELDS[len(self.files) % len(FIELDS)],
+                    "주제": result["card"]["subject"],
+                    "문항 수": len(result["questions"]),
+                },
+                "result": result,
+            }
+            self.version += 1
+            return filename
+
+    def delete(self, filename: str) -> bool:
+        with self.lock:
+            if self.files.pop(filename, None) is None:
+                return False
+            self.version += 1
+            return True
+
+    def update(self, filename: str, changes: dict):
+        """메타데이터 변경 (현재는 대분야만) - 변경된 메타데이터, 없는 파일이면 None"""
+        with self.lock:
+            entry = self.files.get(filename)
+            if entry is None:
+                return None
+            if changes.get("field"):
+                entry["meta"]["대분야"] = changes["field"]
+            entry["meta"]["수정일자"] = time.strftime("%Y-%m-%d %H:%M:%S")
+            self.version += 1
+            return dict(entry["meta"])
+
+    def query(self, params: dict) -> list:
+        """필터 적용 (최신순)"""
+        field = params.get("field")
+        subject = params.get("subject")
+        date_from = params.get("date_from")
+        date_to = params.get("date_to")
+        matched = []
+        for entry in self.files.values():
+            meta = entry["meta"]
+            created = meta["생성일자"][:10]
+            if field and meta["대분야"] != field:
+                continue
+            if subject and subject not in meta["주제"]:
+                continue
+            if date_from and created < date_from:
+                continue
+            if date_to and created > date_to:
+                continue
+            matched.append(meta)
+        matched.sort(key=lambda m: m["생성일자"], reverse=True)
+        return matched
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """API 핸들러 (server.store, server.options 사용)"""
+
+    protocol_version = "HTTP/1.1"
+    # 헤더와 본문을 따로 쓰므로 Nagle을 끄지 않으면 keep-alive 요청마다 delayed ACK(~40ms)만큼 지연됨
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        if self.server.options.verbose:
+            super().log_message(format, *args)
+
+    def _count(self, route: str):
+        """엔드포인트별 요청 수 집계"""
+        with self.server.requests_lock:
+            self.server.requests[route] += 1
+
+    def _send_json(self, obj, status: int = 200, headers: dict = None):
+        body = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_status(self, status: int, headers: dict = None):
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        store = self.server.store
+        if url.path == "/api/outputs":
+            params = {k: v[0] for k, v in parse_qs(url.query).items()}
+            etag = '"' + hashlib.sha1(f"{store.version}:{sorted(params.items())}".encode()).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == etag:
+                self._count("GET /api/outputs (304)")
+                return self._send_status(304, {"ETag": etag})
+            self._count("GET /api/outputs")
+            with store.lock:
+                matched = store.query(params)
+            if self.server.options.legacy:
+                return self._send_json({"files": matched}, headers={"ETag": etag})
+            offset = int(params.get("offset", 0))
+            limit = int(params.get("limit", 50))
+            return self._send_json(
+                {"files": matched[offset:offset + limit], "total": len(matched), "offset": offset, "limit": limit},
+                headers={"ETag": etag},
+            )
+        if url.path.startswith("/api/outputs/"):
+            self._count("GET /api/outputs/{filename}")
+            entry = store.files.get(unquote(url.path[len("/api/outputs/"):]))
+            if entry is None:
+                return self._send_json({"detail": "not found"}, 404)
+            return self._send_json(entry["result"])
+        self._send_json({"detail": "not found"}, 404)
+
+    def do_DELETE(self):
+        url = urlparse(self.path)
+        if url.path.startswith("/api/outputs/"):
+            self._count("DELETE /api/outputs/{filename}")
+            if self.server.store.delete(unquote(url.path[len("/api/outputs/"):])):
+                return self._send_json({"status": "deleted"})
+        self._send_json({"detail": "not found"}, 404)
+
+    def do_PATCH(self):
+        url = urlparse(self.path)
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        if url.path.startswith("/api/outputs/"):
+            self._count("PATCH /api/outputs/{filename}")
+            meta = self.server.store.update(unquote(url.path[len("/api/outputs/"):]), body)
+            if meta is not None:
+                return self._send_json(meta)
+        self._send_json({"detail": "not found"}, 404)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        if url.path == "/api/generate/stream":
+            job_id = self.headers.get("X-Job-ID")
+            last_event_id = self.headers.get("Last-Event-ID")
+            self._count("POST /api/generate/stream" + (" (resume)" if last_event_id else ""))
+            if last_event_id:
+                # 이어 받기: 같은 실행의 다음 이벤트부터 전송
+                run, seq = self.server.runs.resume(last_event_id)
+                if run is None:
+                    return self._send_json({"detail": "unknown stream"}, 404)
+                return self._send_run(run, seq + 1, job_id)
+            key = self.headers.get("Idempotency-Key")
+            run = self.server.runs.find(key)
+            if run is not None:
+                return self._send_run(run, 0, job_id)  # 진행 중인 같은 생성에 연결 (처음 이벤트부터)
+            if self.server.recording is not None:
+                steps = replay_steps(self.server.recording, self.server.options.replay_speed)
+            else:
+                steps = generation_steps(body.get("user_input", {}), len(self.server.store.files), self.server.options)
+            return self._send_run(self.server.runs.create(steps, key), 0, job_id)
+        if url.path == "/api/generate/cancel":
+            self._count("POST /api/generate/cancel")
+            run = self.server.runs.find(body.get("idempotency_key"))
+            if run is None:
+                return self._send_json({"detail": "not found"}, 404)
+            # job_id가 있으면 그 작업만 분리 - 같은 생성에 연결된 다른 작업이 남아 있으면 계속 생성
+            with self.server.runs.lock:
+                run.jobs.discard(body.get("job_id"))
+                if not body.get("job_id") or not run.jobs:
+                    run.cancelled = True
+            return self._send_json({"status": "cancelled" if run.cancelled else "detached"})
+        self._send_json({"detail": "not found"}, 404)
+
+    def _write_event(self, data: dict, event_id: str = None):
+        head = f"id: {event_id}\n" if event_id else ""
+        self.wfile.write(f"{head}data: {json.dumps(data, ensure_ascii=False)}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+    def _start_stream(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+    def _wait(self, delay: float):
+        """이벤트 사이 대기 (--heartbeat 간격마다 주석 줄 전송)"""
+        heartbeat = self.server.options.heartbeat
+        deadline = time.monotonic() + delay
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if not heartbeat:
+                time.sleep(remaining)
+                return
+            time.sleep(min(heartbeat, remaining))
+            if deadline - time.monotonic() > 0:
+                self.wfile.write(b": ping\n\n")
+                self.wfile.flush()
+
+    def _send_run(self, run: "MockRun", start: int, job_id: str = None):
+        """실행의 start번째 이벤트부터 전송 (--drop-after: 처음 --drops번의 연결은 이벤트 N개 후 끊음)"""
+        options = self.server.options
+        with self.server.runs.lock:
+            run.connections += 1
+            if job_id:
+                run.jobs.add(job_id)
+            drop = options.drop_after if options.drop_after is not None and run.connections <= options.drops else None
+        self._start_stream()
+        try:
+            for seq in range(start, len(run.steps)):
+                delay, event = run.steps[seq]
+                self._wait(delay)
+                if run.cancelled:
+                    return  # 중단 요청 - 결과 저장 안 함
+                if drop is not None and seq - start >= drop:
+                    return  # 연결 끊김 흉내 (응답 본문 도중 종료)
+                if event.get("type") == "complete":
+                    with self.server.runs.lock:
+                        if run.filename is None:
+                            run.filename = self.server.store.add(event["result"])
+                    event = dict(event, filename=run.filename)
+                self._write_event(event, event_id=f"{run.run_id}:{seq}")
+            run.finished = True
+        except (BrokenPipeError, ConnectionResetError):
+            return  # 클라이언트가 끊은 경우 - 같은 실행은 Last-Event-ID로 이어 받을 수 있음
+
+
+class MockRun:
+    """생성 실행 하나 - (대기 초, 이벤트) 목록, 완료 결과는 처음 전송할 때 한 번만 저장"""
+
+    def __init__(self, run_id: str, steps: list, key: str = None):
+        self.run_id = run_id
+        self.steps = steps
+        self.key = key
+        self.filename = None
+        self.connections = 0
+        self.finished = False
+        self.cancelled = False
+        self.jobs = set()  # 연결한 작업 ID (X-Job-ID) - 모두 중단 요청해야 실행 중단
+
+
+class MockRuns:
+    """이어 받기/중복 요청 확인용 실행 보관 (이벤트 id: '실행 id:순번')"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.runs = {}
+        self.by_key = {}
+        self.next_id = 0
+
+    def create(self, steps: list, key: str = None) -> MockRun:
+        with self.lock:
+            self.next_id += 1
+            run = MockRun(f"run{self.next_id}", steps, key)
+            self.runs[run.run_id] = run
+            if key:
+                self.by_key[key] = run
+            return run
+
+    def find(self, key: str):
+        """Idempotency-Key가 같은 진행 중 실행"""
+        run = self.by_key.get(key) if key else None
+        return run if run is not None and not run.finished and not run.cancelled else None
+
+    def resume(self, last_event_id: str):
+        run_id, _, seq = last_event_id.partition(":")
+        run = self.runs.get(run_id)
+        if run is None or not seq.isdigit():
+            return None, None
+        return run, int(seq)
+
+
+def generation_steps(user_input: dict, index: int, options) -> list:
+    """가짜 생성 이벤트 목록 (단계 완료 이벤트에 부분 결과 포함, 보기형 문항 먼저)"""
+    questions = user_input.get("questions_input") or [{"question_number": 1}]
+    result = make_result(index, num_questions=len(questions), payload_bytes=options.payload_kb * 1024)
+    if user_input.get("subject_input"):
+        result["card"]["subject"] = user_input["subject_input"]
+
+    # 실제 백엔드처럼 보기형 문항을 먼저 생성 (문항 완료 순서가 번호 순이 아님)
+    ordered = sorted(questions, key=lambda q: q.get("question_type") != "보기형")
+    stages = [("card", None, result["card"]), ("passage", None, result["passage"])]
+    stages += [("question", q["question_number"], result["questions"][q["question_number"] - 1]) for q in ordered]
+    def delay() -> float:
+        # --event-jitter: 간격을 event_delay × (1 ± jitter) 범위에서 무작위로
+        return options.event_delay * (1 + random.uniform(-options.event_jitter, options.event_jitter))
+
+    steps = []
+    for step, number, payload in stages:
+        for status in ("start", "complete"):
+            event = {"type": "progress", "step": step, "status": status}
+            if number is not None:
+                event["question_number"] = number
+            if status == "complete":
+                event["data"] = payload
+            steps.append((delay() if steps else 0.0, event))
+    steps.append((delay(), {"type": "complete", "result": result}))
+    return steps
+
+
+def replay_steps(recording: list, speed: float) -> list:
+    """녹화한 스트림 → (대기 초, 이벤트) 목록 (녹화 당시 간격의 speed 배속)"""
+    steps, previous = [], 0.0
+    for record in recording:
+        t = record.get("t", 0.0)
+        steps.append((max(0.0, t - previous) / speed, record["event"]))
+        previous = t
+    return steps
+
+
+def make_server(host: str = "127.0.0.1", port: int = 8000, **options) -> ThreadingHTTPServer:
+    """스텁 서버 생성 (serve_forever는 호출 측에서 실행)"""
+    parser = build_parser()
+    args = parser.parse_args([])
+    for key, value in options.items():
+        setattr(args, key, value)
+    server = ThreadingHTTPServer((host, port), MockHandler)
+    server.daemon_threads = True
+    server.options = args
+    server.store = MockStore(args.files, payload_bytes=args.payload_kb * 1024)
+    server.requests = Counter()
+    server.requests_lock = threading.Lock()
+    server.recording = load_recording(args.replay) if args.replay else None
+    server.runs = MockRuns()
+    return server
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="KSAT 백엔드 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--files", type=int, default=200, help="초기 저장된 결과 개수")
+    parser.add_argument("--event-delay", type=float, default=0.5, help="SSE 이벤트 간격 (초)")
+    parser.add_argument("--event-jitter", type=float, default=0.0, help="이벤트 간격 변동 비율 (0.5면 ±50%%)")
+    parser.add_argument("--payload-kb", type=int, default=0, help="결과 문서 크기 (KB, 0이면 기본 크기 약 2KB)")
+    parser.add_argument("--legacy", action="store_true", help="페이지네이션 미지원 백엔드 흉내")
+    parser.add_argument("--replay", help="생성 요청마다 재생할 녹화 스트림 (dev/record_stream.py 출력)")
+    parser.add_argument("--replay-speed", type=float, default=1.0, help="녹화 스트림 재생 배속")
+    parser.add_argument("--heartbeat", type=float, default=0.0, help="생성 스트림 heartbeat(주석 줄) 간격 (초, 0이면 보내지 않음)")
+    parser.add_argument("--drop-after", type=int, default=None, help="생성 스트림 연결을 이벤트 N개 후 끊음 (재연결 확인용)")
+    parser.add_argument("--drops", type=int, default=1, help="실행마다 끊을 연결 수 (--drop-after와 함께 사용)")
+    parser.add_argument("--verbose", action="store_true")
+    return parser
+
+
+if __name__ == "__main__":
+    args = build_parser().parse_args()
+    server = make_server(**vars(args))
+    print(f"Mock backend: http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,60 @@
+"""
+생성 스트림 녹화
+백엔드에 생성 요청을 보내 받은 SSE 이벤트를 수신 시각과 함께 JSON lines로 저장 (dev/mock_backend.py --replay로 재생)
+
+    python dev/record_stream.py --backend http://localhost:8000 --out streams/run.jsonl
+    python dev/record_stream.py --input user_input.json --out streams/bogi_first.jsonl
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend_client import BackendClient  # noqa: E402
+
+DEFAULT_USER_INPUT = {
+    "field_input": "인문예술",
+    "subfield_input": "서양철학",
+    "type_input": "단일형",
+    "subject_input": None,
+    "points_input": None,
+    "questions_input": [
+        {"question_number": 1, "question_type": "내용일치형", "question_style": "부정형", "answer": "③"},
+        {"question_number": 2, "question_type": "추론형", "question_style": "긍정형", "answer": "①"},
+        {"question_number": 3, "question_type": "보기형", "question_style": "긍정형", "answer": "⑤"},
+    ],
+}
+
+
+def record(client: BackendClient, user_input: dict, out: Path) -> int:
+    """생성 스트림을 끝까지 받아 out에 저장 - 저장한 이벤트 수"""
+    out.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    start = time.monotonic()
+    with out.open("w", encoding="utf-8") as f, client.stream_generate(user_input) as response:
+        for event in client.iter_events(response):
+            elapsed = time.monotonic() - start
+            f.write(json.dumps({"t": round(elapsed, 3), "event": event}, ensure_ascii=False) + "\n")
+            count += 1
+            print(f"{elapsed:7.2f}s  {event.get('type')}  {event.get('step', '')} {event.get('status', '')}")
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="생성 스트림 녹화")
+    parser.add_argument("--backend", default="http://localhost:8000")
+    parser.add_argument("--input", help="user_input JSON 파일 (없으면 기본 3문항 설정)")
+    parser.add_argument("--out", required=True, help="저장할 JSON lines 파일")
+    args = parser.parse_args()
+
+    user_input = json.loads(Path(args.input).read_text(encoding="utf-8")) if args.input else DEFAULT_USER_INPUT
+    out = Path(args.out)
+    count = record(BackendClient(args.backend), user_input, out)
+    print(f"{count}개 이벤트 저장: {out}")
+
+
+if __name__ == "__main__":
+    main()
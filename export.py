@@ -0,0 +1,349 @@
+"""
+시험지 내보내기
+결과를 폰트/로고를 포함한 단일 HTML, 인쇄용 PDF, JSON으로 변환하고 여러 결과는 ZIP으로 묶음
+
+PDF는 weasyprint가 설치된 경우에만 지원한다 (pip install weasyprint, 시스템에 Pango 필요).
+"""
+import base64
+import html
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import uuid
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+from assets import APP_CSS, FONT_FILES, LOGO_FILE, STATIC_DIR
+from jobs import JOB_CANCELLED, JOB_COMPLETE, JOB_DONE_STATUSES, JOB_ERROR, JOB_QUEUED, JOB_RUNNING
+from rendering import RenderedResult
+from result_model import GenerationResult
+
+# 내보내기 형식
+FORMAT_HTML = "html"
+FORMAT_PDF = "pdf"
+FORMAT_JSON = "json"
+FORMAT_LABELS = {FORMAT_HTML: "HTML (오프라인)", FORMAT_PDF: "PDF (인쇄용)", FORMAT_JSON: "JSON"}
+FORMAT_MIME = {FORMAT_HTML: "text/html", FORMAT_PDF: "application/pdf", FORMAT_JSON: "application/json"}
+
+# 폰트 참조 방식: 파일에 base64로 포함 / 같은 폴더의 fonts/ 상대 경로 (ZIP, PDF)
+FONTS_INLINE = "inline"
+FONTS_RELATIVE = "relative"
+
+_UNSAFE_NAME = re.compile(r'[\\/:*?"<>|\s]+')
+
+# 인쇄용 스타일 (A4 가로 한 장에 지문/문항 2단, 해설은 다음 페이지부터)
+EXPORT_CSS = """
+    body { margin: 0; padding: 1cm; background: #ffffff; color: #000000; font-family: 'Nanum Myeongjo', serif; }
+    .exam-header { display: flex; align-items: center; gap: 12px; margin-bottom: 12px; }
+    .exam-header img { width: 70px; height: auto; }
+    .exam-header .exam-title { font-size: 22px; font-weight: 800; }
+    .exam-set + .exam-set, .exam-explanations { break-before: page; page-break-before: always; }
+    .question-block, .explanation-item-block { break-inside: avoid; page-break-inside: avoid; }
+    @page { size: A4 landscape; margin: 1.2cm; }
+    @media print {
+        body { padding: 0; }
+        .content-wrapper { overflow: visible; }
+    }
+"""
+
+
+class ExportError(Exception):
+    """내보내기 실패 (PDF 미지원 등)"""
+
+
+@lru_cache(maxsize=1)
+def pdf_available() -> bool:
+    """weasyprint 사용 가능 여부 (설치되어 있어도 시스템 라이브러리가 없으면 False)"""
+    try:
+        import weasyprint  # noqa: F401
+    except (ImportError, OSError):
+        return False
+    return True
+
+
+def available_formats() -> List[str]:
+    return [fmt for fmt in FORMAT_LABELS if fmt != FORMAT_PDF or pdf_available()]
+
+
+def _font_files() -> List[Tuple[str, int]]:
+    """자체 호스팅 폰트 파일 (모두 있을 때만, 없으면 설치된 글꼴/serif 사용)"""
+    font_dir = STATIC_DIR / "fonts"
+    return FONT_FILES if all((font_dir / name).exists() for name, _ in FONT_FILES) else []
+
+
+@lru_cache(maxsize=2)
+def font_face_css(mode: str = FONTS_INLINE) -> str:
+    """Nanum Myeongjo @font-face (프로세스당 한 번 생성)"""
+    rules = []
+    for name, weight in _font_files():
+        if mode == FONTS_INLINE:
+            encoded = base64.b64encode((STATIC_DIR / "fonts" / name).read_bytes()).decode()
+            src = f"url('data:font/ttf;base64,{encoded}')"
+        else:
+            src = f"url('fonts/{name}')"
+        rules.append(
+            "@font-face { font-family: 'Nanum Myeongjo'; font-style: normal; "
+            f"font-weight: {weight}; src: {src} format('truetype'); }}"
+        )
+    return "\n".join(rules)
+
+
+@lru_cache(maxsize=1)
+def logo_data_uri() -> str:
+    path = STATIC_DIR / LOGO_FILE
+    if not path.exists():
+        return ""
+    return "data:image/png;base64," + base64.b64encode(path.read_bytes()).decode()
+
+
+def build_set_html(rendered: RenderedResult) -> str:
+    """결과 한 세트 (머리글 + 지문/문항 + 해설)"""
+    subject = html.escape(rendered.subject)
+    logo = logo_data_uri()
+    logo_html = f'<img src="{logo}" alt="강남대성수능연구소 로고">' if logo else ""
+    return (
+        "<section class=\"exam-set\">"
+        f"<header class=\"exam-header\">{logo_html}<div><div class=\"exam-title\">KSAT Agent</div>"
+        f"<h3>{subject}</h3></div></header>"
+        f"{rendered.content_html}"
+        f"<div class=\"exam-explanations\"><h3>해설 - {subject}</h3>{rendered.explanations_html}</div>"
+        "</section>"
+    )
+
+
+def build_document_html(rendered_list: List[RenderedResult], fonts: str = FONTS_INLINE) -> str:
+    """결과 여러 세트를 하나의 독립 HTML 문서로 (세트마다 새 페이지)"""
+    title = rendered_list[0].subject if len(rendered_list) == 1 else f"KSAT Agent 합본 ({len(rendered_list)}세트)"
+    return "".join([
+        "<!DOCTYPE html><html lang=\"ko\"><head><meta charset=\"utf-8\">",
+        f"<title>{html.escape(title)}</title>",
+        f"<style>\n{font_face_css(fonts)}\n{APP_CSS}{EXPORT_CSS}</style>",
+        "</head><body>",
+        *(build_set_html(rendered) for rendered in rendered_list),
+        "</body></html>",
+    ])
+
+
+def html_to_pdf(document_html: str) -> bytes:
+    """HTML 문서를 PDF로 변환 (폰트는 static/ 기준 상대 경로로 읽음)"""
+    if not pdf_available():
+        raise ExportError("PDF 내보내기를 사용하려면 weasyprint를 설치하세요.")
+    from weasyprint import HTML
+    return HTML(string=document_html, base_url=STATIC_DIR.as_uri() + "/").write_pdf()
+
+
+def export_basename(result: GenerationResult, filename: Optional[str] = None) -> str:
+    """내보내기 파일 이름 (확장자 제외) - 주제 + 원본 파일 이름"""
+    subject = _UNSAFE_NAME.sub("_", str(result.card.get('subject') or "KSAT")).strip("_") or "KSAT"
+    if filename:
+        return f"{subject}_{os.path.splitext(os.path.basename(filename))[0]}"
+    return subject
+
+
+class ExportJob:
+    """내보내기 작업 하나의 상태"""
+
+    def __init__(self, job_id: str, entries: List[Tuple[Optional[str], Optional[GenerationResult]]],
+                 formats: List[str], bundle: bool):
+        self.job_id = job_id
+        self.entries = entries  # (파일 이름, 결과) - 결과가 None이면 워커에서 불러옴
+        self.formats = formats
+        self.bundle = bundle
+        self.status = JOB_QUEUED
+        self.total = len(entries)
+        self.done = 0
+        self.errors: List[str] = []
+        self.path: Optional[str] = None  # 완성된 파일 (임시 파일)
+        self.download_name: Optional[str] = None
+        self.mime: Optional[str] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.cancel_event = threading.Event()
+
+    @property
+    def is_done(self) -> bool:
+        return self.status in JOB_DONE_STATUSES
+
+
+class ExportRegistry:
+    """내보내기 작업을 백그라운드 워커에서 실행
+
+    - 결과 하나 + 형식 하나면 해당 파일을, 그 외에는 ZIP을 임시 파일에 항목별로 바로 기록
+    - ZIP 안의 HTML은 fonts/ 폴더를 함께 넣고 상대 경로로 참조 (세트마다 폰트를 중복 포함하지 않음)
+    - load(filename)는 검증된 결과(GenerationResult)를, render(result)는 RenderedResult를 반환
+    """
+
+    def __init__(
+        self,
+        load: Callable[[str], GenerationResult],
+        render: Callable[[GenerationResult], RenderedResult],
+        max_workers: int = 2,
+        retention: float = 1800.0,
+    ):
+        self.load = load
+        self.render = render
+        self.retention = retention
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, ExportJob] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="export")
+
+    def submit(self, entries: List[Tuple[Optional[str], Optional[GenerationResult]]],
+               formats: List[str], bundle: bool = False) -> str:
+        """내보내기 등록 후 작업 ID 반환"""
+        job = ExportJob(uuid.uuid4().hex, list(entries), list(formats), bundle)
+        with self._lock:
+            self._prune()
+            self._jobs[job.job_id] = job
+        self._executor.submit(self._run, job)
+        return job.job_id
+
+    def get(self, job_id: Optional[str]) -> Optional[ExportJob]:
+        if not job_id:
+            return None
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def read(self, job_id: str) -> Optional[bytes]:
+        """완성된 파일 내용 (완료 전이거나 정리된 경우 None)"""
+        job = self.get(job_id)
+        if job is None or job.status != JOB_COMPLETE or not job.path:
+            return None
+        try:
+            with open(job.path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def cancel(self, job_id: str):
+        job = self.get(job_id)
+        if job is not None and not job.is_done:
+            job.cancel_event.set()
+
+    def discard(self, job_id: str):
+        """작업과 임시 파일 삭제 (진행 중이면 취소)"""
+        self.cancel(job_id)
+        with self._lock:
+            job = self._jobs.pop(job_id, None)
+        if job is not None and job.is_done:
+            self._remove_file(job)
+
+    def _run(self, job: ExportJob):
+        with self._lock:
+            if job.cancel_event.is_set():
+                self._finish(job, JOB_CANCELLED)
+                return
+            job.status = JOB_RUNNING
+        try:
+            if job.total == 1 and len(job.formats) == 1:
+                self._export_single(job)
+            else:
+                self._export_zip(job)
+        except Exception as e:
+            job.error = str(e)
+        with self._lock:
+            if job.cancel_event.is_set():
+                status = JOB_CANCELLED
+            elif job.error or job.done == 0:
+                status = JOB_ERROR
+                job.error = job.error or "; ".join(job.errors) or "내보낼 결과가 없습니다."
+            else:
+                status = JOB_COMPLETE
+            self._finish(job, status)
+        if job.status != JOB_COMPLETE:
+            self._remove_file(job)
+
+    def _resolve(self, job: ExportJob, index: int) -> Tuple[str, GenerationResult]:
+        """index번째 항목의 (파일 이름 기본값, 결과)"""
+        filename, result = job.entries[index]
+        if result is None:
+            result = self.load(filename)
+        return export_basename(result, filename), result
+
+    def _export_single(self, job: ExportJob):
+        """결과 하나, 형식 하나 - 해당 파일 그대로 (폰트 포함 HTML)"""
+        basename, result = self._resolve(job, 0)
+        fmt = job.formats[0]
+        data = self._encode(fmt, [self.render(result)], [result], FONTS_INLINE)
+        job.path = self._write_temp(data, f".{fmt}")
+        job.download_name = f"{basename}.{fmt}"
+        job.mime = FORMAT_MIME[fmt]
+        job.done = 1
+
+    def _export_zip(self, job: ExportJob):
+        """ZIP으로 묶음 - 항목을 만드는 즉시 임시 파일에 기록"""
+        fd, job.path = tempfile.mkstemp(prefix="ksat_export_", suffix=".zip")
+        with os.fdopen(fd, "wb") as f, zipfile.ZipFile(f, "w", zipfile.ZIP_DEFLATED) as zf:
+            if FORMAT_HTML in job.formats:
+                for name, _ in _font_files():
+                    zf.write(STATIC_DIR / "fonts" / name, f"fonts/{name}", compress_type=zipfile.ZIP_STORED)
+
+            bundle_rendered: List[RenderedResult] = []
+            bundle_results: List[GenerationResult] = []
+            for index in range(job.total):
+                if job.cancel_event.is_set():
+                    return
+                try:
+                    basename, result = self._resolve(job, index)
+                    rendered = self.render(result)
+                    if job.bundle:
+                        bundle_rendered.append(rendered)
+                        bundle_results.append(result)
+                    else:
+                        for fmt in job.formats:
+                            zf.writestr(f"{index + 1:03d}_{basename}.{fmt}",
+                                        self._encode(fmt, [rendered], [result], FONTS_RELATIVE))
+                    job.done += 1
+                except Exception as e:
+                    job.errors.append(f"{job.entries[index][0] or index + 1}: {e}")
+
+            if job.bundle and bundle_rendered:
+                for fmt in job.formats:
+                    zf.writestr(f"KSAT_합본.{fmt}", self._encode(fmt, bundle_rendered, bundle_results, FONTS_RELATIVE))
+            if job.errors:
+                zf.writestr("errors.txt", "\n".join(job.errors))
+
+        job.download_name = time.strftime("KSAT_export_%Y%m%d_%H%M%S.zip")
+        job.mime = "application/zip"
+
+    @staticmethod
+    def _encode(fmt: str, rendered_list: List[RenderedResult], results: List[GenerationResult], fonts: str) -> bytes:
+        if fmt == FORMAT_JSON:
+            payload = results[0].raw if len(results) == 1 else [result.raw for result in results]
+            return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+        if fmt == FORMAT_PDF:
+            return html_to_pdf(build_document_html(rendered_list, FONTS_RELATIVE))
+        return build_document_html(rendered_list, fonts).encode("utf-8")
+
+    @staticmethod
+    def _write_temp(data: bytes, suffix: str) -> str:
+        fd, path = tempfile.mkstemp(prefix="ksat_export_", suffix=suffix)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        return path
+
+    @staticmethod
+    def _remove_file(job: ExportJob):
+        if job.path:
+            try:
+                os.remove(job.path)
+            except OSError:
+                pass
+            job.path = None
+
+    def _finish(self, job: ExportJob, status: str):
+        """종료 상태로 전환 (lock 보유 상태에서 호출)"""
+        job.status = status
+        job.finished_at = time.time()
+
+    def _prune(self):
+        """보관 기간이 지난 완료 작업과 임시 파일 정리 (lock 보유 상태에서 호출)"""
+        cutoff = time.time() - self.retention
+        expired = [job_id for job_id, job in self._jobs.items() if job.is_done and job.finished_at < cutoff]
+        for job_id in expired:
+            self._remove_file(self._jobs.pop(job_id))
@@ -0,0 +1,634 @@
+"""
+생성 작업 레지스트리
+SSE 스트림을 스크립트 스레드와 분리된 백그라운드 워커에서 수신하고 진행 상황을 작업 ID별로 보관
+공유 상태 저장소를 주면 작업 상태를 기록하여 다른 레플리카(또는 재시작한 프로세스)의 세션에서도 조회/취소 가능
+"""
+import copy
+import hashlib
+import itertools
+import json
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend_client import BackendClient, BackendError
+from partial_result import PartialResult
+from progress_state import ProgressState
+from result_model import GenerationResult, ResultValidationError
+from state_store import StateStore
+from timing import RunTimer, TimingStats
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETE = "complete"
+JOB_ERROR = "error"
+JOB_CANCELLED = "cancelled"
+JOB_DONE_STATUSES = (JOB_COMPLETE, JOB_ERROR, JOB_CANCELLED)
+
+# 공유 상태 저장소 namespace
+STATE_JOBS = "jobs"          # 작업 ID -> 작업 상태
+STATE_BATCHES = "batches"    # 묶음 ID -> 묶음 정보
+STATE_INFLIGHT = "inflight"  # idempotency key -> 진행 중 작업 ID
+STATE_CANCEL = "cancel"      # 작업 ID -> 취소 요청 (실행 중인 레플리카가 반영)
+STATE_OWNERS = "owners"      # 레지스트리(프로세스) ID -> 마지막 heartbeat 시각 (lease 동안 유지)
+
+# 실행 프로세스 heartbeat 간격과 lease (초) - lease 동안 heartbeat가 없으면 그 프로세스의 진행 중 작업은 중단된 것으로 봄
+OWNER_HEARTBEAT_INTERVAL = 5.0
+OWNER_LEASE = 30.0
+
+# 실행 중인 작업의 진행 상태 기록 최소 간격 (초) - 그 사이의 변경은 다음 이벤트나 heartbeat 때 기록
+STATE_PUBLISH_INTERVAL = 1.0
+
+
+def expand_batch_grid(
+    subfields: List[Tuple[str, str]],
+    points_list: List[Optional[str]],
+    type_input: str,
+    questions_input: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """(분야, 세부 분야) × 출제 포인트 조합으로 일괄 생성용 user_input 목록 구성"""
+    return [
+        {
+            "field_input": field,
+            "subfield_input": subfield,
+            "type_input": type_input,
+            "subject_input": None,
+            "points_input": points,
+            "questions_input": [dict(q) for q in questions_input],
+        }
+        for (field, subfield), points in itertools.product(subfields, points_list or [None])
+    ]
+
+
+def idempotency_key(user_input: Dict[str, Any]) -> str:
+    """user_input 정규화 해시 (키 순서와 무관) - 같은 설정의 진행 중 작업 식별용"""
+    payload = json.dumps(user_input, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class GenerationJob:
+    """생성 작업 하나의 상태"""
+
+    def __init__(self, job_id: str, user_input: Dict[str, Any], batch_id: Optional[str] = None):
+        self.job_id = job_id
+        self.batch_id = batch_id
+        self.user_input = user_input
+        self.idempotency_key = idempotency_key(user_input)
+        self.status = JOB_QUEUED
+        self.progress = ProgressState(len(user_input.get('questions_input', [])))
+        self.partial = PartialResult()  # 완료 전에 도착한 카드/지문/문항
+        self.result: Optional[GenerationResult] = None
+        self.filename: Optional[str] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.updated_at = self.created_at
+        self.revision = 0  # 상태가 바뀔 때마다 증가 (UI 갱신 판단용)
+        self.cancel_event = threading.Event()
+        self.response = None  # 수신 중인 SSE 응답 (취소 시 닫음)
+        self.timer: Optional[RunTimer] = None
+        self.published_at = 0.0  # 공유 저장소에 마지막으로 기록한 시각 (monotonic)
+        self.published_revision: Optional[int] = None
+
+    @property
+    def is_done(self) -> bool:
+        return self.status in JOB_DONE_STATUSES
+
+    @property
+    def completed_tasks(self) -> int:
+        return self.progress.completed
+
+    def to_state(self, owner: str) -> Dict[str, Any]:
+        """공유 저장소용 상태 (스트림, 취소 이벤트, 타이머 제외, 완료 후에는 부분 결과 대신 결과만)"""
+        return {
+            "job_id": self.job_id,
+            "batch_id": self.batch_id,
+            "user_input": self.user_input,
+            "status": self.status,
+            "progress": self.progress.to_list(),
+            "partial": self.partial.to_dict() if self.result is None else {},
+            "result": self.result.to_dict() if self.result is not None else None,
+            "filename": self.filename,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "updated_at": self.updated_at,
+            "revision": self.revision,
+            "owner": owner,
+        }
+
+    @classmethod
+    def from_state(cls, data: Dict[str, Any]) -> "GenerationJob":
+        """to_state() 결과에서 복원 (조회 전용 - 스트림과 연결되지 않음)"""
+        job = cls(data["job_id"], data["user_input"], batch_id=data.get("batch_id"))
+        job.status = data["status"]
+        job.progress = ProgressState.from_list(data["progress"])
+        job.partial = PartialResult.from_dict(data.get("partial") or {})
+        job.result = GenerationResult.from_dict(data["result"]) if data.get("result") else None
+        job.filename = data.get("filename")
+        job.error = data.get("error")
+        job.created_at = data["created_at"]
+        job.started_at = data.get("started_at")
+        job.finished_at = data.get("finished_at")
+        job.updated_at = data["updated_at"]
+        job.revision = data["revision"]
+        return job
+
+
+class GenerationBatch:
+    """일괄 생성 묶음 - 동시 실행 수를 제한하여 작업을 순차 투입
+
+    - job_ids에는 같은 설정으로 이미 진행 중이던 다른 작업도 포함될 수 있음 (묶음이 투입/취소/정리하는 작업은 batch_id가 같은 작업만)
+    """
+
+    def __init__(self, batch_id: str, job_ids: List[str], concurrency: int, pending: Optional[List[str]] = None):
+        self.batch_id = batch_id
+        self.job_ids = job_ids
+        self.concurrency = max(1, concurrency)
+        self.pending = list(job_ids if pending is None else pending)  # 아직 워커에 투입하지 않은 작업
+        self.created_at = time.time()
+
+
+class BatchSummary:
+    """일괄 생성 집계 (UI 표시용)"""
+
+    def __init__(self, batch: GenerationBatch, jobs: List[GenerationJob]):
+        self.batch_id = batch.batch_id
+        self.jobs = jobs
+        self.total = len(jobs)
+        self.counts = {status: 0 for status in (JOB_QUEUED, JOB_RUNNING) + JOB_DONE_STATUSES}
+        for job in jobs:
+            self.counts[job.status] += 1
+        self.done = sum(self.counts[status] for status in JOB_DONE_STATUSES)
+
+        # 경과 시간: 모두 끝났으면 마지막 작업 종료 시점까지
+        finished = [j.finished_at for j in jobs if j.finished_at]
+        end = max(finished) if self.done == self.total and finished else time.time()
+        self.elapsed = end - batch.created_at
+        durations = [j.finished_at - j.started_at for j in jobs if j.status == JOB_COMPLETE and j.started_at]
+        # 처리량: 분당 완료 세트 수
+        self.throughput = self.counts[JOB_COMPLETE] / (self.elapsed / 60) if self.elapsed > 0 else 0.0
+        # 남은 시간: 평균 소요 시간 × 남은 작업 수 / 동시 실행 수
+        remaining = self.total - self.done
+        if durations and remaining:
+            waves = -(-remaining // batch.concurrency)
+            self.eta: Optional[float] = waves * (sum(durations) / len(durations))
+        else:
+            self.eta = None if remaining else 0.0
+
+    @property
+    def is_done(self) -> bool:
+        return self.done == self.total
+
+
+class JobRegistry:
+    """작업 ID별 생성 작업 보관 및 백그라운드 실행
+
+    - max_workers: 프로세스 전체에서 동시에 열 수 있는 생성 스트림 수
+    - 일괄 생성은 묶음별 concurrency만큼만 워커에 투입하고, 하나가 끝나면 다음 작업을 투입
+    - on_complete(job)는 작업이 성공적으로 끝난 직후 워커 스레드에서 호출됨 (캐시 갱신 등)
+    - timing이 주어지면 스트림을 연 모든 작업의 소요 시간 레코드를 추가
+    - 같은 설정(idempotency key)으로 진행 중인 작업이 있으면 submit()은 새 작업 대신 그 작업 ID를 반환
+    - 실행 중인 작업을 취소하면 스트림을 닫고 백엔드에도 생성 중단을 요청
+    - state가 주어지면 작업/묶음 상태를 공유 저장소에 기록하고, 이 프로세스에 없는 작업은 저장소에서 조회
+      (다른 레플리카의 작업 취소는 저장소의 취소 요청을 실행 중인 레플리카가 heartbeat 주기마다 반영)
+    """
+
+    def __init__(
+        self,
+        client: BackendClient,
+        max_workers: int = 4,
+        retention: float = 3600.0,
+        on_complete: Optional[Callable[[GenerationJob], None]] = None,
+        timing: Optional[TimingStats] = None,
+        state: Optional[StateStore] = None,
+    ):
+        self.client = client
+        self.retention = retention
+        self.on_complete = on_complete
+        self.timing = timing
+        self.state = state
+        self.owner_id = uuid.uuid4().hex
+        self._lock = threading.Lock()
+        self._publish_lock = threading.Lock()  # 같은 작업의 상태가 순서대로 기록되도록 기록을 직렬화
+        self._jobs: Dict[str, GenerationJob] = {}
+        self._batches: Dict[str, GenerationBatch] = {}
+        self._inflight: Dict[str, str] = {}  # idempotency key -> 진행 중 작업 ID
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="generation")
+        if state is not None:
+            threading.Thread(target=self._heartbeat_loop, name="job-heartbeat", daemon=True).start()
+
+    def submit(self, user_input: Dict[str, Any]) -> str:
+        """생성 작업 등록 후 작업 ID 반환 (같은 설정으로 진행 중인 작업이 있으면 그 작업 ID)"""
+        job = GenerationJob(uuid.uuid4().hex, user_input)
+        remote_id = self._find_remote_inflight(job.idempotency_key)
+        if remote_id is not None:
+            return remote_id
+        with self._lock:
+            self._prune()
+            existing = self._find_inflight(job.idempotency_key)
+            if existing is not None:
+                return existing.job_id
+            self._jobs[job.job_id] = job
+            self._inflight[job.idempotency_key] = job.job_id
+        self._publish(job)
+        self._set_state(STATE_INFLIGHT, job.idempotency_key, job.job_id)
+        self._executor.submit(self._run, job)
+        return job.job_id
+
+    def find_inflight(self, user_input: Dict[str, Any]) -> Optional[str]:
+        """같은 설정으로 진행 중인 작업 ID (없으면 None)"""
+        key = idempotency_key(user_input)
+        with self._lock:
+            existing = self._find_inflight(key)
+        return existing.job_id if existing is not None else self._find_remote_inflight(key)
+
+    def submit_batch(self, user_inputs: List[Dict[str, Any]], concurrency: int = 3) -> str:
+        """일괄 생성 등록 후 묶음 ID 반환 (submit()과 같이 같은 설정으로 진행 중인 작업이 있으면 새 작업 대신 그 작업을 묶음에 포함)"""
+        batch_id = uuid.uuid4().hex
+        jobs = [GenerationJob(uuid.uuid4().hex, user_input, batch_id=batch_id) for user_input in user_inputs]
+        remote_ids = {job.idempotency_key: self._find_remote_inflight(job.idempotency_key) for job in jobs}
+        job_ids: List[str] = []
+        created: List[GenerationJob] = []
+        with self._lock:
+            self._prune()
+            for job in jobs:
+                existing = self._find_inflight(job.idempotency_key)
+                existing_id = existing.job_id if existing is not None else remote_ids[job.idempotency_key]
+                if existing_id is not None:
+                    if existing_id not in job_ids:
+                        job_ids.append(existing_id)
+                    continue
+                self._jobs[job.job_id] = job
+                self._inflight[job.idempotency_key] = job.job_id
+                job_ids.append(job.job_id)
+                created.append(job)
+            batch = GenerationBatch(batch_id, job_ids, concurrency, pending=[job.job_id for job in created])
+            self._batches[batch_id] = batch
+            ready = self._take_pending(batch, batch.concurrency)
+        for job in created:
+            self._publish(job)
+            self._set_state(STATE_INFLIGHT, job.idempotency_key, job.job_id)
+        self._set_state(STATE_BATCHES, batch_id, {
+            "job_ids": batch.job_ids, "concurrency": batch.concurrency, "created_at": batch.created_at,
+        })
+        for job in ready:
+            self._executor.submit(self._run, job)
+        return batch_id
+
+    def get(self, job_id: Optional[str]) -> Optional[GenerationJob]:
+        """작업 조회 (없으면 None) - 다른 레플리카의 작업은 공유 저장소의 상태 (조회 전용)"""
+        if not job_id:
+            return None
+        with self._lock:
+            job = self._jobs.get(job_id)
+        return job if job is not None else self._load_remote(job_id)
+
+    def has_batch(self, batch_id: Optional[str]) -> bool:
+        if not batch_id:
+            return False
+        with self._lock:
+            if batch_id in self._batches:
+                return True
+        return self._get_state(STATE_BATCHES, batch_id) is not None
+
+    def snapshot(self, job_id: Optional[str]) -> Optional[GenerationJob]:
+        """UI 렌더링용 작업 상태 복사본 (워커 갱신과 분리)"""
+        with self._lock:
+            job = self._jobs.get(job_id) if job_id else None
+            if job is not None:
+                return self._copy(job)
+        return self._load_remote(job_id)
+
+    def batch_summary(self, batch_id: Optional[str]) -> Optional[BatchSummary]:
+        """일괄 생성 집계 (작업별 상태 복사본 포함)"""
+        with self._lock:
+            batch = self._batches.get(batch_id) if batch_id else None
+            if batch is not None:
+                local = {job_id: self._copy(self._jobs[job_id]) for job_id in batch.job_ids if job_id in self._jobs}
+        if batch is not None:
+            # 다른 레플리카에서 진행 중이던 같은 설정의 작업은 저장소에서 조회
+            jobs = [local.get(job_id) or self._load_remote(job_id) for job_id in batch.job_ids]
+            return BatchSummary(batch, [job for job in jobs if job is not None])
+        data = self._get_state(STATE_BATCHES, batch_id) if batch_id else None
+        if data is None:
+            return None
+        batch = GenerationBatch(batch_id, data["job_ids"], data["concurrency"])
+        batch.created_at = data["created_at"]
+        jobs = [job for job in (self._load_remote(job_id) for job_id in batch.job_ids) if job is not None]
+        return BatchSummary(batch, jobs)
+
+    def cancel(self, job_id: str):
+        """작업 취소 - 대기 중이면 바로 취소, 실행 중이면 스트림을 닫아 중단 (다른 레플리카의 작업은 취소 요청 기록)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job.is_done:
+                return
+            if job is not None:
+                job.cancel_event.set()
+                response = job.response
+                started = job.status == JOB_RUNNING
+                queued = job.status == JOB_QUEUED
+                if queued:
+                    batch = self._batches.get(job.batch_id) if job.batch_id else None
+                    if batch is not None and job_id in batch.pending:
+                        batch.pending.remove(job_id)
+                    self._mark_cancelled(job)
+        if job is None:
+            self._cancel_remote(job_id)
+            return
+        if queued:
+            self._publish(job)
+        if response is not None:
+            response.close()
+        if started:
+            # 스트림을 닫는 것만으로는 백엔드 생성이 멈추지 않을 수 있으므로 중단 요청 (응답을 기다리지 않음)
+            threading.Thread(target=self._abort_remote, args=(job,), name="generation-abort", daemon=True).start()
+
+    def _abort_remote(self, job: GenerationJob):
+        try:
+            self.client.cancel_generation(job.idempotency_key, job.job_id)
+        except BackendError:
+            pass  # 중단 API가 없거나 이미 끝난 생성
+
+    def cancel_batch(self, batch_id: str):
+        """일괄 생성의 남은 작업 모두 취소 (묶음에 포함된 다른 세션의 작업은 취소하지 않음)"""
+        with self._lock:
+            batch = self._batches.get(batch_id)
+            job_ids = list(batch.job_ids) if batch else None
+        if job_ids is None:
+            data = self._get_state(STATE_BATCHES, batch_id)
+            job_ids = data["job_ids"] if data else []
+        for job_id in job_ids:
+            job = self.get(job_id)
+            if job is not None and job.batch_id == batch_id:
+                self.cancel(job_id)
+
+    def _find_inflight(self, key: str) -> Optional[GenerationJob]:
+        """같은 idempotency key의 진행 중(취소 요청되지 않은) 작업 (lock 보유 상태에서 호출)"""
+        job = self._jobs.get(self._inflight.get(key, ""))
+        if job is None or job.is_done or job.cancel_event.is_set():
+            return None
+        return job
+
+    def _copy(self, job: GenerationJob) -> GenerationJob:
+        snapshot = copy.copy(job)
+        snapshot.progress = job.progress.copy()
+        snapshot.partial = job.partial.copy()
+        return snapshot
+
+    def _update(self, job: GenerationJob, mutate: Callable[[GenerationJob], None]):
+        """락을 잡고 작업 상태 변경"""
+        with self._lock:
+            mutate(job)
+            job.updated_at = time.time()
+            job.revision += 1
+        self._publish(job, throttle=True)
+
+    def _run(self, job: GenerationJob):
+        """워커 스레드: SSE 스트림을 끝까지 수신하며 작업 상태 갱신"""
+        try:
+            if not job.cancel_event.is_set():
+                self._stream(job)
+        finally:
+            if job.cancel_event.is_set():
+                with self._lock:
+                    self._mark_cancelled(job)
+                self._publish(job)
+            elif not job.is_done:
+                self._fail(job, "생성 스트림이 결과 없이 종료되었습니다.")
+            if self._get_state(STATE_INFLIGHT, job.idempotency_key) == job.job_id:
+                self._delete_state(STATE_INFLIGHT, job.idempotency_key)
+            if job.timer is not None and self.timing is not None:
+                self.timing.add(job.timer.finish(job.status, job.progress))
+            self._dispatch_next(job)
+
+    def _stream(self, job: GenerationJob):
+        """SSE 스트림 수신 (오류는 작업 실패로 기록)"""
+        def start(j: GenerationJob):
+            j.status = JOB_RUNNING
+            j.started_at = time.time()
+        self._update(job, start)
+        job.timer = RunTimer(job.job_id, job.user_input)
+
+        try:
+            # 연결이 끊기면 클라이언트가 Last-Event-ID로 재연결하여 이어 받음
+            events = self.client.generate_events(
+                job.user_input,
+                idempotency_key=job.idempotency_key,
+                job_id=job.job_id,
+                on_response=lambda response: setattr(job, 'response', response),
+                stop_event=job.cancel_event,
+            )
+            for data in events:
+                if job.cancel_event.is_set():
+                    break
+                job.timer.event()
+                if data.get('type') == 'progress':
+                    self._update(job, lambda j: self._apply_progress(j, data))
+
+                elif data.get('type') == 'partial':
+                    self._update(job, lambda j: j.partial.apply_event(data))
+
+                elif data.get('type') == 'complete':
+                    # 결과는 여기서 한 번 검증하고, 이후 캐시/세션은 같은 객체를 공유
+                    try:
+                        result = GenerationResult.from_dict(data.get('result'))
+                    except ResultValidationError as e:
+                        self._fail(job, f"생성 결과 형식 오류: {e}")
+                    else:
+                        self._complete(job, result, data.get('filename'))
+
+                elif data.get('type') == 'error':
+                    self._fail(job, data.get('message', ''))
+        except BackendError as e:
+            if not job.cancel_event.is_set():
+                self._fail(job, f"백엔드 서버와 연결할 수 없습니다: {str(e)}")
+        except Exception as e:
+            if not job.cancel_event.is_set():
+                self._fail(job, str(e))
+        finally:
+            job.response = None
+
+    @staticmethod
+    def _apply_progress(job: GenerationJob, data: Dict[str, Any]):
+        """진행 이벤트 반영 - 단계 완료 이벤트에 결과 일부(data)가 붙어 있으면 부분 결과에도 반영"""
+        job.progress.apply_event(data)
+        if data.get('status') == 'complete':
+            job.partial.apply_event(data)
+
+    def _dispatch_next(self, job: GenerationJob):
+        """일괄 생성 작업이 끝나면 같은 묶음의 다음 작업 투입"""
+        if not job.batch_id:
+            return
+        with self._lock:
+            batch = self._batches.get(job.batch_id)
+            ready = self._take_pending(batch, 1) if batch else []
+        for next_job in ready:
+            self._executor.submit(self._run, next_job)
+
+    def _take_pending(self, batch: GenerationBatch, count: int) -> List[GenerationJob]:
+        """대기열에서 취소되지 않은 작업을 count개까지 꺼냄 (lock 보유 상태에서 호출)"""
+        ready = []
+        while batch.pending and len(ready) < count:
+            job = self._jobs[batch.pending.pop(0)]
+            if not job.cancel_event.is_set():
+                ready.append(job)
+        return ready
+
+    def _complete(self, job: GenerationJob, result: GenerationResult, filename: Optional[str]):
+        """결과 반영 - UI가 완료를 보기 전에 on_complete(캐시 갱신)를 먼저 실행"""
+        job.result = result
+        job.filename = filename
+        if self.on_complete:
+            try:
+                self.on_complete(job)
+            except Exception:
+                pass  # 캐시 갱신 실패가 생성 결과를 무효화하지 않도록
+
+        def complete(j: GenerationJob):
+            j.progress.complete_all()
+            j.status = JOB_COMPLETE
+            j.finished_at = time.time()
+        self._update(job, complete)
+
+    def _fail(self, job: GenerationJob, message: str):
+        """진행 중이던 태스크를 error 상태로 변경하고 작업 실패 처리"""
+        def fail(j: GenerationJob):
+            j.progress.fail_active()
+            j.error = message
+            j.status = JOB_ERROR
+            j.finished_at = time.time()
+        self._update(job, fail)
+
+    def _mark_cancelled(self, job: GenerationJob):
+        """취소 상태로 전환 (lock 보유 상태에서 호출)"""
+        if job.is_done:
+            return
+        job.status = JOB_CANCELLED
+        job.finished_at = time.time()
+        job.updated_at = job.finished_at
+        job.revision += 1
+
+    # ----- 공유 상태 저장소 -----
+    # 저장소 장애가 생성 작업을 멈추지 않도록 오류는 무시 (이 프로세스의 작업은 메모리 상태로 계속 동작)
+
+    def _get_state(self, namespace: str, key: str) -> Optional[Any]:
+        if self.state is None:
+            return None
+        try:
+            return self.state.get(namespace, key)
+        except Exception:
+            return None
+
+    def _set_state(self, namespace: str, key: str, value: Any):
+        if self.state is None:
+            return
+        try:
+            self.state.set(namespace, key, value, ttl=self.retention)
+        except Exception:
+            pass
+
+    def _delete_state(self, namespace: str, key: str):
+        if self.state is None:
+            return
+        try:
+            self.state.delete(namespace, key)
+        except Exception:
+            pass
+
+    def _publish(self, job: GenerationJob, throttle: bool = False):
+        """작업 상태 기록 (lock 밖에서 호출) - 상태 복사와 기록을 직렬화하여 이전 상태가 나중 상태를 덮어쓰지 않도록
+
+        throttle이면 실행 중인 작업은 STATE_PUBLISH_INTERVAL마다 한 번만 기록 (진행 이벤트마다 전체 상태를 쓰지 않도록)
+        """
+        if self.state is None:
+            return
+        with self._publish_lock:
+            with self._lock:
+                now = time.monotonic()
+                if throttle and not job.is_done and now - job.published_at < STATE_PUBLISH_INTERVAL:
+                    return
+                job.published_at = now
+                job.published_revision = job.revision
+                data = job.to_state(self.owner_id)
+            self._set_state(STATE_JOBS, job.job_id, data)
+
+    def _load_remote(self, job_id: Optional[str]) -> Optional[GenerationJob]:
+        """저장소의 작업 상태 - 실행하던 프로세스의 heartbeat가 끊긴 미완료 작업은 오류로 표시"""
+        data = self._get_state(STATE_JOBS, job_id) if job_id else None
+        if data is None:
+            return None
+        job = GenerationJob.from_state(data)
+        if not job.is_done and self._get_state(STATE_OWNERS, data["owner"]) is None:
+            job.progress.fail_active()
+            job.status = JOB_ERROR
+            job.error = "작업을 실행하던 서버 프로세스가 종료되었습니다. 다시 생성해 주세요."
+        return job
+
+    def _find_remote_inflight(self, key: str) -> Optional[str]:
+        """다른 레플리카에서 같은 idempotency key로 진행 중인 작업 ID"""
+        job_id = self._get_state(STATE_INFLIGHT, key)
+        if not job_id or self._get_state(STATE_CANCEL, job_id):
+            return None
+        with self._lock:
+            if job_id in self._jobs:
+                return None  # 이 프로세스의 작업은 _find_inflight에서 판단
+        job = self._load_remote(job_id)
+        return job_id if job is not None and not job.is_done else None
+
+    def _cancel_remote(self, job_id: str):
+        """다른 레플리카의 작업 취소 - 실행 중인 레플리카가 heartbeat 주기에 반영, 백엔드 생성은 바로 중단 요청"""
+        job = self._load_remote(job_id)
+        if job is None or job.is_done:
+            return
+        self._set_state(STATE_CANCEL, job_id, True)
+        threading.Thread(target=self._abort_remote, args=(job,), name="generation-abort", daemon=True).start()
+
+    def _heartbeat_loop(self):
+        """이 프로세스가 살아 있음을 기록하고, 다른 레플리카에서 요청한 취소와 기록을 미룬 진행 상태를 반영"""
+        while True:
+            self._set_owner_heartbeat()
+            with self._lock:
+                running = [job for job in self._jobs.values() if not job.is_done]
+            for job in running:
+                if job.cancel_event.is_set():
+                    continue  # 이미 취소 중 (스트림 종료와 백엔드 중단 요청은 한 번만)
+                if self._get_state(STATE_CANCEL, job.job_id):
+                    self.cancel(job.job_id)
+                elif job.published_revision != job.revision:
+                    self._publish(job)
+            time.sleep(OWNER_HEARTBEAT_INTERVAL)
+
+    def _set_owner_heartbeat(self):
+        try:
+            self.state.set(STATE_OWNERS, self.owner_id, time.time(), ttl=OWNER_LEASE)
+        except Exception:
+            pass
+
+    def _prune(self):
+        """보관 기간이 지난 완료 작업/묶음 정리 (lock 보유 상태에서 호출, 묶음은 통째로 정리)
+
+        묶음은 포함된 작업(다른 세션의 작업 포함) 중 이 프로세스에 남아 있는 작업이 모두 만료되면 정리하고, 묶음이 만든 작업만 삭제
+        """
+        cutoff = time.time() - self.retention
+
+        def expired(job: GenerationJob) -> bool:
+            return job.is_done and job.updated_at < cutoff
+
+        for batch_id, batch in list(self._batches.items()):
+            jobs = [self._jobs[job_id] for job_id in batch.job_ids if job_id in self._jobs]
+            if batch.created_at < cutoff and all(expired(job) for job in jobs):
+                for job in jobs:
+                    if job.batch_id == batch_id:
+                        del self._jobs[job.job_id]
+                del self._batches[batch_id]
+        for job_id in [k for k, j in self._jobs.items() if not j.batch_id and expired(j)]:
+            del self._jobs[job_id]
+        for key in [k for k in self._inflight if self._find_inflight(k) is None]:
+            del self._inflight[key]
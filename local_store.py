@@ -0,0 +1,407 @@
+"""
+로컬 결과 저장소
+저장된 결과의 메타데이터와 압축된 결과 문서를 SQLite에 보관하여 백엔드 없이 목록 조회/검색/불러오기
+결과 문서는 FTS5 전문 검색 색인(문자 bigram)과 지문 MinHash 서명(유사 지문 탐지)에 같은 트랜잭션으로 추가/삭제
+백그라운드 동기화는 목록 ETag로 변경 여부를 확인하고, 바뀐 파일만 받아오며 삭제도 반영
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from backend_client import BackendClient, BackendError
+from result_model import passage_text
+from search_index import FIELD_WEIGHTS, SEARCH_FIELDS, build_match, document_fields, index_text, make_snippet
+from similarity import DEFAULT_THRESHOLD, LSHIndex, MinHasher, subject_similarity
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outputs (
+    filename TEXT PRIMARY KEY,
+    created TEXT NOT NULL,          -- 생성일자
+    field TEXT NOT NULL,            -- 대분야
+    subject TEXT NOT NULL,          -- 주제
+    num_questions INTEGER NOT NULL, -- 문항 수
+    modified TEXT NOT NULL,         -- 변경 감지용 (수정일자, 없으면 생성일자)
+    document BLOB,                  -- zlib 압축 JSON (아직 받지 않았으면 NULL)
+    synced_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_outputs_created ON outputs (created DESC, filename DESC);
+CREATE INDEX IF NOT EXISTS idx_outputs_field ON outputs (field, created DESC);
+CREATE INDEX IF NOT EXISTS idx_outputs_subject ON outputs (subject);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS search_docs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,  -- search_fts rowid (재사용하지 않음)
+    filename TEXT NOT NULL UNIQUE
+);
+-- contentless: 토큰 문자열은 저장하지 않음 (삭제 시 결과 문서에서 토큰을 다시 만들어 'delete' 명령 사용)
+CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+    passage, questions, explanations, content = '', tokenize = 'unicode61 remove_diacritics 0'
+);
+CREATE TABLE IF NOT EXISTS passage_signatures (
+    filename TEXT PRIMARY KEY,
+    signature BLOB NOT NULL  -- 지문 MinHash 서명 (uint64 배열, 지문이 비어 있으면 빈 값)
+);
+"""
+
+# 동기화 시 목록 페이지 크기
+SYNC_PAGE_SIZE = 500
+
+
+def _compress(document: Dict[str, Any]) -> bytes:
+    return zlib.compress(json.dumps(document, ensure_ascii=False).encode("utf-8"), 6)
+
+
+def _decompress(blob: bytes) -> Dict[str, Any]:
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+def _modified(meta: Dict[str, Any]) -> str:
+    return str(meta.get("수정일자") or meta.get("생성일자", ""))
+
+
+class LocalStore:
+    """SQLite 기반 결과 저장소 (프로세스 공유, 스레드 안전)"""
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self.index_version = 0  # 검색 색인이 바뀔 때마다 증가 (검색 결과 캐시 무효화용)
+        self._hasher = MinHasher()
+        self._lsh = LSHIndex(self._hasher.num_perm)
+        for filename, blob in self._conn.execute("SELECT filename, signature FROM passage_signatures WHERE signature != x''"):
+            self._lsh.add(filename, np.frombuffer(blob, dtype=np.uint64))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM outputs").fetchone()[0]
+
+    def query_page(self, offset: int = 0, limit: int = 50, filters: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """목록 페이지 (백엔드 list_outputs_page와 같은 형태, 최신순)"""
+        filters = filters or {}
+        clauses, params = [], []
+        if filters.get("field"):
+            clauses.append("field = ?")
+            params.append(filters["field"])
+        if filters.get("subject"):
+            clauses.append("instr(subject, ?) > 0")
+            params.append(filters["subject"])
+        if filters.get("date_from"):
+            clauses.append("substr(created, 1, 10) >= ?")
+            params.append(filters["date_from"])
+        if filters.get("date_to"):
+            clauses.append("substr(created, 1, 10) <= ?")
+            params.append(filters["date_to"])
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM outputs {where}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT filename, created, field, subject, num_questions FROM outputs {where} "
+                "ORDER BY created DESC, filename DESC LIMIT ? OFFSET ?",
+                params + [limit, offset],
+            ).fetchall()
+        files = [
+            {"filename": filename, "생성일자": created, "대분야": field, "주제": subject, "문항 수": num_questions}
+            for filename, created, field, subject, num_questions in rows
+        ]
+        return {"files": files, "total": total, "offset": offset, "limit": limit}
+
+    def get_document(self, filename: str) -> Optional[Dict[str, Any]]:
+        """결과 문서 (없거나 아직 받지 않았으면 None)"""
+        with self._lock:
+            row = self._conn.execute("SELECT document FROM outputs WHERE filename = ?", (filename,)).fetchone()
+        return _decompress(row[0]) if row and row[0] is not None else None
+
+    def put_document(self, filename: str, document: Dict[str, Any]):
+        """이미 목록에 있는 파일의 결과 문서 저장"""
+        blob = _compress(document)
+        with self._lock, self._conn:
+            self._unindex([filename])
+            updated = self._conn.execute("UPDATE outputs SET document = ? WHERE filename = ?", (blob, filename)).rowcount
+            if updated:
+                self._index(filename, document)
+
+    def upsert_meta(self, metas: Iterable[Dict[str, Any]]):
+        """메타데이터 반영 - 변경된 파일은 결과 문서를 비워서 다시 받도록 함"""
+        now = time.time()
+        rows = [
+            (meta["filename"], meta.get("생성일자", ""), meta.get("대분야", ""), meta.get("주제", ""),
+             int(meta.get("문항 수") or 0), _modified(meta), now)
+            for meta in metas
+        ]
+        with self._lock, self._conn:
+            # 변경된 파일은 결과 문서를 비우기 전에 색인에서 제거
+            indexed = dict(self._conn.execute(
+                "SELECT o.filename, o.modified FROM outputs o JOIN search_docs d ON d.filename = o.filename"
+            ).fetchall())
+            self._unindex([row[0] for row in rows if row[0] in indexed and indexed[row[0]] != row[5]])
+            self._conn.executemany(
+                "INSERT INTO outputs (filename, created, field, subject, num_questions, modified, synced_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(filename) DO UPDATE SET created = excluded.created, field = excluded.field, "
+                "subject = excluded.subject, num_questions = excluded.num_questions, synced_at = excluded.synced_at, "
+                "document = CASE WHEN outputs.modified = excluded.modified THEN outputs.document ELSE NULL END, "
+                "modified = excluded.modified",
+                rows,
+            )
+
+    def delete(self, filenames: Iterable[str]):
+        filenames = list(filenames)
+        with self._lock, self._conn:
+            self._unindex(filenames)
+            self._conn.executemany("DELETE FROM outputs WHERE filename = ?", [(f,) for f in filenames])
+
+    def index_pending(self, limit: int = 1000) -> int:
+        """결과 문서는 있지만 검색 색인이나 지문 서명이 없는 파일 색인 (기존 저장소 backfill) - 색인한 개수 반환"""
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT filename, document FROM outputs WHERE document IS NOT NULL "
+                "AND (filename NOT IN (SELECT filename FROM search_docs) "
+                "OR filename NOT IN (SELECT filename FROM passage_signatures)) LIMIT ?", (limit,)
+            ).fetchall()
+            for filename, blob in rows:
+                self._unindex([filename])
+                self._index(filename, _decompress(blob))
+        return len(rows)
+
+    def search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """전문 검색 - bm25 순위 상위 limit개 (메타데이터 + 일치 필드 + 스니펫 HTML)"""
+        match = build_match(query)
+        if match is None:
+            return []
+        weights = ", ".join(str(w) for w in FIELD_WEIGHTS)
+        with self._lock:
+            # 순위는 색인만으로 계산하고, 상위 limit개만 메타데이터/결과 문서와 조인
+            rows = self._conn.execute(
+                "SELECT o.filename, o.created, o.field, o.subject, o.num_questions, o.document, top.score FROM ("
+                f"SELECT rowid, bm25(search_fts, {weights}) AS score FROM search_fts "
+                "WHERE search_fts MATCH ? ORDER BY score LIMIT ?"
+                ") AS top JOIN search_docs d ON d.id = top.rowid JOIN outputs o ON o.filename = d.filename "
+                "ORDER BY top.score",
+                (match, limit),
+            ).fetchall()
+        hits = []
+        for filename, created, field, subject, num_questions, blob, score in rows:
+            matched_field, snippet = make_snippet(document_fields(_decompress(blob)), query)
+            hits.append({
+                "filename": filename, "생성일자": created, "대분야": field, "주제": subject, "문항 수": num_questions,
+                "score": -score, "field": matched_field, "snippet": snippet,
+            })
+        return hits
+
+    def similar_passages(self, document: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD,
+                         exclude: Optional[str] = None, limit: int = 5) -> List[Dict[str, Any]]:
+        """지문이 비슷한 저장된 결과 (추정 유사도 내림차순, 메타데이터 + similarity)"""
+        signature = self._hasher.signature(passage_text(document.get('passage')))
+        if signature is None:
+            return []
+        hits = self._lsh.query(signature, threshold, exclude=exclude)[:limit]
+        if not hits:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT filename, created, field, subject, num_questions FROM outputs "
+                f"WHERE filename IN ({', '.join('?' * len(hits))})", [filename for filename, _ in hits]
+            ).fetchall()
+        metas = {
+            filename: {"filename": filename, "생성일자": created, "대분야": field, "주제": subject, "문항 수": num_questions}
+            for filename, created, field, subject, num_questions in rows
+        }
+        return [{**metas[filename], "similarity": score} for filename, score in hits if filename in metas]
+
+    def similar_subjects(self, subject: str, threshold: float = 0.5, limit: int = 5) -> List[Dict[str, Any]]:
+        """주제가 비슷한 저장된 결과의 주제별 건수 (유사도 내림차순)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT subject, COUNT(*), MAX(created) FROM outputs GROUP BY subject"
+            ).fetchall()
+        scored = [
+            {"주제": name, "count": count, "생성일자": created, "similarity": subject_similarity(subject, name)}
+            for name, count, created in rows
+        ]
+        scored = [item for item in scored if item["similarity"] >= threshold]
+        return sorted(scored, key=lambda item: item["similarity"], reverse=True)[:limit]
+
+    def filenames(self) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT filename FROM outputs")]
+
+    def missing_documents(self, limit: int) -> List[str]:
+        """결과 문서를 아직 받지 않은 파일 (최신순)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT filename FROM outputs WHERE document IS NULL ORDER BY created DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def get_state(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_state(self, key: str, value: Optional[str]):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO sync_state (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value),
+            )
+
+    def _index(self, filename: str, document: Dict[str, Any]):
+        """문서 색인 (lock, 트랜잭션 보유 상태에서 호출, 기존 색인은 먼저 _unindex)"""
+        doc_id = self._conn.execute("INSERT INTO search_docs (filename) VALUES (?)", (filename,)).lastrowid
+        self._conn.execute(
+            f"INSERT INTO search_fts (rowid, {', '.join(SEARCH_FIELDS)}) VALUES (?, ?, ?, ?)",
+            [doc_id] + self._index_values(document),
+        )
+        # 지문이 비어 있으면 빈 서명을 저장 (backfill 대상에서 빠지도록)
+        signature = self._hasher.signature(passage_text(document.get('passage')))
+        self._conn.execute(
+            "INSERT OR REPLACE INTO passage_signatures (filename, signature) VALUES (?, ?)",
+            (filename, b"" if signature is None else signature.tobytes()),
+        )
+        if signature is not None:
+            self._lsh.add(filename, signature)
+        self.index_version += 1
+
+    def _unindex(self, filenames: Iterable[str]):
+        """색인에서 제거 - 결과 문서가 남아 있을 때 호출 (lock, 트랜잭션 보유 상태에서 호출)"""
+        for filename in filenames:
+            self._conn.execute("DELETE FROM passage_signatures WHERE filename = ?", (filename,))
+            self._lsh.remove(filename)
+            row = self._conn.execute(
+                "SELECT d.id, o.document FROM search_docs d LEFT JOIN outputs o ON o.filename = d.filename "
+                "WHERE d.filename = ?", (filename,)
+            ).fetchone()
+            if row is None:
+                continue
+            doc_id, blob = row
+            if blob is not None:
+                self._conn.execute(
+                    f"INSERT INTO search_fts (search_fts, rowid, {', '.join(SEARCH_FIELDS)}) VALUES ('delete', ?, ?, ?, ?)",
+                    [doc_id] + self._index_values(_decompress(blob)),
+                )
+            self._conn.execute("DELETE FROM search_docs WHERE id = ?", (doc_id,))
+            self.index_version += 1
+
+    @staticmethod
+    def _index_values(document: Dict[str, Any]) -> List[str]:
+        fields = document_fields(document)
+        return [index_text(fields[name]) for name in SEARCH_FIELDS]
+
+
+class StoreSync:
+    """백엔드 → 로컬 저장소 증분 동기화 (백그라운드 스레드)
+
+    - 전체 목록의 ETag가 그대로면(304) 목록을 다시 받지 않음
+    - 목록이 바뀌었으면 메타데이터를 반영하고, 백엔드에서 사라진 파일은 로컬에서도 삭제
+    - 결과 문서는 새로 생기거나 바뀐 파일만, 한 번에 max_pulls개까지 받음
+    - 받거나 저장할 수 없는 결과 문서는 건너뛰고 failed에 기록 (목록이 바뀌면 다시 시도)
+    """
+
+    def __init__(self, client: BackendClient, store: LocalStore, interval: float = 60.0, max_pulls: int = 200):
+        self.client = client
+        self.store = store
+        self.interval = interval
+        self.max_pulls = max_pulls
+        last_sync_at = store.get_state("last_sync_at")
+        self.last_sync_at: Optional[float] = float(last_sync_at) if last_sync_at else None
+        self.last_error: Optional[str] = None
+        self.failed: Dict[str, str] = {}  # 파일 이름 → 오류 메시지
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="store-sync", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def trigger(self):
+        """다음 주기를 기다리지 않고 바로 동기화"""
+        self._wake.set()
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self.sync_once()
+            except Exception as e:  # 백엔드 장애 등 - 다음 주기에 다시 시도
+                self.last_error = str(e)
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def sync_once(self) -> Dict[str, int]:
+        """동기화 한 번 실행 - 반영 건수 반환"""
+        stats = {"listed": 0, "deleted": 0, "pulled": 0, "failed": 0, "indexed": 0}
+        etag = self.store.get_state("list_etag")
+        page, new_etag = self.client.list_outputs_page(0, SYNC_PAGE_SIZE, etag=etag)
+        if page is not None:
+            metas = list(page["files"])
+            while len(metas) < page["total"] and page["files"]:
+                page, _ = self.client.list_outputs_page(len(metas), SYNC_PAGE_SIZE)
+                metas.extend(page["files"])
+            remote = {meta["filename"] for meta in metas}
+            removed = [filename for filename in self.store.filenames() if filename not in remote]
+            self.store.upsert_meta(metas)
+            self.store.delete(removed)
+            # 목록과 삭제를 반영한 뒤에 ETag 저장 (중간에 실패하면 다음 주기에 다시 받음)
+            self.store.set_state("list_etag", new_etag)
+            stats["listed"], stats["deleted"] = len(metas), len(removed)
+            self.failed.clear()
+
+        # 실패한 파일이 최신 파일 자리를 차지하여 나머지 동기화를 막지 않도록 제외
+        missing = self.store.missing_documents(self.max_pulls + len(self.failed))
+        for filename in [f for f in missing if f not in self.failed][:self.max_pulls]:
+            if self._stop.is_set():
+                break
+            try:
+                self.store.put_document(filename, self.client.get_output(filename))
+            except BackendError as e:
+                if e.status_code == 404:
+                    self.store.delete([filename])  # 목록 조회 이후 삭제된 파일
+                    stats["deleted"] += 1
+                    continue
+                if e.status_code is None:
+                    raise  # 백엔드 연결 실패 - 다음 주기에 다시 시도
+                self._skip(filename, e)
+                stats["failed"] += 1
+            except Exception as e:  # 저장/색인할 수 없는 결과 문서
+                self._skip(filename, e)
+                stats["failed"] += 1
+            else:
+                stats["pulled"] += 1
+
+        # 이전 버전 저장소에서 받은 결과 문서 색인 (새로 받는 문서는 저장과 함께 색인됨)
+        stats["indexed"] = self.store.index_pending()
+
+        self.last_sync_at = time.time()
+        self.store.set_state("last_sync_at", str(self.last_sync_at))
+        self.last_error = None
+        return stats
+
+    def _skip(self, filename: str, error: Exception):
+        self.failed[filename] = str(error) or type(error).__name__
+        logger.warning("결과 문서 동기화 실패, 건너뜀: %s (%s)", filename, self.failed[filename])
@@ -0,0 +1,83 @@
+"""
+스트리밍 부분 결과
+생성 중 SSE로 먼저 도착한 소재 카드, 지문, 완성된 문항을 모아 두는 상태
+"""
+from typing import Any, Dict, Optional
+
+from result_model import Question, ResultValidationError
+
+# 부분 결과 payload가 붙는 단계
+PARTIAL_STEPS = ('card', 'passage', 'question')
+
+
+class PartialResult:
+    """생성 중인 결과의 도착한 부분
+
+    - 단계 완료 이벤트(progress complete, 또는 partial 이벤트)의 data를 단계별로 보관
+    - 문항은 검증된 Question으로 번호별 보관하므로 완료 순서와 관계없이 번호 순으로 조회 (보기형 문항이 먼저 완료될 수 있음)
+    - payload는 받은 뒤 변경하지 않는다고 가정 (copy()는 얕은 복사)
+    """
+    __slots__ = ("card", "passage", "questions", "revision")
+
+    def __init__(self):
+        self.card: Optional[Dict[str, Any]] = None
+        self.passage: Optional[Dict[str, Any]] = None
+        self.questions: Dict[int, Question] = {}
+        self.revision = 0  # 부분 결과가 바뀔 때마다 증가 (HTML 재생성 판단용)
+
+    def __bool__(self) -> bool:
+        return self.card is not None or self.passage is not None or bool(self.questions)
+
+    @property
+    def subject(self) -> Optional[str]:
+        return self.card.get('subject') if self.card else None
+
+    def apply_event(self, data: Dict[str, Any]) -> bool:
+        """SSE 이벤트의 부분 결과 반영 (payload가 없거나 알 수 없는 단계, 형식이 잘못된 문항이면 무시) - 반영 여부 반환"""
+        step, payload = data.get('step'), data.get('data')
+        if step not in PARTIAL_STEPS or not isinstance(payload, dict):
+            return False
+        if step == 'card':
+            self.card = payload
+        elif step == 'passage':
+            self.passage = payload
+        else:
+            try:
+                question = Question.from_dict(payload, data.get('question_number'))
+            except ResultValidationError:
+                return False
+            self.questions[question.number] = question
+        self.revision += 1
+        return True
+
+    def sorted_questions(self) -> list:
+        """도착한 문항 (번호 순)"""
+        return [self.questions[number] for number in sorted(self.questions)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """공유 저장소용 직렬화 (JSON 키는 문자열이므로 문항 번호도 문자열)"""
+        return {
+            "card": self.card,
+            "passage": self.passage,
+            "questions": {str(number): q.to_dict() for number, q in self.questions.items()},
+            "revision": self.revision,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PartialResult":
+        partial = cls()
+        partial.card = data.get("card")
+        partial.passage = data.get("passage")
+        partial.questions = {
+            int(number): Question.from_dict(q, int(number)) for number, q in (data.get("questions") or {}).items()
+        }
+        partial.revision = data.get("revision", 0)
+        return partial
+
+    def copy(self) -> "PartialResult":
+        partial = PartialResult()
+        partial.card = self.card
+        partial.passage = self.passage
+        partial.questions = dict(self.questions)
+        partial.revision = self.revision
+        return partial
@@ -0,0 +1,162 @@
+"""
+생성 진행 상태
+(단계, 문항 번호)로 인덱싱된 태스크 상태와 단계별 시작/종료 시각
+"""
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# 태스크 상태
+TASK_PENDING = 'pending'
+TASK_IN_PROGRESS = 'in_progress'
+TASK_COMPLETE = 'complete'
+TASK_ERROR = 'error'
+TASK_STATUSES = (TASK_PENDING, TASK_IN_PROGRESS, TASK_COMPLETE, TASK_ERROR)
+
+# (step, question_number) - 카드/지문 단계는 문항 번호 None
+TaskKey = Tuple[str, Optional[int]]
+
+
+class TaskState:
+    """태스크 하나의 상태 (시각은 time.monotonic 기준)"""
+    __slots__ = ("key", "label", "status", "started_at", "ended_at")
+
+    def __init__(self, key: TaskKey, label: str):
+        self.key = key
+        self.label = label
+        self.status = TASK_PENDING
+        self.started_at: Optional[float] = None
+        self.ended_at: Optional[float] = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """소요 시간(초), 시작/종료가 모두 기록된 경우에만"""
+        if self.started_at is None or self.ended_at is None:
+            return None
+        return self.ended_at - self.started_at
+
+    def copy(self) -> "TaskState":
+        task = TaskState(self.key, self.label)
+        task.status = self.status
+        task.started_at = self.started_at
+        task.ended_at = self.ended_at
+        return task
+
+
+class ProgressState:
+    """생성 진행 상태
+
+    - 태스크는 (step, question_number) 키로 O(1) 조회
+    - 진행 중인 태스크(active)를 직접 추적하여 새 단계 시작 시 전체 재탐색 없이 완료 처리
+    - 상태별 태스크 수를 전이 시점에 증감
+    """
+
+    def __init__(self, num_questions: int):
+        keys: List[Tuple[TaskKey, str]] = [
+            (('card', None), '논리 구조 설계'),
+            (('passage', None), '지문 생성'),
+        ]
+        keys += [(('question', i + 1), f'{i+1}번 문항 생성') for i in range(num_questions)]
+        self.tasks = [TaskState(key, label) for key, label in keys]
+        self._index: Dict[TaskKey, TaskState] = {task.key: task for task in self.tasks}
+        self.active: Optional[TaskState] = None
+        self.counts = dict.fromkeys(TASK_STATUSES, 0)
+        self.counts[TASK_PENDING] = len(self.tasks)
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    @property
+    def completed(self) -> int:
+        return self.counts[TASK_COMPLETE]
+
+    @staticmethod
+    def event_key(data: Dict[str, Any]) -> TaskKey:
+        """SSE progress 이벤트의 태스크 키"""
+        step = data['step']
+        return (step, data.get('question_number') if step == 'question' else None)
+
+    def get(self, key: TaskKey) -> Optional[TaskState]:
+        return self._index.get(key)
+
+    def apply_event(self, data: Dict[str, Any], now: Optional[float] = None):
+        """SSE progress 이벤트 반영 (알 수 없는 단계는 무시)"""
+        task = self._index.get(self.event_key(data))
+        if task is None:
+            return
+        now = time.monotonic() if now is None else now
+        if data['status'] == 'start':
+            self.start(task, now)
+        elif data['status'] == 'complete':
+            self.complete(task, now)
+
+    def start(self, task: TaskState, now: float):
+        """태스크 시작 - 이전 진행 중 태스크는 완료 처리"""
+        if self.active is not None and self.active is not task:
+            self.complete(self.active, now)
+        if task.started_at is None:
+            task.started_at = now
+        self._set_status(task, TASK_IN_PROGRESS)
+        self.active = task
+
+    def complete(self, task: TaskState, now: float):
+        """태스크 완료"""
+        if task.started_at is None:
+            task.started_at = now
+        task.ended_at = now
+        self._set_status(task, TASK_COMPLETE)
+        if self.active is task:
+            self.active = None
+
+    def complete_all(self, now: Optional[float] = None):
+        """결과 수신 시 남은 태스크 모두 완료 처리"""
+        now = time.monotonic() if now is None else now
+        for task in self.tasks:
+            if task.status != TASK_COMPLETE:
+                self.complete(task, now)
+
+    def fail_active(self, now: Optional[float] = None):
+        """진행 중이던 태스크를 error 상태로 변경"""
+        if self.active is not None:
+            self.active.ended_at = time.monotonic() if now is None else now
+            self._set_status(self.active, TASK_ERROR)
+            self.active = None
+
+    def durations(self) -> Dict[TaskKey, float]:
+        """완료된 태스크별 소요 시간(초)"""
+        return {task.key: task.duration for task in self.tasks if task.duration is not None}
+
+    def copy(self) -> "ProgressState":
+        """UI 렌더링용 복사본"""
+        state = ProgressState.__new__(ProgressState)
+        state.tasks = [task.copy() for task in self.tasks]
+        state._index = {task.key: task for task in state.tasks}
+        state.active = state._index[self.active.key] if self.active is not None else None
+        state.counts = dict(self.counts)
+        return state
+
+    def to_list(self) -> List[list]:
+        """공유 저장소용 직렬화 ([step, 문항 번호, 레이블, 상태, 시작, 종료] 목록, 시각은 소요 시간 계산에만 사용)"""
+        return [[task.key[0], task.key[1], task.label, task.status, task.started_at, task.ended_at] for task in self.tasks]
+
+    @classmethod
+    def from_list(cls, rows: List[list]) -> "ProgressState":
+        """to_list() 결과에서 복원"""
+        state = cls.__new__(cls)
+        state.tasks = []
+        state.active = None
+        state.counts = dict.fromkeys(TASK_STATUSES, 0)
+        for step, number, label, status, started_at, ended_at in rows:
+            task = TaskState((step, number), label)
+            task.status, task.started_at, task.ended_at = status, started_at, ended_at
+            state.tasks.append(task)
+            state.counts[status] += 1
+            if status == TASK_IN_PROGRESS:
+                state.active = task
+        state._index = {task.key: task for task in state.tasks}
+        return state
+
+    def _set_status(self, task: TaskState, status: str):
+        if task.status != status:
+            self.counts[task.status] -= 1
+            self.counts[status] += 1
+            task.status = status
@@ -0,0 +1,120 @@
+"""
+진행 현황 뷰
+작업 상태가 바뀐 프레임에서 바뀐 행만 다시 계산하고, 패널 전체를 요소 하나로 내보내는 Streamlit 컴포넌트
+"""
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import streamlit as st
+
+from progress_state import TASK_COMPLETE, TASK_ERROR, TASK_IN_PROGRESS, TASK_PENDING, ProgressState
+
+# 상태별 (스피너, 배지, 텍스트 스타일)
+_BADGE_STYLE = 'padding: 2px 8px; border-radius: 10px; font-size: 0.85em;'
+_STATUS_STYLES = {
+    TASK_PENDING: (
+        '',
+        f'<span style="background-color: #e0e0e0; color: #666; {_BADGE_STYLE} font-weight: 500;">대기</span>',
+        'font-size: 0.95em;',
+    ),
+    TASK_IN_PROGRESS: (
+        '<span class="spinner"></span>',
+        f'<span style="background-color: #1976d2; color: white; {_BADGE_STYLE} font-weight: 600;">진행중</span>',
+        'font-size: 0.95em; font-weight: 500;',
+    ),
+    TASK_COMPLETE: (
+        '',
+        f'<span style="background-color: #4caf50; color: white; {_BADGE_STYLE} font-weight: 500;">완료</span>',
+        'font-size: 0.95em; color: #999;',
+    ),
+    TASK_ERROR: (
+        '',
+        f'<span style="background-color: #f44336; color: white; {_BADGE_STYLE} font-weight: 500;">❌ 오류</span>',
+        'font-size: 0.95em; color: #f44336;',
+    ),
+}
+_DEFAULT_STYLE = ('', '', 'font-size: 0.95em;')
+
+_HEADER_HTML = (
+    '<h3>🔄 진행 현황</h3>'
+    '<blockquote>문항 유형에 따라 생성 순서가 달라질 수 있습니다. 보기형 문항을 우선적으로 생성합니다.</blockquote>'
+)
+
+
+@lru_cache(maxsize=256)
+def render_task_row(label: str, status: str, seconds: Optional[int] = None) -> str:
+    """태스크 한 행의 HTML (스피너 + 레이블 + 소요 시간 + 배지), 같은 입력이면 한 번만 생성"""
+    spinner_html, badge_html, text_style = _STATUS_STYLES.get(status, _DEFAULT_STYLE)
+    if seconds is not None:
+        badge_html = f'<span style="color: #999; font-size: 0.8em; margin-right: 8px;">{seconds}초</span>{badge_html}'
+
+    return (
+        f'<div style="display: flex; justify-content: space-between; align-items: center; padding: 6px 0; '
+        f'border-bottom: 1px solid #f0f0f0;">'
+        f'<div style="display: flex; align-items: center;">'
+        f'{spinner_html}'
+        f'<span style="{text_style}">{label}</span>'
+        f'</div>'
+        f'<div>{badge_html}</div>'
+        f'</div>'
+    )
+
+
+def render_progress_bar(completed: int, total: int) -> str:
+    """전체 진행률 막대 HTML"""
+    percent = round(completed / total * 100) if total else 0
+    return (
+        f'<div style="font-size: 0.9em; margin-bottom: 4px;">전체 진행률: {completed}/{total}</div>'
+        f'<div style="background-color: #e0e0e0; border-radius: 4px; height: 8px; margin-bottom: 8px;">'
+        f'<div style="background-color: #1976d2; border-radius: 4px; height: 8px; width: {percent}%;"></div>'
+        f'</div>'
+    )
+
+
+class ProgressView:
+    """진행 현황 패널 (작업마다 하나를 세션 상태에 보관)
+
+    update()는 작업 revision이 바뀐 경우에만 상태가 바뀐 행의 HTML과 카운터를 다시 계산하고,
+    바뀐 것이 있을 때만 패널 HTML(헤더, 진행률 막대, 행)을 다시 조립한다.
+    render()는 조립해 둔 패널을 st.markdown 하나로 내보낸다. 프래그먼트 실행에서 다시 보내지 않은 요소는 지워지므로
+    바뀌지 않은 프레임에도 보내야 하지만, 태스크마다 요소를 두는 대신 요소 하나의 캐시된 HTML만 보낸다.
+    갱신은 호출하는 프래그먼트의 실행 간격마다 한 번이므로 그 사이의 이벤트는 한 번의 갱신으로 합쳐진다.
+    """
+
+    def __init__(self, num_tasks: int):
+        self.revision: Optional[int] = None
+        self._rows: List[Optional[Tuple[str, str, Optional[int]]]] = [None] * num_tasks
+        self._row_html: List[str] = [""] * num_tasks
+        self._completed = 0
+        self._total = num_tasks
+        self._html = ""
+
+    def update(self, state: ProgressState, revision: int) -> List[int]:
+        """새 상태 반영 (revision이 그대로면 아무것도 하지 않음) - 다시 계산한 행 번호 목록"""
+        if revision == self.revision:
+            return []
+        self.revision = revision
+        counters = (state.completed, len(state))
+        counters_changed = counters != (self._completed, self._total)
+        self._completed, self._total = counters
+
+        changed = []
+        for idx, task in enumerate(state.tasks[:len(self._rows)]):
+            duration = task.duration if task.status == TASK_COMPLETE else None
+            row = (task.label, task.status, round(duration) if duration is not None else None)
+            if row != self._rows[idx]:
+                self._row_html[idx] = render_task_row(*row)
+                self._rows[idx] = row
+                changed.append(idx)
+        if changed or counters_changed or not self._html:
+            self._html = _HEADER_HTML + render_progress_bar(self._completed, self._total) + "".join(self._row_html)
+        return changed
+
+    @property
+    def html(self) -> str:
+        """마지막으로 반영한 상태의 패널 HTML"""
+        return self._html
+
+    def render(self):
+        """마지막으로 반영한 상태 표시 (요소 하나)"""
+        st.markdown(self._html, unsafe_allow_html=True)
@@ -0,0 +1,217 @@
+"""
+결과 HTML 렌더링
+지문/문항/해설 HTML 조각 생성 및 결과별 최종 HTML 메모이제이션
+"""
+import functools
+import hashlib
+import html
+import json
+import re
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from result_model import NUM_TO_SYMBOL, GenerationResult, Question, passage_text
+
+# (가), (나) 분리형 지문 패턴
+_SECTION_START = re.compile(r'^\s*\(가\)', re.MULTILINE)
+_SECTION_SPLIT = re.compile(r'(\((?:가|나)\))')
+_SECTION_LABELS = frozenset(('(가)', '(나)'))
+
+# <보기> 자료에서 그대로 살리는 서식 태그 (속성 없는 형태만)
+_MATERIAL_TAG = re.compile(r'&lt;(/?)(u|b|strong|i|em|sup|sub)&gt;|&lt;br\s*/?&gt;', re.IGNORECASE)
+
+
+def _paragraphs(parts: List[str], text: str):
+    """줄 단위 문단을 <p>로 추가"""
+    parts.extend(f"<p>{line}</p>" for line in (p.strip() for p in text.split("\n")) if line)
+
+
+def build_passage_html(text: str) -> str:
+    """지문 HTML ((가), (나) 분리형 지문 처리 포함)"""
+    parts: List[str] = ["<div class='passage-font'>"]
+    if _SECTION_START.search(text):
+        for part in _SECTION_SPLIT.split(text):
+            part = part.strip()
+            if not part:
+                continue
+            if part in _SECTION_LABELS:
+                parts.append(f"<p class='section-label'>{part}</p>")
+            else:
+                _paragraphs(parts, part)
+    else:
+        # 일반 지문
+        _paragraphs(parts, text)
+    parts.append("</div>")
+    return "".join(parts)
+
+
+@functools.lru_cache(maxsize=1024)
+def material_html(text: str) -> str:
+    """<보기> 자료 HTML - 이스케이프 후 허용된 서식 태그만 복원, 줄바꿈은 <br/> (같은 자료는 캐시)"""
+    escaped = html.escape(text.strip(), quote=False)
+    escaped = _MATERIAL_TAG.sub(lambda m: f"<{m.group(1)}{m.group(2).lower()}>" if m.group(2) else "<br/>", escaped)
+    return escaped.replace("\n", "<br/>")
+
+
+def build_question_html(q: Question) -> str:
+    """문항 하나의 HTML (해설 제외)"""
+    # 발문에서 '않은' 밑줄 처리
+    question_text = q.text.replace('않은', '<u>않은</u>')
+    parts = [
+        "<div class='question-font question-block'>",
+        f"<div class='q-header'>{q.number}. {question_text}</div>",
+    ]
+    if q.material:
+        parts.append(f"<div class='q-material'><div class='passage-font'>{material_html(q.material)}</div></div>")
+    parts.append("<div class='q-choices'>")
+    parts.extend(f"<p>{NUM_TO_SYMBOL[i]} {choice}</p>" for i, choice in enumerate(q.choices, 1))
+    parts.append("</div></div>")
+    return "".join(parts)
+
+
+def build_questions_html(questions: List[Question]) -> str:
+    """문항 목록 HTML (해설 제외)"""
+    return "".join(build_question_html(q) for q in questions)
+
+
+def build_explanation_body_html(q: Question) -> str:
+    """문항 하나의 해설 본문 HTML (정답 풀이 + 오답 해설, 문항 번호 제목 제외)"""
+    parts = [
+        "<div class='question-font'>",
+        f"<strong>정답. {q.answer_symbol}</strong><br/><br/>",
+        # [정답 풀이]
+        "<strong>[정답 풀이]</strong><br/>",
+        f"{q.explanations[q.answer - 1]}<br/><br/>",
+        # [오답 해설]
+        "<strong>[오답 해설]</strong><br/>",
+    ]
+    parts.extend(
+        f"<p class='explanation-item'>{NUM_TO_SYMBOL[i]} {explanation}</p>"
+        for i, explanation in enumerate(q.explanations, 1) if i != q.answer
+    )
+    parts.append("</div>")
+    return "".join(parts)
+
+
+def build_explanation_html(q: Question) -> str:
+    """문항 하나의 해설 HTML (문항 번호 제목 포함)"""
+    return (
+        "<div class='explanation-item-block'>"
+        f"<h4>{q.number}번 문항</h4>"
+        f"{build_explanation_body_html(q)}</div>"
+    )
+
+
+def build_explanations_html(questions: List[Question]) -> str:
+    """모든 해설을 하나로 이어 붙인 HTML"""
+    return "<div class='explanation-section'>" + "".join(build_explanation_html(q) for q in questions) + "</div>"
+
+
+def build_content_html(passage_html: str, questions_html: str) -> str:
+    """지문 + 문항 2단 배치 HTML"""
+    return (
+        "<div class=\"content-wrapper\"><div class=\"content-container\">"
+        f"<div class=\"passage-section\">{passage_html}</div>"
+        f"<div class=\"questions-section\">{questions_html}</div>"
+        "</div></div>"
+    )
+
+
+def build_partial_content_html(partial, num_questions: int) -> str:
+    """생성 중 부분 결과의 지문 + 문항 2단 배치 HTML (아직 도착하지 않은 부분은 생성 중 표시, 문항은 검증된 Question)"""
+    if partial.passage is not None:
+        passage_html = build_passage_html(passage_text(partial.passage))
+    else:
+        passage_html = "<div class='passage-font pending-block'><p>지문 생성 중…</p></div>"
+    parts = []
+    for number in range(1, max(num_questions, max(partial.questions, default=0)) + 1):
+        q = partial.questions.get(number)
+        if q is not None:
+            parts.append(build_question_html(q))
+        else:
+            parts.append(f"<div class='question-font question-block pending-block'>{number}. 문항 생성 중…</div>")
+    return build_content_html(passage_html, "".join(parts))
+
+
+def content_hash(result: GenerationResult) -> str:
+    """결과 내용 해시 (원본 문서 기준, 같은 내용이면 객체가 달라도 같은 값)"""
+    payload = json.dumps(result.raw, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class RenderedResult:
+    """결과 하나의 최종 HTML
+
+    해설 HTML은 처음 조회할 때 생성 (해설 탭을 열지 않으면 만들지 않음)
+    """
+    __slots__ = ("subject", "content_html", "_questions", "_explanation_chunks", "_explanations_html")
+
+    def __init__(self, result: GenerationResult):
+        self.subject = result.subject
+        self.content_html = build_content_html(
+            build_passage_html(result.passage),
+            build_questions_html(result.questions),
+        )
+        self._questions = result.questions
+        self._explanation_chunks: Optional[List[Tuple[str, str]]] = None
+        self._explanations_html: Optional[str] = None
+
+    @property
+    def explanation_chunks(self) -> List[Tuple[str, str]]:
+        """문항별 해설 (제목, HTML) 목록 - 뷰어에서 문항마다 접을 수 있게 나누어 표시"""
+        if self._explanation_chunks is None:
+            self._explanation_chunks = [
+                (
+                    f"{q.number}번 문항",
+                    f"<div class='explanation-section'>{build_explanation_body_html(q)}</div>",
+                )
+                for q in self._questions
+            ]
+        return self._explanation_chunks
+
+    @property
+    def explanations_html(self) -> str:
+        """모든 해설을 이어 붙인 HTML (내보내기용)"""
+        if self._explanations_html is None:
+            self._explanations_html = build_explanations_html(self._questions)
+        return self._explanations_html
+
+
+class RenderCache:
+    """결과별 최종 HTML 메모이제이션 (프로세스 공유)
+
+    같은 결과 객체는 id로 바로 찾고 (해시 계산 생략), 처음 보는 객체는 내용 해시로 찾는다.
+    결과 객체는 렌더링 이후 변경하지 않는다고 가정한다.
+    """
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._by_hash: "OrderedDict[str, RenderedResult]" = OrderedDict()
+        # id(result) -> (result, 해시) - 결과 참조를 보관하여 id 재사용을 막음
+        self._by_id: "OrderedDict[int, tuple]" = OrderedDict()
+
+    def render(self, result: GenerationResult) -> RenderedResult:
+        with self._lock:
+            entry = self._by_id.get(id(result))
+            if entry is not None and entry[0] is result and entry[1] in self._by_hash:
+                self._by_hash.move_to_end(entry[1])
+                return self._by_hash[entry[1]]
+
+        key = content_hash(result)
+        with self._lock:
+            rendered = self._by_hash.get(key)
+        if rendered is None:
+            rendered = RenderedResult(result)
+
+        with self._lock:
+            self._by_hash[key] = rendered
+            self._by_hash.move_to_end(key)
+            self._by_id[id(result)] = (result, key)
+            self._by_id.move_to_end(id(result))
+            while len(self._by_hash) > self.max_entries:
+                self._by_hash.popitem(last=False)
+            while len(self._by_id) > self.max_entries:
+                self._by_id.popitem(last=False)
+        return rendered
@@ -0,0 +1,170 @@
+"""
+생성 결과 모델
+백엔드/SSE 결과 문서(JSON)를 한 번 검증하여 만드는 읽기 전용 객체 - 지문 필드 변형과 정답 표기를 정규화
+캐시와 세션은 같은 객체를 참조로 공유하고, 원본 문서(raw)는 저장/내보내기(JSON)에만 사용
+"""
+from typing import Any, Dict, Optional, Tuple
+
+# 선지 번호 ↔ 기호
+NUM_TO_SYMBOL = {1: '①', 2: '②', 3: '③', 4: '④', 5: '⑤'}
+SYMBOL_TO_NUM = {symbol: num for num, symbol in NUM_TO_SYMBOL.items()}
+
+# 지문 본문 필드 (백엔드 버전에 따라 이름이 다름, 앞쪽 우선)
+PASSAGE_FIELDS = ('passage', 'content', 'passage_text')
+
+# 선지 개수
+NUM_CHOICES = 5
+
+DEFAULT_SUBJECT = '생성된 지문'
+
+
+class ResultValidationError(ValueError):
+    """결과 문서 형식 오류 (메시지 앞에 문제 항목 경로 포함, 예: questions[1].answer)"""
+
+
+def _text(value: Any, path: str) -> str:
+    """문자열 필드 (없으면 빈 문자열, 숫자는 문자열로 변환)"""
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise ResultValidationError(f"{path}: 문자열이어야 합니다 ({type(value).__name__})")
+
+
+def _passage(passage: Any) -> str:
+    """지문 본문 - 문자열이거나 PASSAGE_FIELDS 중 먼저 있는 필드를 쓰는 객체 (형식이 잘못되면 ResultValidationError)"""
+    if isinstance(passage, dict):
+        field = next((field for field in PASSAGE_FIELDS if field in passage), PASSAGE_FIELDS[0])
+        return _text(passage.get(field), f"passage.{field}")
+    return _text(passage, "passage")
+
+
+def field_text(value: Any) -> str:
+    """문자열 필드 (_text와 같은 규칙, 형식이 잘못되었으면 빈 문자열) - 검증하지 않은 원본 문서용"""
+    try:
+        return _text(value, "")
+    except ResultValidationError:
+        return ''
+
+
+def passage_text(passage: Any) -> str:
+    """결과 문서의 지문 본문 (GenerationResult와 같은 규칙, 형식이 잘못되었으면 빈 문자열) - 로컬 저장소/검색 색인/부분 결과용"""
+    try:
+        return _passage(passage)
+    except ResultValidationError:
+        return ''
+
+
+def parse_answer(value: Any, path: str = 'answer') -> int:
+    """정답 표기 정규화 ('③', 3, '3', '3번' → 3)"""
+    if isinstance(value, int) and not isinstance(value, bool):
+        number = value
+    elif isinstance(value, str):
+        text = value.strip().removesuffix('번')
+        number = SYMBOL_TO_NUM.get(text) or (int(text) if text.isdecimal() else None)
+    else:
+        number = None
+    if number not in NUM_TO_SYMBOL:
+        raise ResultValidationError(f"{path}: 정답은 ①~⑤ 중 하나여야 합니다 ({value!r})")
+    return number
+
+
+class Question:
+    """문항 하나 (선지/해설은 1~5번 순서의 tuple, 정답은 선지 번호)"""
+    __slots__ = ("number", "type", "text", "material", "choices", "answer", "explanations")
+
+    def __init__(self, number: int, type: str, text: str, material: str,
+                 choices: Tuple[str, ...], answer: int, explanations: Tuple[str, ...]):
+        self.number = number
+        self.type = type
+        self.text = text
+        self.material = material
+        self.choices = choices
+        self.answer = answer
+        self.explanations = explanations
+
+    @property
+    def answer_symbol(self) -> str:
+        return NUM_TO_SYMBOL[self.answer]
+
+    @classmethod
+    def from_dict(cls, data: Any, default_number: Optional[int] = None, path: str = 'question') -> "Question":
+        """문항 dict 검증 (choices_N, explanation_N 필드, 문항 번호가 없으면 default_number)"""
+        if not isinstance(data, dict):
+            raise ResultValidationError(f"{path}: 문항이 객체가 아닙니다 ({type(data).__name__})")
+        number = data.get('question_number', default_number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise ResultValidationError(f"{path}.question_number: 문항 번호가 없거나 숫자가 아닙니다 ({number!r})") from None
+        if 'answer' not in data:
+            raise ResultValidationError(f"{path}.answer: 정답이 없습니다")
+        return cls(
+            number=number,
+            type=_text(data.get('question_type'), f"{path}.question_type"),
+            text=_text(data.get('question'), f"{path}.question"),
+            material=_text(data.get('material'), f"{path}.material"),
+            choices=tuple(_text(data.get(f'choices_{i}'), f"{path}.choices_{i}") for i in range(1, NUM_CHOICES + 1)),
+            answer=parse_answer(data['answer'], f"{path}.answer"),
+            explanations=tuple(
+                _text(data.get(f'explanation_{i}'), f"{path}.explanation_{i}") for i in range(1, NUM_CHOICES + 1)
+            ),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """정규화된 필드로 다시 만든 문항 dict (공유 저장소용)"""
+        data = {
+            "question_number": self.number,
+            "question_type": self.type,
+            "question": self.text,
+            "material": self.material,
+            "answer": self.answer_symbol,
+        }
+        data.update({f"choices_{i}": choice for i, choice in enumerate(self.choices, 1)})
+        data.update({f"explanation_{i}": explanation for i, explanation in enumerate(self.explanations, 1)})
+        return data
+
+
+class GenerationResult:
+    """검증된 생성 결과 (만든 뒤 변경하지 않음 - 캐시와 세션이 같은 객체를 공유)"""
+    __slots__ = ("subject", "card", "passage", "questions", "raw")
+
+    def __init__(self, subject: str, card: Dict[str, Any], passage: str,
+                 questions: Tuple[Question, ...], raw: Dict[str, Any]):
+        self.subject = subject
+        self.card = card
+        self.passage = passage
+        self.questions = questions
+        self.raw = raw
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "GenerationResult":
+        """결과 문서 검증 후 생성 (형식이 잘못되면 ResultValidationError)"""
+        if isinstance(data, GenerationResult):
+            return data
+        if not isinstance(data, dict):
+            raise ResultValidationError(f"결과 문서가 객체가 아닙니다 ({type(data).__name__})")
+
+        card = data.get('card') or {}
+        if not isinstance(card, dict):
+            raise ResultValidationError(f"card: 객체가 아닙니다 ({type(card).__name__})")
+        subject = _text(card.get('subject'), "card.subject") or DEFAULT_SUBJECT
+
+        passage = _passage(data.get('passage'))
+        if not passage.strip():
+            raise ResultValidationError(f"passage: 지문 본문이 없습니다 ({', '.join(PASSAGE_FIELDS)})")
+
+        items = data.get('questions')
+        if not isinstance(items, list):
+            raise ResultValidationError("questions: 문항 목록이 없습니다")
+        questions = tuple(Question.from_dict(q, i + 1, f"questions[{i}]") for i, q in enumerate(items))
+        numbers = [q.number for q in questions]
+        if len(set(numbers)) != len(numbers):
+            raise ResultValidationError(f"questions: 문항 번호가 중복됩니다 ({numbers})")
+        return cls(subject, card, passage, questions, data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """원본 결과 문서 (공유 저장소, JSON 내보내기용 - 복사하지 않음)"""
+        return self.raw
@@ -0,0 +1,97 @@
+"""
+전문 검색 토큰화
+한글 문자 bigram 토큰화, 검색어 → FTS5 MATCH 질의 변환, 검색 결과 스니펫 생성
+(색인 자체는 local_store.LocalStore의 FTS5 테이블에 저장)
+"""
+import html
+import re
+import unicodedata
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from result_model import field_text, passage_text
+
+# 문자/숫자 연속 구간 (FTS5 unicode61 토크나이저가 구분자로 보는 '_' 제외)
+_WORD = re.compile(r"[^\W_]+")
+
+# 색인 필드 (FTS5 컬럼 순서와 동일)와 표시 이름
+SEARCH_FIELDS = ("passage", "questions", "explanations")
+FIELD_LABELS = {"passage": "지문", "questions": "문항", "explanations": "해설"}
+# bm25 필드 가중치 (지문 일치를 우선)
+FIELD_WEIGHTS = (2.0, 1.0, 1.0)
+
+
+def normalize(text: str) -> str:
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def tokenize(text: str) -> Iterator[str]:
+    """문자 bigram 토큰 (한 글자 구간은 그대로)"""
+    for run in _WORD.findall(normalize(text)):
+        if len(run) == 1:
+            yield run
+        else:
+            for i in range(len(run) - 1):
+                yield run[i:i + 2]
+
+
+def index_text(text: str) -> str:
+    """FTS5에 넣을 공백 구분 토큰 문자열"""
+    return " ".join(tokenize(text))
+
+
+def query_terms(query: str) -> List[str]:
+    """검색어의 두 글자 이상 구간 (한 글자 구간은 무시)"""
+    return [run for run in _WORD.findall(normalize(query)) if len(run) >= 2]
+
+
+def build_match(query: str) -> Optional[str]:
+    """검색어 → FTS5 MATCH 식 (구간마다 연속 bigram 구문, 모든 구간 AND), 검색할 구간이 없으면 None"""
+    terms = query_terms(query)
+    if not terms:
+        return None
+    return " AND ".join('"' + " ".join(tokenize(term)) + '"' for term in terms)
+
+
+def document_fields(document: Dict[str, Any]) -> Dict[str, str]:
+    """결과 문서의 필드별 검색 대상 텍스트 (지문 / 발문+선지 / 해설)
+
+    검증하지 않은 원본 문서이므로 null/숫자 값은 GenerationResult와 같은 규칙으로 변환하고, 형식이 잘못된 값은 빈 문자열
+    """
+    questions = document.get('questions')
+    questions = [q for q in questions if isinstance(q, dict)] if isinstance(questions, list) else []
+    return {
+        "passage": passage_text(document.get('passage')),
+        "questions": "\n".join(
+            "\n".join(field_text(q.get(name)) for name in ['question'] + [f'choices_{i}' for i in range(1, 6)])
+            for q in questions
+        ),
+        "explanations": "\n".join(
+            "\n".join(field_text(q.get(f'explanation_{i}')) for i in range(1, 6)) for q in questions
+        ),
+    }
+
+
+def make_snippet(fields: Dict[str, str], query: str, width: int = 40) -> Tuple[str, str]:
+    """검색어가 처음 나오는 필드와 주변 텍스트 HTML (검색어는 <mark>) - 없으면 지문 앞부분"""
+    terms = sorted(query_terms(query), key=len, reverse=True)
+    for field in SEARCH_FIELDS:
+        text = fields.get(field, "")
+        lowered = normalize(text)
+        # NFKC로 길이가 바뀐 텍스트는 위치가 어긋나므로 표시하지 않음
+        if len(lowered) != len(text):
+            continue
+        for term in terms:
+            pos = lowered.find(term)
+            if pos < 0:
+                continue
+            start, end = max(0, pos - width), min(len(text), pos + len(term) + width)
+            snippet = (
+                ("…" if start > 0 else "")
+                + html.escape(text[start:pos])
+                + f"<mark>{html.escape(text[pos:pos + len(term)])}</mark>"
+                + html.escape(text[pos + len(term):end])
+                + ("…" if end < len(text) else "")
+            )
+            return field, " ".join(snippet.split())
+    text = fields.get("passage", "")
+    return "passage", html.escape(" ".join(text[:width * 2].split()))
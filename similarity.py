@@ -0,0 +1,118 @@
+"""
+유사 지문 탐지
+지문 문자 shingle의 MinHash 서명과 LSH 버킷으로 유사 지문 후보를 찾고, 주제는 문자 bigram Jaccard로 비교
+"""
+import re
+import threading
+import unicodedata
+import zlib
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+_WORD = re.compile(r"[^\W_]+")
+
+# a*h + b가 uint64 범위를 넘지 않도록 a, b, h는 2^32 미만, 법은 2^32보다 큰 소수
+_PRIME = np.uint64(4294967311)
+
+# 기본 설정: 128개 해시 = 32 밴드 × 4행 (추정 유사도 0.6에서 후보 포함 확률 약 99%, 0.5에서 약 87%)
+NUM_PERM = 128
+LSH_BANDS = 32
+DEFAULT_THRESHOLD = 0.6
+
+
+def _compact(text: str) -> str:
+    """정규화 후 문자/숫자만 이어 붙임 (띄어쓰기, 문장 부호 차이 무시)"""
+    return "".join(_WORD.findall(unicodedata.normalize("NFKC", text or "").lower()))
+
+
+def shingles(text: str, k: int = 3) -> Set[str]:
+    """문자 k-gram 집합"""
+    compact = _compact(text)
+    if len(compact) <= k:
+        return {compact} if compact else set()
+    return {compact[i:i + k] for i in range(len(compact) - k + 1)}
+
+
+def subject_similarity(a: str, b: str) -> float:
+    """주제 유사도 (문자 bigram Jaccard)"""
+    sa, sb = shingles(a, 2), shingles(b, 2)
+    if not sa or not sb:
+        return 0.0
+    return len(sa & sb) / len(sa | sb)
+
+
+class MinHasher:
+    """MinHash 서명 생성 (같은 seed면 프로세스가 달라도 같은 서명)"""
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self._a = rng.integers(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """지문 서명 (uint64 배열), 비교할 내용이 없으면 None"""
+        grams = shingles(text)
+        if not grams:
+            return None
+        hashes = np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams))
+        return ((np.outer(hashes, self._a) + self._b) % _PRIME).min(axis=0)
+
+    @staticmethod
+    def similarity(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+        """추정 Jaccard 유사도"""
+        return float(np.count_nonzero(sig_a == sig_b)) / len(sig_a)
+
+
+class LSHIndex:
+    """MinHash 서명 LSH 색인 (밴드별 버킷, 스레드 안전)"""
+
+    def __init__(self, num_perm: int = NUM_PERM, bands: int = LSH_BANDS):
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands의 배수여야 합니다.")
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._lock = threading.Lock()
+        self._signatures: Dict[str, np.ndarray] = {}
+        self._buckets: List[Dict[bytes, Set[str]]] = [{} for _ in range(bands)]
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _band_keys(self, signature: np.ndarray) -> Iterable[Tuple[int, bytes]]:
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def add(self, key: str, signature: np.ndarray):
+        with self._lock:
+            self._remove(key)
+            self._signatures[key] = signature
+            for band, band_key in self._band_keys(signature):
+                self._buckets[band].setdefault(band_key, set()).add(key)
+
+    def remove(self, key: str):
+        with self._lock:
+            self._remove(key)
+
+    def _remove(self, key: str):
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for band, band_key in self._band_keys(signature):
+            bucket = self._buckets[band].get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band][band_key]
+
+    def query(self, signature: np.ndarray, threshold: float = DEFAULT_THRESHOLD,
+              exclude: Optional[str] = None) -> List[Tuple[str, float]]:
+        """추정 유사도가 threshold 이상인 (키, 유사도) 목록 (유사도 내림차순)"""
+        with self._lock:
+            candidates: Set[str] = set()
+            for band, band_key in self._band_keys(signature):
+                candidates |= self._buckets[band].get(band_key, set())
+            candidates.discard(exclude)
+            scored = [(key, MinHasher.similarity(signature, self._signatures[key])) for key in candidates]
+        return sorted([hit for hit in scored if hit[1] >= threshold], key=lambda hit: hit[1], reverse=True)
@@ -0,0 +1,115 @@
+"""
+SSE(Server-Sent Events) 디코더
+바이트 청크를 받는 대로 HTML 표준의 이벤트 스트림 규칙에 따라 이벤트로 변환 (스트림 전체를 버퍼링하지 않음)
+"""
+import re
+from typing import List, Optional
+
+# 줄 끝: CRLF, LF, CR
+_LINE_END = re.compile(rb"\r\n|\r|\n")
+_BOM = b"\xef\xbb\xbf"
+
+
+class SSEEvent:
+    """디스패치된 이벤트 하나"""
+    __slots__ = ("event", "data", "id")
+
+    def __init__(self, event: str, data: str, id: str):
+        self.event = event
+        self.data = data
+        self.id = id
+
+    def __repr__(self) -> str:
+        return f"SSEEvent(event={self.event!r}, id={self.id!r}, data={self.data[:40]!r})"
+
+
+class SSEDecoder:
+    """증분 SSE 디코더
+
+    - feed()에 받은 바이트를 그대로 넘기면 완성된 이벤트 목록을 반환 (줄이 청크 경계에 걸쳐도 됨)
+    - 여러 줄 data, event/id/retry 필드, 주석 줄(':'로 시작, heartbeat 용도)을 처리
+    - last_event_id, retry(ms)는 연결이 바뀌어도 유지되므로 재연결 시 같은 디코더를 계속 사용
+    - id는 이벤트가 디스패치될 때 last_event_id에 반영 (받다 만 이벤트의 id로 이어 받으면 그 이벤트를 놓침)
+    """
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._started = False  # 첫 바이트의 BOM 제거 여부 판단용
+        self._pending_cr = False  # 직전 청크가 CR로 끝남 - 이번 청크 첫 LF는 같은 줄 끝
+        self._event = ""
+        self._data: List[str] = []
+        self._id = ""  # 마지막 이벤트 ID 버퍼 - 디스패치 시 last_event_id로 복사
+        self.last_event_id = ""
+        self.retry: Optional[int] = None
+        self.comments = 0  # 받은 주석(heartbeat) 줄 수
+
+    def reset_connection(self):
+        """새 연결 시작 - 끊긴 연결에서 받다 만 줄과 이벤트(id 포함)는 버림 (last_event_id, retry는 유지)"""
+        self._buf.clear()
+        self._started = False
+        self._pending_cr = False
+        self._event = ""
+        self._data = []
+        self._id = self.last_event_id
+
+    def feed(self, chunk: bytes) -> List[SSEEvent]:
+        """바이트 청크 처리 - 이번 청크로 완성된 이벤트 반환"""
+        buf = self._buf
+        buf += chunk
+        if not self._started:
+            if len(buf) < len(_BOM) and _BOM.startswith(bytes(buf)):
+                return []
+            if buf.startswith(_BOM):
+                del buf[:len(_BOM)]
+            self._started = True
+        if self._pending_cr and buf:
+            if buf[0] == 0x0A:
+                del buf[:1]
+            self._pending_cr = False
+
+        events: List[SSEEvent] = []
+        pos = 0
+        while True:
+            match = _LINE_END.search(buf, pos)
+            if match is None:
+                break
+            event = self._process_line(buf[pos:match.start()].decode("utf-8", "replace"))
+            if event is not None:
+                events.append(event)
+            pos = match.end()
+            # 버퍼 끝의 CR은 바로 줄 끝으로 처리 (CR만 쓰는 스트림의 이벤트가 다음 청크까지 늦어지지 않음)
+            self._pending_cr = match.group() == b"\r" and pos == len(buf)
+        if pos:
+            del buf[:pos]
+        return events
+
+    def _process_line(self, line: str) -> Optional[SSEEvent]:
+        if not line:
+            return self._dispatch()
+        if line[0] == ":":
+            self.comments += 1
+            return None
+        name, sep, value = line.partition(":")
+        if sep and value.startswith(" "):
+            value = value[1:]
+        if name == "data":
+            self._data.append(value)
+        elif name == "event":
+            self._event = value
+        elif name == "id":
+            if "\0" not in value:
+                self._id = value
+        elif name == "retry":
+            if value.isascii() and value.isdigit():
+                self.retry = int(value)
+        return None
+
+    def _dispatch(self) -> Optional[SSEEvent]:
+        """빈 줄 - id 버퍼를 반영하고, data가 있으면 이벤트 디스패치 (없으면 event 이름만 초기화)"""
+        self.last_event_id = self._id
+        event = None
+        if self._data:
+            event = SSEEvent(self._event or "message", "\n".join(self._data), self.last_event_id)
+        self._event = ""
+        self._data = []
+        return event
@@ -0,0 +1,133 @@
+"""
+공유 상태 저장소
+여러 앱 프로세스(레플리카)가 함께 보는 생성 작업 상태, 결과 문서, 세션 화면 상태를 보관
+- MemoryStateStore: 프로세스 내부 (단일 프로세스 기본값)
+- SQLiteStateStore: 로컬 디스크의 SQLite 파일 (같은 호스트에서 같은 파일을 여는 프로세스끼리 공유)
+"""
+import abc
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# 만료 항목 정리 주기 (쓰기 횟수)
+_PURGE_EVERY = 500
+
+
+class StateStore(abc.ABC):
+    """상태 저장소 인터페이스 - namespace별 key → JSON으로 표현 가능한 값, 선택적 만료 시간(ttl 초)
+
+    shared가 참이면 다른 프로세스와 공유되는 저장소 (프로세스 캐시의 2차 저장소로 쓸 가치가 있음)
+    """
+
+    shared = False
+
+    @abc.abstractmethod
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """값 조회 (없거나 만료되었으면 None)"""
+
+    @abc.abstractmethod
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None):
+        """값 저장 (ttl 초가 지나면 만료, None이면 만료 없음)"""
+
+    @abc.abstractmethod
+    def delete(self, namespace: str, key: str):
+        """값 삭제 (없으면 무시)"""
+
+    def close(self):
+        pass
+
+
+class MemoryStateStore(StateStore):
+    """프로세스 내부 저장소 (값은 복사하지 않으므로 저장 후 변경하지 않음)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items: Dict[Tuple[str, str], Tuple[Any, Optional[float]]] = {}
+        self._writes = 0
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._items.get((namespace, key))
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at is not None and expires_at <= time.time():
+                del self._items[(namespace, key)]
+                return None
+            return value
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None):
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._items[(namespace, key)] = (value, expires_at)
+            self._writes += 1
+            if self._writes % _PURGE_EVERY == 0:
+                now = time.time()
+                for item_key in [k for k, (_, exp) in self._items.items() if exp is not None and exp <= now]:
+                    del self._items[item_key]
+
+    def delete(self, namespace: str, key: str):
+        with self._lock:
+            self._items.pop((namespace, key), None)
+
+
+class SQLiteStateStore(StateStore):
+    """SQLite 파일 저장소 (WAL, 값은 JSON) - 같은 호스트의 여러 프로세스가 같은 파일을 열어 공유
+
+    WAL은 호스트의 공유 메모리로 잠금을 조정하므로 NFS/SMB 등 네트워크 볼륨에서 여러 호스트가 열면 손상될 수 있음
+    (여러 호스트의 레플리카는 StateStore를 구현한 네트워크 저장소 사용)
+    """
+
+    shared = True
+
+    def __init__(self, path: str, busy_timeout: float = 5.0):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=busy_timeout, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS state ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, expires_at REAL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+        self._writes = 0
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM state WHERE namespace = ? AND key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, key, time.time()),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None):
+        payload = json.dumps(value, ensure_ascii=False)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO state (namespace, key, value, expires_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(namespace, key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at",
+                (namespace, key, payload, now + ttl if ttl is not None else None),
+            )
+            self._writes += 1
+            if self._writes % _PURGE_EVERY == 0:
+                self._conn.execute("DELETE FROM state WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+
+    def delete(self, namespace: str, key: str):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM state WHERE namespace = ? AND key = ?", (namespace, key))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def open_state_store(path: Optional[str] = None) -> StateStore:
+    """경로가 있으면 SQLite 공유 저장소, 없으면 프로세스 내부 저장소"""
+    return SQLiteStateStore(path) if path else MemoryStateStore()
@@ -0,0 +1,50 @@
+"""
+테스트 공통 설정
+앱 모듈(저장소 루트)과 백엔드 스텁(dev/)을 import 경로에 추가하고, 스텁 서버를 띄우는 fixture 제공
+"""
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT), str(ROOT / "dev")]
+
+import mock_backend  # noqa: E402
+from backend_client import BackendClient  # noqa: E402
+
+
+@pytest.fixture
+def start_backend():
+    """스텁 서버 시작 함수 (옵션은 dev/mock_backend.py 명령행 옵션과 같음, 빈 포트 사용), 테스트가 끝나면 종료"""
+    servers = []
+
+    def start(**options):
+        options.setdefault("files", 0)
+        options.setdefault("event_delay", 0.0)
+        server = mock_backend.make_server(port=0, **options)
+        server.url = f"http://127.0.0.1:{server.server_address[1]}"
+        threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def make_client():
+    """스텁 서버에 연결하는 BackendClient 생성 함수 (테스트가 끝나면 세션 정리)"""
+    clients = []
+
+    def make(server, **options) -> BackendClient:
+        client = BackendClient(server.url, **options)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
@@ -0,0 +1,31 @@
+"""정적 자원 (assets) - 폰트 자체 호스팅 여부와 CSS 블록의 메시지 캐시 대상 여부"""
+import tomllib
+from pathlib import Path
+
+import assets
+
+CONFIG = Path(__file__).resolve().parent.parent / ".streamlit" / "config.toml"
+
+
+def test_style_block_is_cached_by_the_browser():
+    config = tomllib.loads(CONFIG.read_text(encoding="utf-8"))
+    # 재실행마다 보내는 CSS 요소가 메시지 캐시 최소 크기 이상이어야 해시만 전송됨
+    assert len(assets.style_html().encode("utf-8")) >= config["global"]["minCachedMessageSize"]
+
+
+def test_fonts_are_self_hosted_only_when_all_files_exist(tmp_path, monkeypatch):
+    monkeypatch.setattr(assets, "STATIC_DIR", tmp_path)
+    monkeypatch.setattr(assets, "static_serving_enabled", lambda: True)
+    font_dir = tmp_path / "fonts"
+    font_dir.mkdir()
+    for name, _ in assets.FONT_FILES[:-1]:
+        (font_dir / name).write_bytes(b"")
+    assert assets.font_css() == assets.GOOGLE_FONTS_IMPORT
+
+    (font_dir / assets.FONT_FILES[-1][0]).write_bytes(b"")
+    css = assets.font_css()
+    assert "googleapis" not in css and css.count("@font-face") == len(assets.FONT_FILES)
+    assert f"url('{assets.STATIC_URL}/fonts/NanumMyeongjo-Bold.ttf')" in css
+
+    monkeypatch.setattr(assets, "static_serving_enabled", lambda: False)
+    assert assets.font_css() == assets.GOOGLE_FONTS_IMPORT
@@ -0,0 +1,167 @@
+"""일괄 생성 스케줄러 (JobRegistry.submit_batch) - 스텁 백엔드의 SSE 스트림 기준"""
+import json
+import time
+
+import pytest
+
+from jobs import JOB_CANCELLED, JOB_COMPLETE, JOB_ERROR, JOB_RUNNING, JobRegistry, expand_batch_grid
+
+QUESTIONS = [{"question_number": 1, "question_type": "내용일치형"}]
+
+
+def grid(count):
+    return expand_batch_grid([("인문", f"세부 분야 {i}") for i in range(count)], [None], "단일 지문", QUESTIONS)
+
+
+def wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            pytest.fail("시간 초과")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def make_registry(make_client):
+    def make(server, **options) -> JobRegistry:
+        return JobRegistry(make_client(server), **options)
+    return make
+
+
+def test_expand_batch_grid_builds_every_combination():
+    inputs = expand_batch_grid([("인문", "철학"), ("사회", "법")], ["a", "b", "c"], "단일 지문", QUESTIONS)
+
+    assert [(i["subfield_input"], i["points_input"]) for i in inputs] == [
+        ("철학", "a"), ("철학", "b"), ("철학", "c"), ("법", "a"), ("법", "b"), ("법", "c"),
+    ]
+    inputs[0]["questions_input"][0]["question_type"] = "보기형"
+    assert inputs[1]["questions_input"][0]["question_type"] == "내용일치형"  # 문항 설정은 조합마다 복사
+    assert len(expand_batch_grid([("인문", "철학")], [], "단일 지문", QUESTIONS)) == 1
+
+
+def test_batch_runs_at_most_concurrency_jobs_at_once(start_backend, make_registry):
+    server = start_backend(event_delay=0.02)
+    registry = make_registry(server, max_workers=8)
+    batch_id = registry.submit_batch(grid(7), concurrency=2)
+
+    peak = 0
+    while not registry.batch_summary(batch_id).is_done:
+        peak = max(peak, registry.batch_summary(batch_id).counts[JOB_RUNNING])
+        time.sleep(0.005)
+
+    summary = registry.batch_summary(batch_id)
+    assert peak == 2
+    assert summary.counts[JOB_COMPLETE] == 7
+    assert len({job.filename for job in summary.jobs}) == 7
+    assert summary.eta == 0.0 and summary.throughput > 0
+    assert server.requests["POST /api/generate/stream"] == 7
+
+
+def test_failed_jobs_do_not_stall_the_batch(start_backend, make_registry, tmp_path):
+    recording = tmp_path / "error.jsonl"
+    recording.write_text(json.dumps({"t": 0, "event": {"type": "error", "message": "생성 실패"}}) + "\n")
+    server = start_backend(replay=str(recording))
+    registry = make_registry(server)
+    batch_id = registry.submit_batch(grid(4), concurrency=1)
+
+    wait_for(lambda: registry.batch_summary(batch_id).is_done)
+    summary = registry.batch_summary(batch_id)
+    assert summary.counts[JOB_ERROR] == 4
+    assert all(job.error == "생성 실패" for job in summary.jobs)
+
+
+def test_cancel_batch_stops_running_and_pending_jobs(start_backend, make_registry):
+    server = start_backend(event_delay=0.2)
+    registry = make_registry(server)
+    batch_id = registry.submit_batch(grid(5), concurrency=2)
+    wait_for(lambda: registry.batch_summary(batch_id).counts[JOB_RUNNING] == 2)
+
+    registry.cancel_batch(batch_id)
+    wait_for(lambda: registry.batch_summary(batch_id).is_done)
+    summary = registry.batch_summary(batch_id)
+    assert summary.counts[JOB_CANCELLED] == 5
+    assert summary.eta == 0.0
+    assert server.requests["POST /api/generate/stream"] == 2  # 대기 중이던 작업은 스트림을 열지 않음
+
+
+def test_cancelling_a_queued_job_keeps_the_rest_of_the_batch(start_backend, make_registry):
+    server = start_backend(event_delay=0.01)
+    registry = make_registry(server)
+    batch_id = registry.submit_batch(grid(4), concurrency=1)
+    job_ids = [job.job_id for job in registry.batch_summary(batch_id).jobs]
+
+    registry.cancel(job_ids[2])
+    assert registry.get(job_ids[2]).status == JOB_CANCELLED
+    wait_for(lambda: registry.batch_summary(batch_id).is_done)
+    assert [job.status for job in registry.batch_summary(batch_id).jobs] == [
+        JOB_COMPLETE, JOB_COMPLETE, JOB_CANCELLED, JOB_COMPLETE,
+    ]
+
+
+def test_new_session_reattaches_to_batch_by_id(start_backend, make_registry):
+    # 새로고침한 세션은 URL의 묶음 ID만으로 같은 묶음의 진행 상황을 다시 조회
+    server = start_backend(event_delay=0.01)
+    registry = make_registry(server)
+    batch_id = registry.submit_batch(grid(3), concurrency=3)
+
+    assert registry.has_batch(batch_id)
+    assert not registry.has_batch("unknown") and registry.batch_summary("unknown") is None
+    wait_for(lambda: registry.batch_summary(batch_id).is_done)
+    summary = registry.batch_summary(batch_id)
+    assert summary.batch_id == batch_id and summary.total == 3
+    assert all(registry.get(job.job_id).result is not None for job in summary.jobs)
+
+
+def test_batch_reuses_inflight_job_with_same_settings(start_backend, make_registry):
+    server = start_backend(event_delay=0.02)
+    registry = make_registry(server)
+    inputs = grid(2)
+    job_id = registry.submit(inputs[0])
+
+    batch_id = registry.submit_batch(inputs + [inputs[1]], concurrency=2)
+    summary = registry.batch_summary(batch_id)
+    assert [job.job_id for job in summary.jobs][0] == job_id  # submit()과 같은 진행 중 작업을 묶음에 포함
+    assert summary.total == 2  # 묶음 안의 같은 설정도 작업 하나
+
+    registry.cancel_batch(batch_id)
+    wait_for(lambda: registry.get(job_id).is_done)
+    assert registry.get(job_id).status == JOB_COMPLETE  # 묶음 취소는 다른 세션의 작업을 취소하지 않음
+    assert registry.batch_summary(batch_id).counts[JOB_CANCELLED] == 1
+    assert server.requests["POST /api/generate/stream"] == 2
+
+
+def test_cancel_keeps_generation_shared_by_another_job(start_backend, make_registry):
+    # 상태 저장소 없이 두 레플리카가 같은 설정으로 생성 - 백엔드는 두 작업을 같은 실행에 연결
+    server = start_backend(event_delay=0.05)
+    first, second = make_registry(server), make_registry(server)
+    first_id = first.submit(grid(1)[0])
+    wait_for(lambda: server.runs.by_key)
+    second_id = second.submit(grid(1)[0])
+    wait_for(lambda: second.get(second_id).status == JOB_RUNNING)
+    run = next(iter(server.runs.by_key.values()))
+    wait_for(lambda: len(run.jobs) == 2)
+
+    first.cancel(first_id)
+    wait_for(lambda: server.requests["POST /api/generate/cancel"] == 1)
+    wait_for(lambda: second.get(second_id).is_done)
+    assert first.get(first_id).status == JOB_CANCELLED
+    assert second.get(second_id).status == JOB_COMPLETE
+    assert not run.cancelled and run.jobs == {second_id}
+
+
+def test_batch_of_reused_jobs_is_kept_while_they_run(start_backend, make_registry):
+    server = start_backend(event_delay=0.05)
+    registry = make_registry(server, retention=0.1)
+    inputs = grid(2)
+    job_id = registry.submit(inputs[0])
+    batch_id = registry.submit_batch(inputs[:1])  # 진행 중인 작업만으로 이루어진 묶음
+
+    time.sleep(0.2)
+    registry.submit(inputs[1])  # 등록할 때 보관 기간이 지난 작업/묶음 정리
+    assert registry.has_batch(batch_id)
+    assert [job.job_id for job in registry.batch_summary(batch_id).jobs] == [job_id]
+
+    wait_for(lambda: registry.get(job_id).is_done)
+    time.sleep(0.2)
+    registry.submit(grid(3)[2])
+    assert not registry.has_batch(batch_id)
@@ -0,0 +1,85 @@
+"""저장된 결과 일괄 작업 (BulkRegistry) - 항목별 결과와 종료 후처리(on_finish) 순서"""
+import threading
+import time
+
+import pytest
+
+from bulk import BULK_DELETE, SKIPPED, BulkRegistry
+from jobs import JOB_CANCELLED, JOB_COMPLETE, JOB_ERROR
+
+
+def wait_done(registry, job_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not registry.get(job_id).is_done:
+        if time.monotonic() > deadline:
+            pytest.fail("시간 초과")
+        time.sleep(0.005)
+    return registry.get(job_id)
+
+
+def test_on_finish_runs_once_before_job_is_done():
+    calls = []
+    release = threading.Event()
+
+    def on_finish(job):
+        calls.append((job.is_done, list(job.succeeded)))
+        release.wait(5)  # 후처리 중에는 화면이 완료를 보면 안 됨
+
+    registry = BulkRegistry({BULK_DELETE: lambda filename, params: None}, on_finish=on_finish, max_workers=4)
+    job_id = registry.submit(BULK_DELETE, [f"{i}.json" for i in range(8)])
+
+    deadline = time.monotonic() + 5
+    while not calls and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert not registry.get(job_id).is_done
+    release.set()
+
+    job = wait_done(registry, job_id)
+    assert job.status == JOB_COMPLETE
+    assert calls == [(False, [f"{i}.json" for i in range(8)])]
+
+
+def test_poller_never_sees_done_before_on_finish():
+    invalidated = threading.Event()
+    registry = BulkRegistry(
+        {BULK_DELETE: lambda filename, params: time.sleep(0.001)},
+        on_finish=lambda job: (time.sleep(0.02), invalidated.set()),
+    )
+    job_id = registry.submit(BULK_DELETE, [f"{i}.json" for i in range(20)])
+
+    while not registry.get(job_id).is_done:
+        time.sleep(0.001)
+    assert invalidated.is_set()
+
+
+def test_item_results_and_final_status():
+    def delete(filename, params):
+        if filename.startswith("bad"):
+            raise RuntimeError("삭제 실패")
+
+    registry = BulkRegistry({BULK_DELETE: delete})
+    job = wait_done(registry, registry.submit(BULK_DELETE, ["a.json", "bad.json", "a.json"]))
+    assert job.status == JOB_COMPLETE and job.total == 2  # 같은 파일은 한 번만 처리
+    assert job.succeeded == ["a.json"] and job.failed == {"bad.json": "삭제 실패"}
+
+    job = wait_done(registry, registry.submit(BULK_DELETE, ["bad1.json", "bad2.json"]))
+    assert job.status == JOB_ERROR
+
+
+def test_cancel_skips_items_not_yet_started():
+    started = threading.Event()
+    release = threading.Event()
+
+    def delete(filename, params):
+        started.set()
+        release.wait(5)
+
+    registry = BulkRegistry({BULK_DELETE: delete}, max_workers=1)
+    job_id = registry.submit(BULK_DELETE, ["a.json", "b.json", "c.json"])
+    started.wait(5)
+    registry.cancel(job_id)
+    release.set()
+
+    job = wait_done(registry, job_id)
+    assert job.status == JOB_CANCELLED
+    assert job.results == {"a.json": None, "b.json": SKIPPED, "c.json": SKIPPED}
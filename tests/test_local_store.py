@@ -0,0 +1,93 @@
+"""로컬 결과 저장소 (LocalStore, StoreSync) - 지문 필드 변형 색인과 백엔드 동기화"""
+import pytest
+
+from local_store import LocalStore, StoreSync
+from result_model import GenerationResult, passage_text
+
+PASSAGE = "플라톤은 감각 세계 너머에 변하지 않는 이데아가 있다고 보았다. 우리가 보는 사물은 이데아의 그림자에 불과하다."
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = LocalStore(str(tmp_path / "outputs.db"))
+    yield store
+    store.close()
+
+
+def document(passage):
+    return {"card": {"subject": "이데아론"}, "passage": passage, "questions": []}
+
+
+def add(store, filename, passage):
+    store.upsert_meta([{"filename": filename, "생성일자": "2025-01-01 12:00", "주제": "이데아론", "문항 수": 0}])
+    store.put_document(filename, document(passage))
+
+
+@pytest.mark.parametrize("passage, expected", [
+    (PASSAGE, PASSAGE),
+    ({"passage": PASSAGE}, PASSAGE),
+    ({"content": PASSAGE}, PASSAGE),
+    ({"passage_text": PASSAGE, "content": "무시"}, "무시"),  # 앞쪽 필드 우선
+    (None, ""),
+    (["목록"], ""),
+    ({"passage": {"중첩": "객체"}}, ""),
+])
+def test_passage_text_accepts_strings_and_objects(passage, expected):
+    assert passage_text(passage) == expected
+
+
+def test_passage_text_matches_generation_result():
+    for passage in (PASSAGE, {"content": PASSAGE}, {"passage": 42}):
+        data = {"card": {}, "passage": passage, "questions": []}
+        assert GenerationResult.from_dict(data).passage == passage_text(passage)
+
+
+def test_string_passage_is_indexed_and_searchable(store):
+    add(store, "string.json", PASSAGE)
+    add(store, "object.json", {"content": PASSAGE})
+
+    assert {hit["filename"] for hit in store.search("이데아")} == {"string.json", "object.json"}
+    hits = store.similar_passages(document(PASSAGE), exclude="string.json")
+    assert [hit["filename"] for hit in hits] == ["object.json"]
+    assert store.index_pending() == 0
+
+
+def test_sync_pulls_documents_with_string_passage(start_backend, make_client, store):
+    server = start_backend(files=3)
+    filename = sorted(server.store.files)[1]
+    server.store.files[filename]["result"]["passage"] = PASSAGE
+
+    sync = StoreSync(make_client(server), store)
+    stats = sync.sync_once()
+    assert stats["pulled"] == 3 and store.missing_documents(10) == []
+    assert [hit["filename"] for hit in store.search("그림자")] == [filename]
+
+
+def test_null_and_numeric_question_fields_are_indexed(store):
+    questions = [
+        {"question": None, "choices_1": 1945, "choices_2": "광복", "explanation_1": None},
+        {"question": {"잘못된": "값"}, "explanation_2": 3.5},
+        "문항이 아닌 값",
+    ]
+    store.upsert_meta([{"filename": "a.json", "생성일자": "2025-01-01 12:00", "주제": "광복", "문항 수": 2}])
+    store.put_document("a.json", dict(document(PASSAGE), questions=questions))
+
+    assert [hit["filename"] for hit in store.search("1945")] == ["a.json"]
+    assert [hit["field"] for hit in store.search("광복")] == ["questions"]
+
+
+def test_sync_skips_documents_that_cannot_be_stored(start_backend, make_client, store):
+    server = start_backend(files=3)
+    bad = sorted(server.store.files)[-1]  # 최신 파일 (가장 먼저 받음)
+    server.store.files[bad]["result"] = ["객체가 아닌 결과 문서"]
+
+    sync = StoreSync(make_client(server), store)
+    stats = sync.sync_once()
+    assert stats["pulled"] == 2 and stats["failed"] == 1
+    assert list(sync.failed) == [bad] and sync.last_error is None
+    assert store.missing_documents(10) == [bad]
+
+    # 목록이 그대로면 실패한 파일은 다시 받지 않음
+    assert server.requests["GET /api/outputs/{filename}"] == 3
+    assert sync.sync_once()["failed"] == 0
+    assert server.requests["GET /api/outputs/{filename}"] == 3
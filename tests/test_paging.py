@@ -0,0 +1,90 @@
+"""저장된 결과 목록 페이지 조회 (list_outputs_page) 규약 - 스텁 백엔드 기준"""
+import pytest
+
+from backend_client import match_filters, paginate_locally
+
+FILTER_CASES = [
+    {},
+    {"field": "법"},
+    {"subject": "이데아"},
+    {"date_from": "2025-03-01", "date_to": "2025-06-30"},
+    {"field": "경제", "date_from": "2025-05-01"},
+    {"subject": "없는 주제"},
+]
+
+
+def fetch_all_pages(client, limit, filters=None):
+    pages, offset = [], 0
+    while True:
+        page, _ = client.list_outputs_page(offset, limit, filters)
+        pages.append(page)
+        offset += limit
+        if offset >= page["total"]:
+            return pages
+
+
+def test_pages_cover_every_file_once_newest_first(start_backend, make_client):
+    server = start_backend(files=25)
+    pages = fetch_all_pages(make_client(server), limit=10)
+
+    assert [len(page["files"]) for page in pages] == [10, 10, 5]
+    assert all(page["total"] == 25 for page in pages)
+    assert [page["offset"] for page in pages] == [0, 10, 20]
+    files = [meta for page in pages for meta in page["files"]]
+    assert sorted(meta["filename"] for meta in files) == sorted(server.store.files)
+    created = [meta["생성일자"] for meta in files]
+    assert created == sorted(created, reverse=True)
+
+
+@pytest.mark.parametrize("filters", FILTER_CASES)
+def test_server_filters_match_client_filter_rules(start_backend, make_client, filters):
+    server = start_backend(files=40)
+    page, _ = make_client(server).list_outputs_page(0, 100, filters)
+
+    expected = {entry["meta"]["filename"] for entry in server.store.files.values() if match_filters(entry["meta"], filters)}
+    assert {meta["filename"] for meta in page["files"]} == expected
+    assert page["total"] == len(expected)
+
+
+def test_empty_filter_values_are_not_sent(start_backend, make_client):
+    server = start_backend(files=5)
+    page, _ = make_client(server).list_outputs_page(0, 10, {"field": "", "subject": None})
+    assert page["total"] == 5
+
+
+def test_unchanged_page_revalidates_with_etag(start_backend, make_client):
+    server = start_backend(files=5)
+    client = make_client(server)
+    page, etag = client.list_outputs_page(0, 10)
+    assert page is not None and etag
+
+    assert client.list_outputs_page(0, 10, etag=etag) == (None, etag)
+    assert server.requests["GET /api/outputs (304)"] == 1
+
+    server.store.delete(page["files"][0]["filename"])
+    changed, new_etag = client.list_outputs_page(0, 10, etag=etag)
+    assert changed["total"] == 4 and new_etag != etag
+
+
+@pytest.mark.parametrize("filters", FILTER_CASES)
+def test_legacy_backend_is_paginated_locally(start_backend, make_client, filters):
+    # 스텁 저장소는 같은 개수면 같은 내용으로 만들어지므로 두 서버의 페이지를 그대로 비교
+    paged = make_client(start_backend(files=30))
+    legacy = make_client(start_backend(files=30, legacy=True))
+
+    for offset in (0, 7, 28, 40):
+        expected, _ = paged.list_outputs_page(offset, 7, filters)
+        actual, _ = legacy.list_outputs_page(offset, 7, filters)
+        assert actual == expected
+
+
+def test_paginate_locally_slices_after_filtering():
+    files = [{"filename": f"f{i}", "대분야": "법" if i % 2 else "경제", "주제": "주제", "생성일자": "2025-01-01 12:00"}
+             for i in range(9)]
+
+    page = paginate_locally(files, 2, 2, {"field": "법"})
+    assert [meta["filename"] for meta in page["files"]] == ["f5", "f7"]
+    assert (page["total"], page["offset"], page["limit"]) == (4, 2, 2)
+
+    assert paginate_locally(files, 20, 5)["files"] == []
+    assert paginate_locally([], 0, 5) == {"files": [], "total": 0, "offset": 0, "limit": 5}
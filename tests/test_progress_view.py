@@ -0,0 +1,48 @@
+"""진행 현황 뷰 (ProgressView) - 작업 revision 기준 갱신과 바뀐 행만 다시 계산"""
+from progress_state import ProgressState
+from progress_view import ProgressView
+
+
+def test_only_changed_rows_are_recomputed():
+    state = ProgressState(2)
+    view = ProgressView(len(state))
+    assert view.update(state, 0) == [0, 1, 2, 3]
+
+    state.apply_event({"step": "card", "status": "start"}, now=0.0)
+    assert view.update(state, 1) == [0]
+
+    # 이전 태스크 완료와 다음 태스크 시작이 한 프레임에 들어오면 두 행만
+    state.apply_event({"step": "passage", "status": "start"}, now=2.0)
+    state.apply_event({"step": "question", "question_number": 2, "status": "start"}, now=5.0)
+    assert view.update(state, 3) == [0, 1, 3]
+
+
+def test_unchanged_revision_is_skipped():
+    state = ProgressState(1)
+    view = ProgressView(len(state))
+    view.update(state, 0)
+
+    state.apply_event({"step": "card", "status": "start"}, now=0.0)
+    assert view.update(state, 0) == []  # 같은 revision이면 상태를 다시 보지 않음
+    assert view.update(state, 1) == [0]
+    assert view.update(state, 1) == []
+
+
+def test_panel_html_is_rebuilt_only_when_something_changed():
+    state = ProgressState(1)
+    view = ProgressView(len(state))
+    view.update(state, 0)
+    html = view.html
+    assert "전체 진행률: 0/3" in html and html.count("대기") == 3
+
+    state.apply_event({"step": "card", "status": "start"}, now=0.0)
+    view.update(state, 1)
+    assert view.html != html and "진행중" in view.html
+    html = view.html
+
+    view.update(state, 2)  # revision만 바뀌고 표시할 내용은 그대로
+    assert view.html is html
+
+    state.apply_event({"step": "passage", "status": "start"}, now=2.0)
+    view.update(state, 3)
+    assert "전체 진행률: 1/3" in view.html and "2초" in view.html
@@ -0,0 +1,121 @@
+"""녹화한 생성 스트림 재생 - 녹화 → 스텁 재생, 부분 결과(카드, 지문, 완성된 문항) 반영"""
+import json
+import time
+
+import pytest
+
+from jobs import JOB_COMPLETE, JOB_RUNNING, JobRegistry
+from partial_result import PartialResult
+from record_stream import DEFAULT_USER_INPUT, record
+from rendering import build_partial_content_html
+
+
+def write_recording(path, events, interval=0.0):
+    path.write_text("".join(
+        json.dumps({"t": i * interval, "event": event}, ensure_ascii=False) + "\n" for i, event in enumerate(events)
+    ), encoding="utf-8")
+    return str(path)
+
+
+def apply(partial, event):
+    """작업 레지스트리와 같은 규칙으로 부분 결과 반영 (단계 완료 progress 이벤트와 partial 이벤트)"""
+    if event.get("type") == "partial" or (event.get("type") == "progress" and event.get("status") == "complete"):
+        partial.apply_event(event)
+
+
+def question(number, answer="③"):
+    return {
+        "question_number": number, "question_type": "내용일치형", "question": f"{number}번 발문", "answer": answer,
+        **{f"choices_{i}": f"{number}-{i}" for i in range(1, 6)},
+    }
+
+
+@pytest.fixture
+def recorded(start_backend, make_client, tmp_path):
+    """스텁의 생성 스트림을 녹화한 파일과 이벤트 목록"""
+    out = tmp_path / "run.jsonl"
+    count = record(make_client(start_backend(event_delay=0.005)), DEFAULT_USER_INPUT, out)
+    events = [json.loads(line)["event"] for line in out.read_text(encoding="utf-8").splitlines()]
+    assert len(events) == count
+    return out, events
+
+
+def test_replay_sends_the_recorded_events(start_backend, make_client, recorded):
+    out, events = recorded
+    replayed = list(make_client(start_backend(replay=str(out), replay_speed=100)).generate_events(DEFAULT_USER_INPUT))
+
+    assert [(e["type"], e.get("step"), e.get("status")) for e in replayed] == \
+        [(e["type"], e.get("step"), e.get("status")) for e in events]
+    assert replayed[-1]["result"] == events[-1]["result"]
+
+
+def test_partial_result_fills_in_as_steps_complete(recorded):
+    _, events = recorded
+    partial = PartialResult()
+    arrivals = []
+    for event in events:
+        apply(partial, event)
+        arrivals.append((partial.subject, partial.passage is not None, tuple(partial.questions)))
+
+    assert arrivals[0] == (None, False, ())
+    # 카드 → 지문 → 보기형(3번) 문항 → 나머지 문항 순으로 도착
+    assert [arrival for i, arrival in enumerate(arrivals) if i == 0 or arrival != arrivals[i - 1]][1:] == [
+        ("플라톤의 이데아론", False, ()),
+        ("플라톤의 이데아론", True, ()),
+        ("플라톤의 이데아론", True, (3,)),
+        ("플라톤의 이데아론", True, (3, 1)),
+        ("플라톤의 이데아론", True, (3, 1, 2)),
+    ]
+    assert [q.number for q in partial.sorted_questions()] == [1, 2, 3]
+
+
+def test_out_of_order_and_malformed_payloads_are_tolerated():
+    partial = PartialResult()
+    for event in [
+        {"type": "progress", "step": "question", "question_number": 2, "status": "complete", "data": question(2)},
+        {"type": "progress", "step": "card", "status": "start"},
+        {"type": "partial", "step": "card", "data": {"subject": "계약의 해제"}},
+        {"type": "progress", "step": "question", "question_number": 4, "status": "complete", "data": question(4, "⑥")},
+        {"type": "progress", "step": "review", "status": "complete", "data": {"note": "알 수 없는 단계"}},
+        {"type": "partial", "step": "passage", "data": "객체가 아닌 payload"},
+    ]:
+        apply(partial, event)
+
+    assert partial.subject == "계약의 해제"
+    assert list(partial.questions) == [2]  # 정답이 잘못된 4번 문항은 무시
+    assert partial.revision == 2
+
+    html = build_partial_content_html(partial, 3)
+    assert "지문 생성 중" in html
+    assert "1. 문항 생성 중" in html and "3. 문항 생성 중" in html
+    assert "2번 발문" in html
+
+
+def test_job_shows_partial_results_before_completion(start_backend, make_client, tmp_path):
+    events = [
+        {"type": "progress", "step": "card", "status": "start"},
+        {"type": "progress", "step": "card", "status": "complete", "data": {"subject": "통화 정책"}},
+        {"type": "progress", "step": "passage", "status": "start"},
+        {"type": "progress", "step": "passage", "status": "complete", "data": {"passage": "지문 본문"}},
+        {"type": "progress", "step": "question", "question_number": 1, "status": "start"},
+        {"type": "progress", "step": "question", "question_number": 1, "status": "complete", "data": question(1)},
+        {"type": "complete", "result": {
+            "card": {"subject": "통화 정책"}, "passage": {"passage": "지문 본문"}, "questions": [question(1)],
+        }},
+    ]
+    server = start_backend(replay=write_recording(tmp_path / "run.jsonl", events, interval=0.05))
+    registry = JobRegistry(make_client(server))
+    job_id = registry.submit({"questions_input": [{"question_number": 1}]})
+
+    seen = []
+    deadline = time.monotonic() + 10
+    while not registry.get(job_id).is_done and time.monotonic() < deadline:
+        job = registry.snapshot(job_id)
+        if job.status == JOB_RUNNING:
+            seen.append((job.partial.subject, job.partial.passage is not None, tuple(job.partial.questions)))
+        time.sleep(0.005)
+
+    job = registry.snapshot(job_id)
+    assert job.status == JOB_COMPLETE and job.result.subject == "통화 정책"
+    assert ("통화 정책", False, ()) in seen
+    assert ("통화 정책", True, ()) in seen
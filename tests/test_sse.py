@@ -0,0 +1,157 @@
+"""SSE 디코더 (SSEDecoder)와 Last-Event-ID 재연결 (BackendClient.generate_events)"""
+import threading
+import time
+
+import pytest
+
+import backend_client
+from sse import SSEDecoder
+
+
+def feed_all(decoder, chunks):
+    return [event for chunk in chunks for event in decoder.feed(chunk)]
+
+
+def split_every_byte(data: bytes):
+    return [data[i:i + 1] for i in range(len(data))]
+
+
+def test_bom_split_across_chunks_is_stripped():
+    decoder = SSEDecoder()
+    events = feed_all(decoder, [b"\xef", b"\xbb", b"\xbfdata: a\n\n"])
+
+    assert [(e.event, e.data) for e in events] == [("message", "a")]
+
+
+def test_bom_is_stripped_only_at_stream_start():
+    decoder = SSEDecoder()
+    events = feed_all(decoder, [b"data: a\n\n", b"\xef\xbb\xbfdata: b\n\n"])
+
+    assert [e.data for e in events] == ["a"]  # 스트림 중간의 BOM은 필드 이름 일부이므로 무시되는 줄
+
+
+@pytest.mark.parametrize("newline", [b"\n", b"\r", b"\r\n"])
+def test_line_endings_split_across_chunks(newline):
+    data = b"event: progress" + newline + b"data: 1" + newline + newline + b"data: 2" + newline + newline
+    decoder = SSEDecoder()
+
+    events = feed_all(decoder, split_every_byte(data))
+    assert [(e.event, e.data) for e in events] == [("progress", "1"), ("message", "2")]
+
+
+def test_crlf_split_between_chunks_is_one_line_end():
+    decoder = SSEDecoder()
+    assert decoder.feed(b"data: a\r") == []
+    assert decoder.feed(b"\ndata: b\r") == []  # 앞 청크 끝 CR과 이어진 LF는 빈 줄이 아님
+    events = decoder.feed(b"\r")
+
+    assert [e.data for e in events] == ["a\nb"]
+
+
+def test_cr_only_event_is_dispatched_without_waiting_for_next_chunk():
+    decoder = SSEDecoder()
+    events = decoder.feed(b"data: a\r\r")
+
+    assert [e.data for e in events] == ["a"]
+
+
+def test_multi_line_data_is_joined_with_newlines():
+    decoder = SSEDecoder()
+    events = decoder.feed(b"data: first\ndata:second\ndata\ndata:  indented\n\n")
+
+    assert [e.data for e in events] == ["first\nsecond\n\n indented"]
+
+
+def test_comments_are_counted_and_not_dispatched():
+    decoder = SSEDecoder()
+    events = decoder.feed(b": ping\n\n:\n\ndata: a\n: in between\n\n")
+
+    assert [e.data for e in events] == ["a"]
+    assert decoder.comments == 3
+
+
+def test_id_and_retry_fields():
+    decoder = SSEDecoder()
+    events = decoder.feed(b"id: run:1\nretry: 2500\ndata: a\n\ndata: b\n\n")
+    assert [(e.id, e.data) for e in events] == [("run:1", "a"), ("run:1", "b")]  # id는 다음 이벤트에도 유지
+    assert decoder.last_event_id == "run:1" and decoder.retry == 2500
+
+    decoder.feed(b"id: bad\0id\nretry: 1.5\nretry: -1\ndata: c\n\n")
+    assert decoder.last_event_id == "run:1" and decoder.retry == 2500  # NUL이 든 id, 숫자가 아닌 retry는 무시
+
+
+def test_event_without_data_is_not_dispatched():
+    decoder = SSEDecoder()
+    events = decoder.feed(b"event: progress\n\ndata: a\n\n")
+
+    assert [(e.event, e.data) for e in events] == [("message", "a")]  # 빈 이벤트는 event 이름만 초기화
+
+
+def test_reset_connection_drops_partial_event_and_keeps_last_event_id():
+    decoder = SSEDecoder()
+    decoder.feed(b"id: run:4\nretry: 100\ndata: a\n\nevent: progress\ndata: cut")
+    decoder.reset_connection()
+    events = decoder.feed(b"\xef\xbb\xbfdata: b\n\n")
+
+    assert [(e.event, e.data, e.id) for e in events] == [("message", "b", "run:4")]
+    assert decoder.retry == 100
+
+
+def test_id_of_cut_event_is_not_used_for_resume():
+    decoder = SSEDecoder()
+    decoder.feed(b"id: run:1\ndata: {}\n\n")
+    decoder.feed(b'id: run:2\ndata: {"type":"complete","result":{"big')
+    assert decoder.last_event_id == "run:1"  # 디스패치 전이므로 반영하지 않음
+
+    decoder.reset_connection()
+    assert decoder.last_event_id == "run:1"
+    events = decoder.feed(b"data: resumed\n\n")
+    assert [(e.data, e.id) for e in events] == [("resumed", "run:1")]  # 끊긴 연결의 id 버퍼도 버림
+
+
+def test_id_only_block_updates_last_event_id():
+    decoder = SSEDecoder()
+    assert decoder.feed(b"id: run:7\n\n") == []
+
+    assert decoder.last_event_id == "run:7"
+
+
+def test_reconnect_resumes_from_last_event_id(start_backend, make_client, monkeypatch):
+    monkeypatch.setattr(backend_client, "STREAM_RECONNECT_DELAY", 0.01)
+    server = start_backend(drop_after=3, drops=2)
+    responses = []
+
+    events = list(make_client(server).generate_events({}, on_response=responses.append))
+    assert events[-1]["type"] == "complete"
+    assert server.requests["POST /api/generate/stream"] == 1
+    assert server.requests["POST /api/generate/stream (resume)"] == 2
+    assert len(responses) == 3
+
+    # 이어 받은 연결은 끊기 전 마지막 이벤트의 다음부터 전송하므로 중복이나 누락이 없음
+    reference = list(make_client(start_backend()).generate_events({}))
+    assert [(e["type"], e.get("step"), e.get("status")) for e in events] == \
+        [(e["type"], e.get("step"), e.get("status")) for e in reference]
+
+
+def test_reconnect_limit_counts_only_failures_without_progress(start_backend, make_client, monkeypatch):
+    monkeypatch.setattr(backend_client, "STREAM_RECONNECT_DELAY", 0.01)
+    server = start_backend(drop_after=1, drops=10)
+
+    # 연결마다 이벤트를 하나씩 받으므로 재연결 횟수 제한(2회)보다 많이 끊겨도 끝까지 받음
+    events = list(make_client(server).generate_events({}, max_reconnects=2))
+    assert events[-1]["type"] == "complete"
+    assert server.requests["POST /api/generate/stream (resume)"] == len(events) - 1
+
+
+def test_cancel_during_backoff_returns_immediately(start_backend, make_client):
+    server = start_backend(drop_after=2, drops=1)
+    stop_event = threading.Event()
+    events = make_client(server).generate_events({}, stop_event=stop_event)
+
+    assert [next(events), next(events)]
+    threading.Timer(0.1, stop_event.set).start()
+    started = time.monotonic()
+    assert list(events) == []  # 끊긴 뒤 재연결 대기(1초) 중 취소
+
+    assert time.monotonic() - started < 0.8
+    assert server.requests["POST /api/generate/stream (resume)"] == 0
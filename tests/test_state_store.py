@@ -0,0 +1,84 @@
+"""공유 상태 저장소 (StateStore)와 작업 상태 기록 (JobRegistry)"""
+import time
+from collections import Counter
+
+import pytest
+
+import jobs
+from jobs import JOB_COMPLETE, JOB_RUNNING, STATE_CANCEL, STATE_JOBS, GenerationJob, JobRegistry
+from state_store import MemoryStateStore, SQLiteStateStore, StateStore
+
+
+class CountingStore(MemoryStateStore):
+    def __init__(self):
+        super().__init__()
+        self.writes = Counter()
+
+    def set(self, namespace, key, value, ttl=None):
+        self.writes[namespace] += 1
+        super().set(namespace, key, value, ttl)
+
+
+def test_incomplete_store_cannot_be_created():
+    class NoDelete(StateStore):
+        def get(self, namespace, key):
+            return None
+
+        def set(self, namespace, key, value, ttl=None):
+            pass
+
+    with pytest.raises(TypeError):
+        NoDelete()
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    store = MemoryStateStore() if request.param == "memory" else SQLiteStateStore(str(tmp_path / "state.sqlite3"))
+    yield store
+    store.close()
+
+
+def test_values_expire_after_ttl(store):
+    store.set("jobs", "a", {"status": "running"}, ttl=0.05)
+    store.set("jobs", "b", [1, 2])
+    assert store.get("jobs", "a") == {"status": "running"}
+
+    time.sleep(0.1)
+    assert store.get("jobs", "a") is None and store.get("jobs", "b") == [1, 2]
+    store.delete("jobs", "b")
+    assert store.get("jobs", "b") is None
+
+
+def test_progress_writes_are_throttled(start_backend, make_client):
+    store = CountingStore()
+    registry = JobRegistry(make_client(start_backend(event_delay=0.01)), state=store)
+    job_id = registry.submit({"questions_input": [{"question_number": i} for i in range(1, 4)]})
+
+    deadline = time.monotonic() + 10
+    while not registry.get(job_id).is_done and time.monotonic() < deadline:
+        time.sleep(0.01)
+    job = registry.get(job_id)
+    assert job.status == JOB_COMPLETE
+    assert job.revision >= 10 and store.writes[STATE_JOBS] <= 4  # 등록, 시작, 완료 (+ 간격이 지난 진행 상태)
+
+    data = store.get(STATE_JOBS, job_id)
+    assert data["status"] == JOB_COMPLETE and data["revision"] == job.revision
+    assert data["result"] is not None and data["partial"] == {}  # 완료 후에는 부분 결과를 다시 쓰지 않음
+
+
+def test_cancel_request_from_another_replica_is_applied_once(start_backend, make_client, monkeypatch):
+    monkeypatch.setattr(jobs, "OWNER_HEARTBEAT_INTERVAL", 0.02)
+    store = MemoryStateStore()
+    registry = JobRegistry(make_client(start_backend()), state=store)
+    aborts = []
+    monkeypatch.setattr(registry, "_abort_remote", aborts.append)
+
+    # 스트림이 아직 끝나지 않은 실행 중 작업 (워커 없이 상태만 등록)
+    job = GenerationJob("job", {"questions_input": []})
+    job.status = JOB_RUNNING
+    registry._jobs[job.job_id] = job
+    store.set(STATE_CANCEL, job.job_id, True)
+
+    time.sleep(0.2)  # heartbeat 여러 번
+    assert job.cancel_event.is_set()
+    assert aborts == [job]
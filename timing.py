@@ -0,0 +1,165 @@
+"""
+생성 소요 시간 계측
+실행별 첫 이벤트 도착 시간, 단계별 소요 시간, 이벤트 간격, 전체 시간을 기록하고 p50/p95로 집계
+"""
+import csv
+import io
+import json
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from progress_state import ProgressState
+
+# 집계 지표 이름
+METRIC_FIRST_EVENT = "첫 이벤트까지"
+METRIC_TOTAL = "전체"
+METRIC_GAP = "이벤트 간격"
+STEP_METRICS = {"card": "논리 구조 설계", "passage": "지문 생성"}
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """nearest-rank 백분위수 (q: 0~100)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class RunTimer:
+    """생성 실행 하나의 시간 측정 (time.monotonic 기준)"""
+
+    def __init__(self, run_id: str, user_input: Dict[str, Any]):
+        self.run_id = run_id
+        self.user_input = user_input
+        self.started_wall = time.time()
+        self.started_at = time.monotonic()
+        self.first_event_at: Optional[float] = None
+        self.last_event_at: Optional[float] = None
+        self.gaps: List[float] = []
+        self.ended_at: Optional[float] = None
+
+    def event(self, now: Optional[float] = None):
+        """SSE 이벤트 수신 시각 기록"""
+        now = time.monotonic() if now is None else now
+        if self.first_event_at is None:
+            self.first_event_at = now
+        else:
+            self.gaps.append(now - self.last_event_at)
+        self.last_event_at = now
+
+    def finish(self, status: str, progress: ProgressState, now: Optional[float] = None) -> Dict[str, Any]:
+        """실행 종료 - 내보내기용 평면 레코드 반환"""
+        self.ended_at = time.monotonic() if now is None else now
+        questions = self.user_input.get("questions_input") or []
+        question_types = {q.get("question_number"): q.get("question_type", "") for q in questions}
+
+        record: Dict[str, Any] = {
+            "run_id": self.run_id,
+            "started_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started_wall)),
+            "status": status,
+            "field": self.user_input.get("field_input"),
+            "subfield": self.user_input.get("subfield_input"),
+            "type": self.user_input.get("type_input"),
+            "question_types": "|".join(question_types.get(i + 1, "") for i in range(len(questions))),
+            "num_questions": len(questions),
+            "first_event": self.first_event_at - self.started_at if self.first_event_at is not None else None,
+            "total": self.ended_at - self.started_at,
+            "gap_mean": sum(self.gaps) / len(self.gaps) if self.gaps else None,
+            "gap_max": max(self.gaps) if self.gaps else None,
+            "gaps": list(self.gaps),
+        }
+        durations = progress.durations()
+        for step in STEP_METRICS:
+            record[f"step_{step}"] = durations.get((step, None))
+        for number in range(1, len(questions) + 1):
+            record[f"question_{number}"] = durations.get(("question", number))
+            record[f"question_{number}_type"] = question_types.get(number, "")
+        return record
+
+
+class TimingStats:
+    """최근 실행 레코드 보관 및 집계 (프로세스 공유, 스레드 안전)"""
+
+    def __init__(self, max_runs: int = 1000):
+        self._lock = threading.Lock()
+        self._runs: deque = deque(maxlen=max_runs)
+
+    def __len__(self) -> int:
+        return len(self._runs)
+
+    def add(self, record: Dict[str, Any]):
+        with self._lock:
+            self._runs.append(record)
+
+    def records(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._runs)
+
+    def samples(self) -> Dict[str, List[float]]:
+        """지표별 측정값 (단계/전체 시간은 완료된 실행만)"""
+        samples: Dict[str, List[float]] = {METRIC_FIRST_EVENT: [], METRIC_TOTAL: [], METRIC_GAP: []}
+        for record in self.records():
+            if record["first_event"] is not None:
+                samples[METRIC_FIRST_EVENT].append(record["first_event"])
+            samples[METRIC_GAP].extend(record["gaps"])
+            if record["status"] != "complete":
+                continue
+            samples[METRIC_TOTAL].append(record["total"])
+            for step, name in STEP_METRICS.items():
+                if record.get(f"step_{step}") is not None:
+                    samples.setdefault(name, []).append(record[f"step_{step}"])
+            for number in range(1, record["num_questions"] + 1):
+                duration = record.get(f"question_{number}")
+                if duration is not None:
+                    name = f"문항: {record.get(f'question_{number}_type') or '기타'}"
+                    samples.setdefault(name, []).append(duration)
+        return samples
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """지표별 건수, p50, p95, 최대값 (초)"""
+        return [
+            {
+                "지표": name,
+                "건수": len(values),
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+                "최대": max(values),
+            }
+            for name, values in self.samples().items()
+            if values
+        ]
+
+    def histogram(self, metric: str = METRIC_TOTAL, bins: int = 10) -> List[Dict[str, Any]]:
+        """지표 분포 (구간 하한~상한 라벨, 건수)"""
+        values = self.samples().get(metric, [])
+        if not values:
+            return []
+        low, high = min(values), max(values)
+        width = (high - low) / bins or 1.0
+        counts = [0] * bins
+        for value in values:
+            counts[min(int((value - low) / width), bins - 1)] += 1
+        return [
+            {"구간": f"{low + i * width:.0f}~{low + (i + 1) * width:.0f}초", "건수": count}
+            for i, count in enumerate(counts)
+        ]
+
+    def to_csv(self) -> str:
+        """실행 레코드 CSV (이벤트 간격 목록 제외)"""
+        records = self.records()
+        columns: List[str] = []
+        for record in records:
+            columns += [key for key in record if key != "gaps" and key not in columns]
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(records)
+        return buffer.getvalue()
+
+    def to_json(self) -> str:
+        """실행 레코드 + 집계 JSON"""
+        return json.dumps({"summary": self.summary(), "runs": self.records()}, ensure_ascii=False, indent=2)